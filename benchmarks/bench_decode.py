@@ -0,0 +1,56 @@
+"""
+Benchmarks for decoding a matches response into models: requests'
+Response.json() against each installed soccer.decoding backend
+"""
+import json
+
+import pytest
+import requests
+
+from payloads import SIZES, matches_payload
+from soccer.decoding import BACKENDS, load_backend
+from soccer.models import parse_matches
+
+
+def installed(name):
+    try:
+        load_backend(name)
+    except ImportError:
+        return False
+    return True
+
+
+@pytest.fixture(scope='module')
+def bodies():
+    return dict((size, json.dumps(matches_payload(size)).encode('utf-8')) for size in SIZES)
+
+
+def response(body):
+    """A requests response holding body, as the API would return it"""
+    res = requests.Response()
+    res.status_code = 200
+    res._content = body
+    return res
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_response_json(measure, bodies, size):
+    res = response(bodies[size])
+
+    def parse():
+        res.encoding = None  # guessed again on each call, like a fresh response
+        return parse_matches(res.json())
+
+    assert len(measure(size, parse)) == size
+
+
+@pytest.mark.parametrize('backend', [name for name in BACKENDS if installed(name)])
+@pytest.mark.parametrize('size', SIZES)
+def test_decode(measure, bodies, size, backend):
+    loads = load_backend(backend)[1]
+    body = bodies[size]
+
+    def parse():
+        return parse_matches(loads(body))
+
+    assert len(measure(size, parse)) == size
@@ -0,0 +1,45 @@
+"""
+Benchmarks for fetching and parsing matches from the stub API, and for
+whole `soccer` invocations against it.
+"""
+import os
+
+import mock
+import pytest
+from click.testing import CliRunner
+
+from conftest import matches_url
+from payloads import SIZES
+from soccer import main
+from soccer.models import parse_matches
+from soccer.request_handler import RequestHandler
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_get_and_parse(stub, measure, size):
+    rh = RequestHandler({'X-Auth-Token': 'token'}, {}, {}, None)
+
+    def fetch():
+        return parse_matches(rh._get(matches_url(size)).json())
+
+    assert len(measure(size, fetch)) == size
+
+
+@pytest.mark.parametrize('output_format', ['stdout', 'csv', 'json'])
+@pytest.mark.parametrize('size', SIZES)
+def test_main(stub, measure, tmpdir, size, output_format):
+    args = ['--apikey', 'token', '--league', 'PL', '--time', str(size), '--no-cache',
+            '--' + output_format]
+    if output_format != 'stdout':
+        args += ['--output-file', str(tmpdir.join('out.' + output_format))]
+    runner = CliRunner()
+
+    def invoke():
+        return runner.invoke(main.main, args, catch_exceptions=False)
+
+    # no local match store or shared rate limiter state from the home directory
+    with mock.patch('soccer.store.DEFAULT_STORE', str(tmpdir.join('matches.db'))), \
+            mock.patch('soccer.ratelimit.DEFAULT_LOCK_FILE', str(tmpdir.join('ratelimit.lock'))):
+        result = measure(size, invoke)
+    assert result.exit_code == 0, result.output
+    assert not os.path.exists(str(tmpdir.join('matches.db')))
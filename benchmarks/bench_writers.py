@@ -0,0 +1,31 @@
+"""Benchmarks for rendering parsed matches with each writer"""
+import io
+import sys
+
+import pytest
+
+from payloads import SIZES
+from soccer.models import parse_matches
+from soccer.writers import get_writer
+
+
+@pytest.fixture(scope='module')
+def matches(payloads):
+    return dict((size, parse_matches(payload)) for size, payload in payloads.items())
+
+
+@pytest.mark.parametrize('output_format', ['stdout', 'csv', 'json'])
+@pytest.mark.parametrize('size', SIZES)
+def test_league_scores(measure, matches, tmpdir, size, output_format):
+    output_file = None if output_format == 'stdout' else str(tmpdir.join('out'))
+    writer = get_writer(output_format, output_file)
+
+    def render():
+        stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        try:
+            writer.league_scores(matches[size], size, False, False)
+        finally:
+            sys.stdout = stdout
+
+    measure(size, render)
@@ -0,0 +1,53 @@
+import os
+import sys
+import tracemalloc
+
+import mock
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from payloads import SIZES, StubServer, matches_payload  # noqa: E402
+from soccer.request_handler import RequestHandler  # noqa: E402
+
+# Fewer rounds for the big payloads, which take seconds each.
+ROUNDS = {10: 50, 1000: 10, 100000: 3}
+
+
+def matches_url(size):
+    return 'competitions/2021/matches?timeFrame=p{0}'.format(size)
+
+
+@pytest.fixture(scope='session')
+def stub():
+    """Stub API serving a matches payload of each size, for the whole run"""
+    with StubServer() as server:
+        for size in SIZES:
+            server.add(matches_url(size), matches_payload(size))
+        with mock.patch.object(RequestHandler, 'BASE_URL', server.url):
+            yield server
+
+
+@pytest.fixture(scope='session')
+def payloads():
+    return dict((size, matches_payload(size)) for size in SIZES)
+
+
+@pytest.fixture
+def measure(benchmark):
+    """
+    Benchmarks function(*args) with a round count suited to size, and
+    records its peak traced memory in the saved results' extra_info
+    """
+    def run(size, function, *args):
+        tracemalloc.start()
+        try:
+            function(*args)
+            benchmark.extra_info['peak_memory_kib'] = tracemalloc.get_traced_memory()[1] // 1024
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info['matches'] = size
+        return benchmark.pedantic(function, args, rounds=ROUNDS[size], iterations=1,
+                                  warmup_rounds=1)
+    return run
@@ -0,0 +1,113 @@
+"""
+football-data.org payloads for the benchmarks, and a local stub server
+that replays them.
+
+Matches are copies of a recorded v2 /matches item (same fields, nesting
+and value sizes), with ids, dates, teams and scores varied so that the
+writers see realistic data.
+"""
+import copy
+import datetime
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SIZES = [10, 1000, 100000]
+
+COMPETITION = {'id': 2021, 'area': {'id': 2072, 'name': 'England'},
+               'name': 'Premier League', 'code': 'PL', 'plan': 'TIER_ONE',
+               'lastUpdated': '2018-08-23T12:16:23Z'}
+
+MATCH = {
+    'id': 233030,
+    'season': {'id': 151, 'startDate': '2018-08-10', 'endDate': '2019-05-12',
+               'currentMatchday': 2},
+    'utcDate': '2018-08-10T19:00:00Z',
+    'status': 'FINISHED',
+    'matchday': 1,
+    'stage': 'REGULAR_SEASON',
+    'group': 'Regular Season',
+    'lastUpdated': '2018-08-11T12:00:05Z',
+    'score': {'winner': 'HOME_TEAM', 'duration': 'REGULAR',
+              'fullTime': {'homeTeam': 2, 'awayTeam': 1},
+              'halfTime': {'homeTeam': 1, 'awayTeam': 0},
+              'extraTime': {'homeTeam': None, 'awayTeam': None},
+              'penalties': {'homeTeam': None, 'awayTeam': None}},
+    'homeTeam': {'id': 66, 'name': 'Manchester United FC'},
+    'awayTeam': {'id': 338, 'name': 'Leicester City FC'},
+    'referees': [{'id': 11605, 'name': 'Andre Marriner', 'nationality': None},
+                 {'id': 11564, 'name': 'Sian Massey', 'nationality': None},
+                 {'id': 11488, 'name': 'Simon Bennett', 'nationality': None},
+                 {'id': 11479, 'name': 'Lee Mason', 'nationality': None}],
+}
+
+TEAMS = ['Arsenal FC', 'Chelsea FC', 'Everton FC', 'Liverpool FC',
+         'Manchester City FC', 'Manchester United FC', 'Tottenham Hotspur FC',
+         'Leicester City FC', 'Burnley FC', 'Watford FC']
+
+
+def matches_payload(count, competition=COMPETITION):
+    """Returns a competitions/{id}/matches response with count matches"""
+    start = datetime.datetime(2018, 8, 10, 19)
+    matches = []
+    for i in range(count):
+        match = copy.deepcopy(MATCH)
+        match['id'] = MATCH['id'] + i
+        match['utcDate'] = (start + datetime.timedelta(hours=i)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        match['homeTeam'] = {'id': 57 + i % len(TEAMS), 'name': TEAMS[i % len(TEAMS)]}
+        away = (i + 1 + i // len(TEAMS)) % len(TEAMS)
+        match['awayTeam'] = {'id': 57 + away, 'name': TEAMS[away]}
+        match['score']['fullTime'] = {'homeTeam': i % 4, 'awayTeam': i % 3}
+        matches.append(match)
+    return {'count': count, 'filters': {}, 'competition': competition, 'matches': matches}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the recorded payload for the request path, or a 404"""
+
+    def do_GET(self):
+        body = self.server.payloads.get(self.path.split('/v2/', 1)[-1])
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        # keep the client's rate limiter out of the measurements
+        self.send_header('X-Requests-Available-Minute', '1000000')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local stand-in for api.football-data.org/v2/"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', 0), StubHandler)
+        self.payloads = {}
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return 'http://{0}:{1}/v2/'.format(host, port)
+
+    def add(self, path, payload):
+        """Serves payload (json-encoded once, up front) at path"""
+        self.payloads[path] = json.dumps(payload).encode('utf-8')
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,66 @@
+"""
+Rendering benchmark for the stdout writer.
+
+Renders a generated list of fixtures the way `soccer --league` prints
+them, with and without colors, and reports the best time of several runs:
+
+    $ python benchmarks/render.py
+    $ python benchmarks/render.py --matches 50000 --runs 3
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from soccer.models import Match, Team  # noqa: E402
+from soccer.writers import get_writer  # noqa: E402
+
+DEFAULT_MATCHES = 10000
+DEFAULT_RUNS = 5
+LEAGUES = ['Premier League', 'Bundesliga', 'Serie A', 'Primera Division']
+
+
+def fixtures(count):
+    """Generates count finished fixtures spread over a few leagues"""
+    return [Match(i, '2018-08-10T19:00:00Z', 'FINISHED', LEAGUES[i * len(LEAGUES) // count],
+                  Team(i, 'Home Team %d' % i), Team(i + 1, 'Away Team %d' % i),
+                  i % 4, i % 3)
+            for i in range(count)]
+
+
+def render(matches, color):
+    """Returns the seconds taken to render matches into a string buffer"""
+    writer = get_writer('stdout')
+    writer.color = color
+    stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        start = time.perf_counter()
+        writer.league_scores(matches, 6, True, False)
+        return time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--matches', type=int, default=DEFAULT_MATCHES,
+                        help='number of fixtures to render')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS,
+                        help='number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    matches = fixtures(args.matches)
+    for color in (True, False):
+        best = min(render(matches, color) for _ in range(args.runs))
+        print('{0} fixtures, {1}: {2:.1f} ms ({3:.1f} us per fixture)'.format(
+              args.matches, 'color' if color else 'no color', best * 1000,
+              best * 1e6 / args.matches))
+
+
+if __name__ == '__main__':
+    main()
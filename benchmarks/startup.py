@@ -0,0 +1,77 @@
+"""
+Startup benchmark for the soccer CLI.
+
+Measures the time `soccer --list` spends importing modules, using
+`python -X importtime`, and exits with an error when it is over budget:
+
+    $ python benchmarks/startup.py
+    $ python benchmarks/startup.py --runs 20 --budget 40
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Import time budget (milliseconds) for `soccer --list`, on top of what a
+# bare interpreter imports anyway.
+DEFAULT_BUDGET = 60.0
+DEFAULT_RUNS = 10
+
+LIST_COMMAND = ('import sys; sys.argv = ["soccer", "--list"]; '
+                'from soccer.main import main; main()')
+
+
+def import_times(code):
+    """Runs code under -X importtime, returning {module: cumulative us}"""
+    env = dict(os.environ, SOCCER_CLI_API_TOKEN='0' * 32, PYTHONPATH=ROOT)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          env=env, cwd=ROOT, universal_newlines=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name.startswith('  '):
+            continue  # only count top level imports, which include nested ones
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(runs):
+    """Returns the best import time (ms) of `soccer --list` over runs"""
+    baseline = set(import_times('pass'))
+    best = None
+    slowest = []
+    for _ in range(runs):
+        times = dict((name, us) for name, us in import_times(LIST_COMMAND).items()
+                     if name not in baseline)
+        total = sum(times.values()) / 1000.0
+        if best is None or total < best:
+            best = total
+            slowest = sorted(times.items(), key=lambda item: -item[1])[:5]
+    return best, slowest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                        help='maximum import time in milliseconds')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS,
+                        help='number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    best, slowest = measure(args.runs)
+    print('soccer --list imports: {0:.1f} ms (budget {1:.1f} ms)'.format(best, args.budget))
+    for name, us in slowest:
+        print('  {0:<30} {1:>8.1f} ms'.format(name, us / 1000.0))
+    if best > args.budget:
+        print('Import time regressed!')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,21 @@
 #!/usr/bin/env python
 
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 import os, sys
 
+
+class BuildPyWithTeamIndex(build_py):
+    """Precompiles the team index snapshot next to the installed teams.json"""
+
+    def run(self):
+        build_py.run(self)
+        if not self.dry_run:
+            from soccer.teamindex import build_snapshot
+            target = os.path.join(self.build_lib, 'soccer')
+            build_snapshot(os.path.join(target, 'teams.json'),
+                           os.path.join(target, 'teams.marshal'))
+
 # if you are not using vagrant, just delete os.link directly,
 # The hard link only saves a little disk space, so you should not care
 if os.environ.get('USER','') == 'vagrant':
@@ -26,10 +39,15 @@ setup(
 
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ],
+    python_requires='>=3.8',
     keywords="soccer football espn scores live tool cli",
     author_email='architv07@gmail.com',
     url='https://github.com/architv/soccer-cli',
@@ -39,6 +57,14 @@ setup(
         "click>=5.0",
         "requests==2.20.0"
     ] + (["colorama==0.3.3"] if "win" in sys.platform else []),
+    extras_require={
+        'async': ["aiohttp>=3.0"],
+        'stats': ["numpy>=1.13"],
+        'speedups': ["orjson>=3.0"],
+        'arrow': ["pyarrow>=1.0"],
+        'bench': ["pytest", "pytest-benchmark>=3.1"],
+    },
+    cmdclass={'build_py': BuildPyWithTeamIndex},
     entry_points={
         'console_scripts': [
             'soccer = soccer.main:main'
@@ -0,0 +1,128 @@
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from soccer.exceptions import APIErrorException
+from soccer.request_handler import (API_ERRORS, DEFAULT_TIMEOUT, RequestHandler,
+                                    live_scores_data)
+
+CLIENT_ERRORS = (asyncio.TimeoutError, OSError)
+if aiohttp is not None:
+    CLIENT_ERRORS += (aiohttp.ClientError,)
+
+
+class AsyncRequestHandler(object):
+    """
+    asyncio counterpart of RequestHandler for embedding in async services.
+
+    Every method returns the parsed data instead of handing it to a writer,
+    and raises APIErrorException when the data can't be fetched. All
+    requests share one aiohttp connection pool, so many queries can be in
+    flight on a single event loop.
+    """
+
+    BASE_URL = RequestHandler.BASE_URL
+    LIVE_URL = RequestHandler.LIVE_URL
+
+    def __init__(self, headers, league_ids, team_names, session=None,
+                 timeout=DEFAULT_TIMEOUT, pool_size=100):
+        self.headers = headers
+        self.league_ids = league_ids
+        self.team_names = team_names
+        self.session = session
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Closes the connection pool if this handler created it"""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self):
+        if self.session is None:
+            if aiohttp is None:
+                raise ImportError('AsyncRequestHandler requires aiohttp. '
+                                  'Install it with: pip install soccer-cli[async]')
+            connect, read = self.timeout
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read))
+        return self.session
+
+    async def _fetch(self, url, headers=None):
+        try:
+            async with self._session().get(url, headers=headers) as resp:
+                if resp.status == 200:
+                    return await resp.json(content_type=None)
+                if resp.status in API_ERRORS:
+                    raise APIErrorException(API_ERRORS[resp.status])
+                raise APIErrorException('Unexpected response from the API '
+                                        '({0}).'.format(resp.status))
+        except CLIENT_ERRORS:
+            raise APIErrorException('Could not connect to the API. '
+                                    'Check your connection.')
+
+    async def _get(self, url):
+        """Handles api.football-data.org requests"""
+        return await self._fetch(self.BASE_URL + url, self.headers)
+
+    def _team_id(self, team):
+        team_id = self.team_names.get(team, None)
+        if not team_id:
+            raise APIErrorException('Team code is not correct.')
+        return team_id
+
+    async def get_live_scores(self):
+        """Returns the live scores"""
+        scores = await self._fetch(self.LIVE_URL)
+        return live_scores_data(scores)
+
+    async def get_team_scores(self, team, time, show_upcoming):
+        """Returns the particular team scores"""
+        time_frame = 'n' if show_upcoming else 'p'
+        return await self._get('teams/{team_id}/matches?timeFrame={time_frame}{time}'.format(
+            team_id=self._team_id(team), time_frame=time_frame, time=time))
+
+    async def get_standings(self, league):
+        """Returns the standings for a particular league"""
+        return await self._get('competitions/{id}/standings'.format(
+            id=self.league_ids[league]))
+
+    async def get_league_scores(self, league, time, show_upcoming):
+        """
+        Returns the fixtures based upon the league and time parameter.
+        league may be a single league code, a list of codes whose fixtures
+        are fetched concurrently and merged, or None for all competitions.
+        """
+        time_frame = 'n' if show_upcoming else 'p'
+        if league is None:
+            return await self._get('matches?timeFrame={time_frame}{time}'.format(
+                time_frame=time_frame, time=str(time)))
+        if not isinstance(league, (list, tuple)):
+            return await self._get('competitions/{id}/matches?timeFrame={time_frame}{time}'.format(
+                id=self.league_ids[league], time_frame=time_frame, time=str(time)))
+
+        responses = await asyncio.gather(*[
+            self.get_league_scores(code, time, show_upcoming) for code in league])
+        matches = []
+        for response in responses:
+            for match in response['matches']:
+                match.setdefault('competition', response['competition'])
+                matches.append(match)
+        return {'matches': matches}
+
+    async def get_team_players(self, team):
+        """Returns the players for a particular team"""
+        team_data = await self._get('teams/{}/'.format(self._team_id(team)))
+        return team_data['squad']
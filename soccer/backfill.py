@@ -0,0 +1,73 @@
+import datetime
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from soccer.decoding import decode
+from soccer.exceptions import APIErrorException
+from soccer.request_handler import MAX_WORKERS
+
+DATE_FORMAT = '%Y-%m-%d'
+WINDOW_DAYS = 10
+
+
+def date_windows(date_from, date_to, days=WINDOW_DAYS):
+    """Splits the inclusive date range into windows of at most days days"""
+    one_day = datetime.timedelta(days=1)
+    start = date_from
+    while start <= date_to:
+        end = min(start + datetime.timedelta(days=days) - one_day, date_to)
+        yield start, end
+        start = end + one_day
+
+
+def backfill(rh, store, league, date_from, date_to, days=WINDOW_DAYS,
+             today=None, progress=None):
+    """
+    Fetches every match of league between the two dates into store.
+
+    The range is fetched in windows of days days, several at a time, and
+    each window is stored as soon as it arrives. Windows whose days were
+    all stored before, by windows of any size, are skipped, except those
+    that aren't over yet. Returns
+    (windows fetched, matches stored, failed windows).
+    """
+    competition_id = rh.league_ids[league]
+    today = today or datetime.date.today()
+    pending = []
+    for start, end in date_windows(date_from, date_to, days):
+        window = (start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT))
+        if end < today and store.has_window(competition_id, *window):
+            continue
+        pending.append(window)
+
+    def fetch(window):
+        url = 'competitions/{id}/matches?dateFrom={date_from}&dateTo={date_to}'.format(
+            id=competition_id, date_from=window[0], date_to=window[1])
+        return decode(rh._get(url))['matches']
+
+    fetched = stored = 0
+    failed = []
+    workers = max(1, min(len(pending), MAX_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = dict((executor.submit(fetch, window), window) for window in pending)
+        try:
+            for future in as_completed(futures):
+                window = futures[future]
+                try:
+                    matches = future.result()
+                except APIErrorException as e:
+                    failed.append((window, e))
+                    continue
+                stored += store.add_matches(matches, competition_id)
+                if window[1] < today.strftime(DATE_FORMAT):
+                    store.add_window(competition_id, *window)
+                fetched += 1
+                if progress is not None:
+                    progress(window, len(matches))
+        except BaseException:
+            # Interrupted (eg. Ctrl-C): don't fetch the windows that haven't
+            # started, the next run resumes from the stored ones
+            for future in futures:
+                future.cancel()
+            raise
+    return fetched, stored, failed
@@ -0,0 +1,265 @@
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from soccer.decoding import loads
+from soccer.offline import MATCHES_URL, OfflineResponse, time_frame_dates
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "soccer-cli")
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024  # bytes
+
+# Time to live (seconds) for each kind of endpoint, first match wins.
+DEFAULT_TTLS = (
+    (re.compile(r'^competitions/\d+/standings'), 30 * 60),
+    (re.compile(r'matches\?.*timeFrame='), 60),
+    (re.compile(r'matches\?dateFrom='), 60),
+    (re.compile(r'^teams/\d+/$'), 24 * 60 * 60),
+)
+DEFAULT_TTL = 5 * 60
+PAST_TTL = 24 * 60 * 60  # matches of days that are over rarely change
+MAX_SPAN_DAYS = 10  # most days a dateFrom/dateTo query of all competitions may span
+
+
+class CachedResponse(object):
+    """A response served from the on-disk cache.
+
+    Quacks like the parts of ``requests.Response`` that RequestHandler uses.
+    """
+
+    status_code = 200
+
+    def __init__(self, path, entry, fresh):
+        self.path = path
+        self.url = entry["url"]
+        self.stored = entry["stored"]
+        self.headers = entry.get("headers", {})
+        self.text = entry["body"]
+        self.fresh = fresh
+
+    def json(self):
+        return loads(self.text)
+
+    def validators(self):
+        """Conditional request headers to revalidate this entry"""
+        validators = {}
+        if self.headers.get("ETag"):
+            validators["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = self.headers["Last-Modified"]
+        return validators
+
+
+class ResponseCache(object):
+    """Size-bounded on-disk cache of API responses with per-endpoint TTLs.
+
+    Entries are keyed on the request url and auth token, and evicted in
+    least recently used order once the cache grows past ``max_size``.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_DIR, ttl=None, max_size=DEFAULT_MAX_SIZE):
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+
+    def ttl_for(self, url):
+        """Returns the time to live for url, honouring any global override"""
+        if self.ttl is not None:
+            return self.ttl
+        for pattern, ttl in DEFAULT_TTLS:
+            if pattern.search(url):
+                return ttl
+        return DEFAULT_TTL
+
+    def _key_path(self, url, headers):
+        token = str(headers.get('X-Auth-Token', ''))
+        key = hashlib.sha1((token + ' ' + url).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, key + '.json')
+
+    def get(self, url, headers):
+        """Returns the CachedResponse stored for url, or None"""
+        path = self._key_path(url, headers)
+        try:
+            with open(path) as cfile:
+                entry = json.load(cfile)
+        except (IOError, OSError, ValueError):
+            return None
+        fresh = time.time() - entry["stored"] < self.ttl_for(url)
+        try:
+            os.utime(path, None)  # mark as recently used
+        except OSError:
+            pass
+        return CachedResponse(path, entry, fresh)
+
+    def set(self, url, headers, response):
+        """Stores a successful response for url"""
+        entry = {
+            "url": url,
+            "stored": time.time(),
+            "headers": dict((k, v) for k, v in response.headers.items()
+                            if k in ("ETag", "Last-Modified")),
+            "body": response.text,
+        }
+        self._write(self._key_path(url, headers), entry)
+        self._evict()
+
+    def revalidated(self, cached):
+        """Marks a cached response as fresh again after a 304"""
+        entry = {
+            "url": cached.url,
+            "stored": time.time(),
+            "headers": cached.headers,
+            "body": cached.text,
+        }
+        self._write(cached.path, entry)
+        cached.stored = entry["stored"]
+        cached.fresh = True
+        return cached
+
+    def _write(self, path, entry):
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path, exist_ok=True)
+        tmp = '{0}.{1}.{2}.tmp'.format(path, os.getpid(),
+                                       threading.current_thread().ident)
+        with open(tmp, 'w') as cfile:
+            json.dump(entry, cfile)
+        os.replace(tmp, path)
+
+    def _evict(self):
+        """Removes least recently used entries until under max_size"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.path):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+class MatchWindows(object):
+    """
+    Interval-aware cache for timeFrame matches queries.
+
+    The matches of each competition or team are stored together with the
+    date ranges they were fetched for. A query whose days are all covered
+    is answered by filtering the stored matches, and a wider one only
+    fetches the days that are missing, as dateFrom/dateTo queries (of at
+    most MAX_SPAN_DAYS days for the all-competitions endpoint). Days
+    that are over stay fresh for past_ttl, recent and future days for the
+    cache's timeFrame ttl. Entries live in the response cache's directory.
+    """
+
+    def __init__(self, cache, past_ttl=PAST_TTL):
+        self.cache = cache
+        self.past_ttl = past_ttl
+
+    def _load(self, path):
+        try:
+            with open(path, 'rb') as cfile:
+                entry = loads(cfile.read())
+        except (IOError, OSError, ValueError):
+            return {'intervals': [], 'matches': {}}
+        try:
+            os.utime(path, None)  # mark as recently used
+        except OSError:
+            pass
+        return entry
+
+    def _save(self, path, entry, now):
+        """Drops expired ranges and the matches only they covered, then writes"""
+        entry['intervals'] = [interval for interval in entry['intervals']
+                              if now - interval[2] < self.past_ttl]
+        entry['matches'] = dict(
+            (match_id, match) for match_id, match in entry['matches'].items()
+            if any(date_from <= match['utcDate'][:10] <= date_to
+                   for date_from, date_to, _ in entry['intervals']))
+        self.cache._write(path, entry)
+        self.cache._evict()
+
+    def get(self, url, headers, fetch=None, today=None):
+        """
+        Returns the response to a timeFrame matches url, or None if url
+        isn't one. fetch(url) returns the json of a dateFrom/dateTo url
+        and is called for the missing days. Without fetch, stored matches
+        of any age are used and None is returned unless every day is stored.
+        """
+        query = MATCHES_URL.match(url)
+        if query is None:
+            return None
+        resource, resource_id, time_frame, days = query.groups()
+        prefix = '{0}/{1}/'.format(resource, resource_id) if resource else ''
+        today = today or datetime.date.today()
+        date_from, date_to = time_frame_dates(time_frame, days, today)
+        path = self.cache._key_path('windows ' + prefix, headers)
+        entry = self._load(path)
+        now = time.time()
+        recent_ttl = self.cache.ttl_for(url)
+        past = (today - datetime.timedelta(days=1)).isoformat()
+
+        def covered(day):
+            for first, last, fetched in entry['intervals']:
+                if first <= day <= last:
+                    if fetch is None:
+                        return True
+                    if now - fetched < (self.past_ttl if day < past else recent_ttl):
+                        return True
+            return False
+
+        def extends(gap, day):
+            """Whether day can be added to the end of gap"""
+            if gap[1] != (day - datetime.timedelta(days=1)).isoformat():
+                return False
+            first = datetime.datetime.strptime(gap[0], '%Y-%m-%d').date()
+            return bool(prefix) or (day - first).days < MAX_SPAN_DAYS
+
+        gaps = []
+        day = date_from
+        while day <= date_to:
+            iso = day.isoformat()
+            if not covered(iso):
+                if gaps and extends(gaps[-1], day):
+                    gaps[-1][1] = iso
+                else:
+                    gaps.append([iso, iso])
+            day += datetime.timedelta(days=1)
+        if gaps and fetch is None:
+            return None
+        for first, last in gaps:
+            data = fetch('{0}matches?dateFrom={1}&dateTo={2}'.format(prefix, first, last))
+            entry['matches'] = dict((match_id, match)
+                                    for match_id, match in entry['matches'].items()
+                                    if not first <= match['utcDate'][:10] <= last)
+            for match in data['matches']:
+                entry['matches'][str(match['id'])] = match
+            if data.get('competition'):
+                entry['competition'] = data['competition']
+            entry['intervals'].append([first, last, now])
+        if gaps:
+            self._save(path, entry, now)
+
+        first, last = date_from.isoformat(), date_to.isoformat()
+        matches = sorted((match for match in entry['matches'].values()
+                          if first <= match['utcDate'][:10] <= last),
+                         key=lambda match: (match['utcDate'], match['id']))
+        data = {'matches': matches}
+        if entry.get('competition'):
+            data['competition'] = entry['competition']
+        stored = min([fetched for _, _, fetched in entry['intervals']] or [now])
+        return OfflineResponse(data, stored)
@@ -0,0 +1,146 @@
+import hmac
+import json
+import os
+import secrets
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from soccer.exceptions import APIErrorException
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8642
+# Not a .json file, which the response cache in the same folder could evict
+DAEMON_FILE = os.path.join(os.path.expanduser("~"), ".cache", "soccer-cli", "daemon.info")
+SECRET_HEADER = 'X-Soccer-Daemon-Secret'
+# Sent with answers from local data, when the daemon couldn't reach the API
+STORED_HEADER = 'X-Soccer-Stored'
+REASON_HEADER = 'X-Soccer-Offline-Reason'
+
+
+class SingleFlight(object):
+    """
+    Merges concurrent calls for the same key: the first caller runs the
+    function, and callers arriving while it runs wait for its result
+    instead of running it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {'done': threading.Event()}
+        if leader:
+            try:
+                call['result'] = function()
+            except Exception as e:
+                call['error'] = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call['done'].set()
+        else:
+            call['done'].wait()
+        if 'error' in call:
+            raise call['error']
+        return call['result']
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET /<api path> with the api's json, or {"error": ...}.
+    Requests without the daemon's secret are refused, and answers from
+    local data say when that data was stored.
+    """
+
+    def do_GET(self):
+        secret = self.headers.get(SECRET_HEADER) or ''
+        if not hmac.compare_digest(secret.encode('utf-8'), self.server.secret.encode('utf-8')):
+            self.respond(403, json.dumps({'error': 'Missing or wrong soccer daemon secret.'}))
+            return
+        url = self.path.lstrip('/')
+        try:
+            response = self.server.flight.do(url, lambda: self.server.rh._get(url))
+        except APIErrorException as e:
+            self.respond(502, json.dumps({'error': e.args[0]}))
+            return
+        headers = {}
+        reason = getattr(response, 'offline_reason', None)
+        if reason is not None:
+            headers = {STORED_HEADER: repr(response.stored), REASON_HEADER: reason}
+        self.respond(200, response.text, headers)
+
+    def respond(self, status, text, headers=None):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class Daemon(ThreadingHTTPServer):
+    """
+    Local HTTP server that makes api requests on behalf of other soccer
+    processes, so they all share the request handler's connection pool,
+    response cache and rate limiter. Identical requests in flight at the
+    same time are sent to the api once.
+
+    Clients must send the random secret the daemon advertises, along with
+    its url, in a daemon file only the user can read.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, rh, host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False):
+        ThreadingHTTPServer.__init__(self, (host, port), DaemonRequestHandler)
+        self.rh = rh
+        self.flight = SingleFlight()
+        self.verbose = verbose
+        self.secret = secrets.token_hex(16)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return 'http://{0}:{1}/'.format(host, port)
+
+    def serve(self, daemon_file=DAEMON_FILE):
+        """Serves until interrupted, advertising the daemon in daemon_file"""
+        directory = os.path.dirname(daemon_file)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(daemon_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.chmod(daemon_file, 0o600)  # in case it was left by an older daemon
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'pid': os.getpid(), 'url': self.url, 'secret': self.secret}, f)
+        try:
+            self.serve_forever()
+        finally:
+            self.server_close()
+            try:
+                with open(daemon_file) as f:
+                    if json.load(f).get('pid') == os.getpid():
+                        os.remove(daemon_file)
+            except (IOError, OSError, ValueError):
+                pass
+
+
+def find_daemon(daemon_file=DAEMON_FILE):
+    """Returns (url, secret) of the advertised daemon, or None"""
+    try:
+        with open(daemon_file) as f:
+            daemon = json.load(f)
+        return daemon['url'], daemon['secret']
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
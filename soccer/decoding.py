@@ -0,0 +1,39 @@
+"""
+JSON decoding of API responses, through the fastest parser installed:
+orjson, then ujson, then the standard library. Set SOCCER_CLI_JSON to
+one of BACKENDS to choose one.
+"""
+import os
+
+from importlib import import_module
+
+BACKENDS = ('orjson', 'ujson', 'json')
+
+
+def load_backend(name=None):
+    """Returns (name, loads) of the named backend, or of the fastest one installed"""
+    if name is not None and name not in BACKENDS:
+        raise ValueError('Unknown json backend {0}, expected one of {1}.'.format(
+            name, ', '.join(BACKENDS)))
+    for candidate in (name,) if name else BACKENDS:
+        try:
+            return candidate, import_module(candidate).loads
+        except ImportError:
+            continue
+    raise ImportError('The {0} json backend is not installed.'.format(name))
+
+
+BACKEND, loads = load_backend(os.environ.get('SOCCER_CLI_JSON') or None)
+
+
+def decode(response):
+    """
+    Decodes a response's json. The raw bytes of API responses are handed
+    to the parser as they are, skipping the text decoding and encoding
+    guesses of requests' Response.json(); other responses (cached,
+    offline) decode themselves.
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, bytes):
+        return loads(content)
+    return response.json()
@@ -4,3 +4,7 @@ class IncorrectParametersException(Exception):
 
 class APIErrorException(Exception):
     pass
+
+
+class APIConnectionException(APIErrorException):
+    pass
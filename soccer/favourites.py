@@ -0,0 +1,27 @@
+import io
+import os
+
+FAVOURITES_FILE = os.path.join(os.path.expanduser("~"), ".soccer-cli-favourites")
+
+
+def load_favourites(path=FAVOURITES_FILE):
+    """
+    Returns the team codes in the favourites file, one per line, in order
+    and without duplicates. Blank lines and lines starting with # are
+    skipped.
+    """
+    if not os.path.exists(path):
+        return []
+    favourites = []
+    with io.open(path, encoding='utf-8') as f:
+        for line in f:
+            code = line.strip().upper()
+            if code and not code.startswith('#') and code not in favourites:
+                favourites.append(code)
+    return favourites
+
+
+def save_favourites(codes, path=FAVOURITES_FILE):
+    with io.open(path, 'w', encoding='utf-8') as f:
+        for code in codes:
+            f.write(code + u'\n')
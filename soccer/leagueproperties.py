@@ -17,12 +17,14 @@ LEAGUE_PROPERTIES = {
     "BL": {
         "rl": [16, 18],
         "cl": [1, 4],
-        "el": [5, 6]
+        "el": [5, 6],
+        "tiebreak": ['goal_difference', 'goals_for', 'h2h_points', 'h2h_away_goals_for']
     },
     "BL2": {
         "rl": [16, 18],
         "cl": [1, 2],
-        "el": [3, 3]
+        "el": [3, 3],
+        "tiebreak": ['goal_difference', 'goals_for', 'h2h_points', 'h2h_away_goals_for']
     },
     "BL3": {
         "rl": [18, 20],
@@ -32,7 +34,8 @@ LEAGUE_PROPERTIES = {
     "PD": {
         "rl": [18, 20],
         "cl": [1, 3],
-        "el": [4, 6]
+        "el": [4, 6],
+        "tiebreak": ['h2h_points', 'h2h_goal_difference', 'goal_difference', 'goals_for']
     },
     "SD": {
         "rl": [19, 22],
@@ -42,7 +45,8 @@ LEAGUE_PROPERTIES = {
     "SA": {
         "rl": [18, 20],
         "cl": [1, 3],
-        "el": [4, 5]
+        "el": [4, 5],
+        "tiebreak": ['h2h_points', 'h2h_goal_difference', 'goal_difference', 'goals_for']
     },
     "PPL": {
         "rl": [17, 18],
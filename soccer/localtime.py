@@ -0,0 +1,72 @@
+import datetime
+
+UTC = datetime.timezone.utc
+
+
+def parse_utc(time_str):
+    """Parses an api time (YYYY-MM-DDTHH:MM:SSZ) into an aware UTC datetime"""
+    try:
+        return datetime.datetime(int(time_str[0:4]), int(time_str[5:7]),
+                                 int(time_str[8:10]), int(time_str[11:13]),
+                                 int(time_str[14:16]), int(time_str[17:19]),
+                                 tzinfo=UTC)
+    except ValueError:
+        return datetime.datetime.strptime(time_str, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=UTC)
+
+
+def get_zone(name):
+    """Returns the tzinfo for an IANA time zone name, eg. Europe/London"""
+    try:
+        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    except ImportError:
+        raise ValueError('Time zones need Python 3.9 or later')
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError('Unknown time zone: {0}'.format(name))
+
+
+class LocalTime(object):
+    """
+    Formats api kickoff times in the user's time zone.
+
+    Each kickoff is converted with the zone's offset on that date, so
+    fixtures after a daylight saving change show the right time. The zone
+    defaults to the system's, and formatted times are memoized since many
+    fixtures share a kickoff.
+    """
+
+    def __init__(self, tz=None):
+        self.tz = tz
+        self._formatted = {}
+
+    def localize(self, utc_datetime):
+        """Converts an aware datetime to the zone (the system's if tz is None)"""
+        return utc_datetime.astimezone(self.tz)
+
+    def format(self, time_str, use_12_hour_format, show_datetime=False):
+        """
+        Formats an api time, or a live scores time like '07:45 PM UTC',
+        as the local time. Anything else (eg. a minute like "45'") is
+        returned as it is.
+        """
+        key = (time_str, use_12_hour_format, show_datetime)
+        if key in self._formatted:
+            return self._formatted[key]
+        if time_str.endswith("Z"):
+            utc_datetime = parse_utc(time_str)
+        elif time_str.endswith(" UTC"):
+            utc_time = datetime.datetime.strptime(time_str[:-4], '%I:%M %p')
+            utc_datetime = datetime.datetime.now(UTC).replace(
+                hour=utc_time.hour, minute=utc_time.minute, second=0, microsecond=0)
+        else:
+            return time_str
+
+        if use_12_hour_format:
+            date_format = '%I:%M %p' if not show_datetime else '%a %d, %I:%M %p'
+        else:
+            date_format = '%H:%M' if not show_datetime else '%a %d, %H:%M'
+
+        formatted = self.localize(utc_datetime).strftime(date_format)
+        self._formatted[key] = formatted
+        return formatted
@@ -1,17 +1,22 @@
 import os
 import sys
-import json
 
 import click
 
 from soccer import leagueids
+from soccer.teamindex import TeamIndex
 from soccer.exceptions import IncorrectParametersException
-from soccer.writers import get_writer
-from soccer.request_handler import RequestHandler
+from soccer.writers import WRITERS, get_writer
+
+# Everything that needs the network (requests, the cache and rate limiter,
+# the watcher) is imported inside the commands that use it, so that
+# offline commands like --list and --lookup start quickly.
+API_URL = 'http://api.football-data.org/v2/'
 
 
 def load_json(file):
     """Load JSON file at app start"""
+    import json
     here = os.path.dirname(os.path.abspath(__file__))
     with open(os.path.join(here, file)) as jfile:
         data = json.load(jfile)
@@ -19,14 +24,99 @@ def load_json(file):
 
 
 LEAGUE_IDS = leagueids.LEAGUE_IDS
-TEAM_DATA = load_json("teams.json")["teams"]
-TEAM_NAMES = {team["code"]: team["id"] for team in TEAM_DATA}
+TEAM_NAMES = TeamIndex()  # loaded on first use
+
+
+class LeagueList(click.ParamType):
+    """A league code, or several comma separated ones (eg. PL,BL,SA)"""
+
+    name = 'league'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, list):
+            return value
+        leagues = [code.strip().upper() for code in value.split(',') if code.strip()]
+        for code in leagues:
+            if code not in LEAGUE_IDS:
+                self.fail('invalid choice: {0}. (choose from {1})'.format(
+                          code, ', '.join(sorted(LEAGUE_IDS))), param, ctx)
+        return leagues
+
+
+class OutputFormat(click.ParamType):
+    """An output format, built in or added by a writer plugin"""
+
+    name = 'format'
+
+    def convert(self, value, param, ctx):
+        from soccer.writers import output_formats
+
+        if value not in WRITERS and value not in output_formats():
+            self.fail('invalid choice: {0}. (choose from {1})'.format(
+                      value, ', '.join(output_formats())), param, ctx)
+        return value
+
+
+def output_format_options(command):
+    """
+    Adds a flag for each built-in writer (--stdout, --csv...), and
+    --format to pick any writer by name, including plugins
+    """
+    command = click.option('--format', 'output_format', type=OutputFormat(),
+                           help="Output format, including ones added by plugins.")(command)
+    for name, (_, help) in reversed(list(WRITERS.items())):
+        extra = {'default': True} if name == 'stdout' else {}
+        command = click.option('--' + name, 'output_format', flag_value=name,
+                               help=help, **extra)(command)
+    return command
+
+
+class TeamCode(click.ParamType):
+    """A team code from teams.json, only loaded when the option is used"""
+
+    name = 'team'
+
+    def convert(self, value, param, ctx):
+        if value not in TEAM_NAMES:
+            self.fail('invalid choice: {0}. (run --list to see all team codes)'.format(
+                      value), param, ctx)
+        return value
+
+
+class Date(click.ParamType):
+    """A date in YYYY-MM-DD format"""
+
+    name = 'date'
+
+    def convert(self, value, param, ctx):
+        import datetime
+        if isinstance(value, datetime.date):
+            return value
+        try:
+            return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            self.fail('{0} is not a valid date (YYYY-MM-DD)'.format(value), param, ctx)
+
+
+class TimeZone(click.ParamType):
+    """An IANA time zone name, eg. Europe/London"""
+
+    name = 'timezone'
+
+    def convert(self, value, param, ctx):
+        from soccer.localtime import get_zone
+        if not isinstance(value, str):
+            return value
+        try:
+            return get_zone(value)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
 
 
 def get_input_key():
     """Input API key and validate"""
     click.secho("No API key found!", fg="yellow", bold=True)
-    click.secho("Please visit {} and get an API token.".format(RequestHandler.BASE_URL),
+    click.secho("Please visit {} and get an API token.".format(API_URL),
                 fg="yellow",
                 bold=True)
     while True:
@@ -67,37 +157,79 @@ def load_config_key():
                         'Please visit {0} and get an API Token, '
                         'which will be used by Soccer CLI '
                         'to get access to the data.'
-                        .format(RequestHandler.BASE_URL), fg="red", bold=True)
+                        .format(API_URL), fg="red", bold=True)
             sys.exit(1)
     return api_token
 
 
 def map_team_id(code):
     """Take in team ID, read JSON file to map ID to name"""
-    for team in TEAM_DATA:
-        if team["code"] == code:
-            click.secho(team["name"], fg="green")
-            break
+    team = TEAM_NAMES.team(code)
+    if team is not None:
+        click.secho(team["name"], fg="green")
     else:
         click.secho("No team found for this code", fg="red", bold=True)
 
 
 def list_team_codes():
     """List team names in alphabetical order of team ID, per league."""
-    # Sort teams by league, then alphabetical by code
-    cleanlist = sorted(TEAM_DATA, key=lambda k: (k["league"]["name"], k["code"]))
-    # Get league names
-    leaguenames = sorted(list(set([team["league"]["name"] for team in cleanlist])))
-    for league in leaguenames:
-        teams = [team for team in cleanlist if team["league"]["name"] == league]
+    for league in TEAM_NAMES.leagues():
         click.secho(league, fg="green", bold=True)
-        for team in teams:
+        for team in TEAM_NAMES.league_teams(league):
             if team["code"] != "null":
                 click.secho(u"{0}: {1}".format(team["code"], team["name"]), fg="yellow")
         click.secho("")
 
 
-@click.command()
+def start_profiler(profile, profile_file):
+    """
+    Returns a Profiler that reports when the command finishes: a summary
+    on stderr with --profile and/or an export to --profile-file. Returns
+    None when the run isn't profiled.
+    """
+    if not profile and not profile_file:
+        return None
+    from soccer.profiler import Profiler
+
+    profiler = Profiler()
+
+    def report():
+        if profile:
+            click.echo('\n'.join(profiler.summary()), err=True)
+        if profile_file:
+            profiler.export(profile_file)
+    click.get_current_context().call_on_close(report)
+    return profiler
+
+
+def get_request_handler(apikey, writer, no_cache=False, cache_ttl=None,
+                        offline=False, local=False, use_daemon=True, profiler=None):
+    """
+    Creates a RequestHandler using the response cache, rate limiter and,
+    when there is one, the local match store. Requests go through a
+    running soccer serve daemon unless use_daemon is False.
+    """
+    from soccer.cache import MatchWindows, ResponseCache
+    from soccer.daemon import find_daemon
+    from soccer.ratelimit import DEFAULT_LOCK_FILE, RateLimiter
+    from soccer.request_handler import MAX_RETRIES, RequestHandler
+    from soccer.store import DEFAULT_STORE, MatchStore
+
+    headers = {'X-Auth-Token': apikey}
+    cache = None if no_cache and not offline else ResponseCache(ttl=cache_ttl)
+    store = MatchStore(DEFAULT_STORE) if os.path.exists(DEFAULT_STORE) else None
+    daemon = find_daemon() if use_daemon and not no_cache else None
+    daemon_url, daemon_secret = daemon or (None, None)
+    return RequestHandler(headers, LEAGUE_IDS, TEAM_NAMES, writer, cache,
+                          rate_limiter=RateLimiter(lock_file=DEFAULT_LOCK_FILE),
+                          max_retries=MAX_RETRIES, store=store, offline=offline,
+                          local_standings=local,
+                          daemon_url=daemon_url, daemon_secret=daemon_secret,
+                          windows=MatchWindows(cache) if cache is not None else None,
+                          profiler=profiler)
+
+
+@click.group(invoke_without_command=True)
 @click.option('--apikey', default=load_config_key,
               help="API key to use.")
 @click.option('--list', 'listcodes', is_flag=True,
@@ -106,13 +238,19 @@ def list_team_codes():
               help="Shows live scores from various leagues.")
 @click.option('--use12hour', is_flag=True, default=False,
               help="Displays the time using 12 hour format instead of 24 (default).")
+@click.option('--tz', type=TimeZone(), default=None,
+              help="Show kickoff times in this time zone (eg. Europe/London) "
+                   "instead of the system's.")
 @click.option('--standings', '-s', is_flag=True,
               help="Standings for a particular league.")
-@click.option('--league', '-l', type=click.Choice(LEAGUE_IDS.keys()),
-              help=("Select fixtures from a particular league."))
+@click.option('--league', '-l', type=LeagueList(),
+              help=("Select fixtures from a particular league, or several "
+                    "comma separated leagues (eg. PL,BL,SA)."))
+@click.option('--all-leagues', is_flag=True, default=False,
+              help="Select fixtures or standings from every supported league.")
 @click.option('--players', is_flag=True,
               help="Shows players for a particular team.")
-@click.option('--team', type=click.Choice(TEAM_NAMES.keys()),
+@click.option('--team', type=TeamCode(),
               help=("Choose a particular team's fixtures."))
 @click.option('--lookup', is_flag=True,
               help="Get full team name from team code when used with --team command.")
@@ -122,16 +260,27 @@ def list_team_codes():
                     "in the future when used with --upcoming"))
 @click.option('--upcoming', is_flag=True, default=False,
               help="Displays upcoming games when used with --time command.")
-@click.option('--stdout', 'output_format', flag_value='stdout', default=True,
-              help="Print to stdout.")
-@click.option('--csv', 'output_format', flag_value='csv',
-              help='Output in CSV format.')
-@click.option('--json', 'output_format', flag_value='json',
-              help='Output in JSON format.')
+@output_format_options
 @click.option('-o', '--output-file', default=None,
-              help="Save output to a file (only if csv or json option is provided).")
-def main(league, time, standings, team, live, use12hour, players,
-         output_format, output_file, upcoming, lookup, listcodes, apikey):
+              help="Save output to a file (any format but stdout). For parquet and "
+                   "arrow, an existing directory gets a new part file per run.")
+@click.option('--no-cache', is_flag=True, default=False,
+              help="Always fetch fresh data instead of using the response cache.")
+@click.option('--cache-ttl', type=int, default=None,
+              help="Seconds a cached response stays fresh (overrides per-endpoint defaults).")
+@click.option('--offline', is_flag=True, default=False,
+              help="Answer from locally stored data without using the network.")
+@click.option('--local', is_flag=True, default=False,
+              help="Compute standings from the matches in the local match store.")
+@click.option('--profile', is_flag=True, default=False,
+              help="Print where the time went (requests, decoding, rendering) on stderr.")
+@click.option('--profile-file', type=click.Path(dir_okay=False), default=None,
+              help="Save timings and counters to this file, as json or, when it "
+                   "ends in .prom, in the Prometheus text format.")
+@click.pass_context
+def main(ctx, league, all_leagues, time, standings, team, live, use12hour, tz, players,
+         output_format, output_file, upcoming, lookup, listcodes, apikey,
+         no_cache, cache_ttl, offline, local, profile, profile_file):
     """
     A CLI for live and past football scores from various football leagues.
 
@@ -151,18 +300,36 @@ def main(league, time, standings, team, live, use12hour, players,
     - PD: Primera Division
     - BSA: Brazil Serie A
     """
-    headers = {'X-Auth-Token': apikey}
+    if ctx.invoked_subcommand is not None:
+        ctx.obj = ctx.params
+        return
+
+    if all_leagues:
+        league = sorted(LEAGUE_IDS)
+        if standings:
+            league.remove('CL')
+    if league and len(league) == 1:
+        league = league[0]
+
+    if listcodes:
+        list_team_codes()
+        return
+
+    if team and lookup:
+        map_team_id(team)
+        return
 
     try:
         if output_format == 'stdout' and output_file:
             raise IncorrectParametersException('Printing output to stdout and '
                                                'saving to a file are mutually exclusive')
-        writer = get_writer(output_format, output_file)
-        rh = RequestHandler(headers, LEAGUE_IDS, TEAM_NAMES, writer)
-
-        if listcodes:
-            list_team_codes()
-            return
+        try:
+            writer = get_writer(output_format, output_file, tz)
+        except ImportError as e:
+            raise click.ClickException(str(e))
+        ctx.call_on_close(writer.close)
+        rh = get_request_handler(apikey, writer, no_cache, cache_ttl, offline, local,
+                                 profiler=start_profiler(profile, profile_file))
 
         if live:
             rh.get_live_scores(use12hour)
@@ -172,16 +339,13 @@ def main(league, time, standings, team, live, use12hour, players,
             if not league:
                 raise IncorrectParametersException('Please specify a league. '
                                                    'Example --standings --league=PL')
-            if league == 'CL':
+            if 'CL' in (league if isinstance(league, list) else [league]):
                 raise IncorrectParametersException('Standings for CL - '
                                                    'Champions League not supported')
             rh.get_standings(league)
             return
 
         if team:
-            if lookup:
-                map_team_id(team)
-                return
             if players:
                 rh.get_team_players(team)
                 return
@@ -194,5 +358,209 @@ def main(league, time, standings, team, live, use12hour, players,
         click.secho(str(e), fg="red", bold=True)
 
 
+@main.command()
+@click.option('--min-interval', default=30,
+              help="Seconds between polls while matches are in play.")
+@click.option('--max-interval', default=300,
+              help="Longest wait between polls when no matches are in play.")
+@click.pass_obj
+def watch(params, min_interval, max_interval):
+    """Keep showing live scores, printing only the ones that change."""
+    from soccer.watch import LiveWatcher
+
+    writer = get_writer('stdout', tz=params['tz'])
+    rh = get_request_handler(params['apikey'], writer)
+    watcher = LiveWatcher(rh, writer, min_interval, max_interval)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+@click.option('--league', '-l', type=LeagueList(), required=True,
+              help="League to backfill, or several comma separated leagues.")
+@click.option('--from', 'date_from', type=Date(), required=True,
+              help="First day to fetch (YYYY-MM-DD).")
+@click.option('--to', 'date_to', type=Date(), required=True,
+              help="Last day to fetch (YYYY-MM-DD).")
+@click.option('--window', default=10,
+              help="Number of days fetched per request.")
+@click.option('--store', 'store_path', default=None,
+              help="SQLite file to store the matches in.")
+@click.pass_obj
+def backfill(params, league, date_from, date_to, window, store_path):
+    """Fetch all matches between two dates into a local match store."""
+    from soccer.backfill import backfill as backfill_league
+    from soccer.store import DEFAULT_STORE, MatchStore
+
+    if date_from > date_to:
+        raise click.BadParameter('--from must be before --to')
+    rh = get_request_handler(params['apikey'], None, no_cache=True)
+    store = MatchStore(store_path or DEFAULT_STORE)
+
+    def progress(dates, count):
+        click.secho("{0} {1} to {2}: {3} matches".format(code, dates[0], dates[1], count),
+                    fg="green")
+
+    try:
+        for code in league:
+            fetched, stored, failed = backfill_league(rh, store, code, date_from,
+                                                      date_to, window, progress=progress)
+            click.secho("{0}: stored {1} matches from {2} windows".format(
+                        code, stored, fetched), fg="green", bold=True)
+            for dates, error in failed:
+                click.secho("{0} {1} to {2}: {3}".format(code, dates[0], dates[1],
+                                                         error.args[0]),
+                            fg="red", bold=True)
+    finally:
+        store.close()
+
+
+@main.command()
+@click.option('--port', default=8642,
+              help="Port to listen on (on 127.0.0.1).")
+@click.option('--verbose', is_flag=True, default=False,
+              help="Log every request.")
+@click.pass_obj
+def serve(params, port, verbose):
+    """Share one cache and API rate limit between soccer commands."""
+    from soccer.daemon import Daemon
+
+    rh = get_request_handler(params['apikey'], None, params['no_cache'],
+                             params['cache_ttl'], use_daemon=False)
+    try:
+        daemon = Daemon(rh, port=port, verbose=verbose)
+    except (IOError, OSError) as e:
+        raise click.ClickException('Could not listen on port {0}: {1}'.format(port, e))
+    click.secho("Serving API requests on {0}".format(daemon.url), fg="green", bold=True)
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+@click.option('--add', type=TeamCode(), multiple=True,
+              help="Add a team to your favourites (can be repeated).")
+@click.option('--remove', multiple=True,
+              help="Remove a team from your favourites (can be repeated).")
+@click.option('--time', default=6,
+              help=("The number of days in the past for which you "
+                    "want to see the scores, or the number of days "
+                    "in the future when used with --upcoming"))
+@click.option('--upcoming', is_flag=True, default=False,
+              help="Displays upcoming games when used with --time command.")
+@click.pass_obj
+def mine(params, add, remove, time, upcoming):
+    """Fixtures of your favourite teams, all in one list."""
+    from soccer.favourites import load_favourites, save_favourites
+
+    favourites = load_favourites()
+    if add or remove:
+        remove = [code.upper() for code in remove]
+        favourites = [code for code in favourites if code not in remove]
+        favourites.extend(code for code in add if code not in favourites)
+        save_favourites(favourites)
+        click.secho("Your teams: {0}".format(', '.join(favourites) or 'none'), fg="green")
+        return
+    if not favourites:
+        click.secho("You have no favourite teams yet. "
+                    "Add some with: soccer mine --add AFC --add BAY", fg="red", bold=True)
+        return
+
+    try:
+        if params['output_format'] == 'stdout' and params['output_file']:
+            raise IncorrectParametersException('Printing output to stdout and '
+                                               'saving to a file are mutually exclusive')
+        try:
+            writer = get_writer(params['output_format'], params['output_file'], params['tz'])
+        except ImportError as e:
+            raise click.ClickException(str(e))
+        click.get_current_context().call_on_close(writer.close)
+        rh = get_request_handler(params['apikey'], writer, params['no_cache'],
+                                 params['cache_ttl'], params['offline'],
+                                 profiler=start_profiler(params['profile'],
+                                                         params['profile_file']))
+        rh.get_favourite_scores(favourites, time, upcoming, params['use12hour'])
+    except IncorrectParametersException as e:
+        click.secho(str(e), fg="red", bold=True)
+
+
+def format_record(record):
+    """Formats a results record as 'P 10 W 5 D 3 L 2 GF 15 GA 9'"""
+    return 'P {played} W {won} D {draw} L {lost} GF {goalsFor} GA {goalsAgainst}'.format(
+        **record)
+
+
+@main.command()
+@click.option('--team', type=TeamCode(),
+              help="Show the form, home/away record and goals of one team.")
+@click.option('--against', type=TeamCode(),
+              help="Show the head-to-head record of --team against this team.")
+@click.option('--league', '-l', type=LeagueList(),
+              help="Only count matches of this league (or comma separated leagues).")
+@click.option('--last', default=5,
+              help="Number of recent matches used for the form guide.")
+@click.option('--from', 'date_from', type=Date(),
+              help="First day of matches to count (YYYY-MM-DD).")
+@click.option('--to', 'date_to', type=Date(),
+              help="Last day of matches to count (YYYY-MM-DD).")
+@click.option('--store', 'store_path', default=None,
+              help="SQLite file the matches were backfilled into.")
+@click.pass_obj
+def stats(params, team, against, league, last, date_from, date_to, store_path):
+    """Statistics computed from the matches in the local match store."""
+    from soccer.matchframe import MatchFrame
+    from soccer.store import DEFAULT_STORE, MatchStore
+
+    path = store_path or DEFAULT_STORE
+    if not os.path.exists(path):
+        raise click.ClickException('No match store found. '
+                                   'Fetch matches with soccer backfill first.')
+    if against and not team:
+        raise click.BadParameter('--against needs --team')
+    filters = {'team_id': team and int(TEAM_NAMES[team]),
+               'date_from': date_from and date_from.isoformat(),
+               'date_to': date_to and date_to.isoformat()}
+    store = MatchStore(path)
+    try:
+        matches = []
+        for code in league or [None]:
+            matches.extend(store.matches(competition_id=LEAGUE_IDS.get(code), **filters))
+    finally:
+        store.close()
+    try:
+        frame = MatchFrame.from_matches(matches)
+    except ImportError as e:
+        raise click.ClickException(str(e))
+    if not frame.finished().any():
+        click.secho("No finished matches stored for this query.", fg="red", bold=True)
+        return
+
+    if team is None:
+        click.secho("{0:<30} {1:>3} {2:>7} {3:>7}".format("Team", "P", "GF/G", "GA/G"),
+                    bold=True)
+        for team_id, name, played, scored, conceded in frame.goals_per_game():
+            click.secho(u"{0:<30} {1:>3} {2:>7.2f} {3:>7.2f}".format(
+                        name, played, scored, conceded))
+        return
+
+    team_id = int(TEAM_NAMES[team])
+    click.secho(TEAM_NAMES.team(team)['name'], fg="green", bold=True)
+    overall = frame.record(team_id)
+    click.secho("Form (last {0}): {1}".format(last, frame.form(team_id, last)))
+    click.secho("Overall: {0}".format(format_record(overall)))
+    for venue, venue_record in sorted(frame.splits(team_id).items(), reverse=True):
+        click.secho("{0}: {1}".format(venue.capitalize(), format_record(venue_record)))
+    click.secho("Goals per game: {0:.2f} scored, {1:.2f} conceded".format(
+                overall['goalsFor'] / float(overall['played'] or 1),
+                overall['goalsAgainst'] / float(overall['played'] or 1)))
+    if against:
+        click.secho("Head to head against {0}: {1}".format(
+                    TEAM_NAMES.team(against)['name'],
+                    format_record(frame.head_to_head(team_id, int(TEAM_NAMES[against])))))
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,153 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STATUSES = ('SCHEDULED', 'TIMED', 'LIVE', 'IN_PLAY', 'PAUSED', 'FINISHED',
+            'POSTPONED', 'SUSPENDED', 'CANCELED', 'AWARDED')
+FINISHED = STATUSES.index('FINISHED')
+NO_SCORE = -1
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError('MatchFrame requires numpy. '
+                          'Install it with: pip install soccer-cli[stats]')
+
+
+def record(scored, conceded):
+    """Summarises goals scored and conceded per match as a results record"""
+    return {'played': int(scored.size),
+            'won': int(np.count_nonzero(scored > conceded)),
+            'draw': int(np.count_nonzero(scored == conceded)),
+            'lost': int(np.count_nonzero(scored < conceded)),
+            'goalsFor': int(scored.sum()),
+            'goalsAgainst': int(conceded.sum())}
+
+
+class MatchFrame(object):
+    """
+    Columnar table of matches for aggregate statistics.
+
+    Each column is a NumPy array with one entry per match. Teams,
+    competitions and statuses are stored as small integer codes into the
+    teams, competitions and STATUSES lists, and matches without a score
+    have NO_SCORE goals. Build one with MatchFrame.from_matches.
+    """
+
+    def __init__(self, columns, teams, team_names, competitions):
+        self.columns = columns
+        self.teams = teams
+        self.team_names = team_names
+        self.competitions = competitions
+        self._team_codes = dict((team_id, code) for code, team_id in enumerate(teams))
+        for name, column in columns.items():
+            setattr(self, name, column)
+
+    def __len__(self):
+        return len(self.id)
+
+    @classmethod
+    def from_matches(cls, matches):
+        """Builds a frame from matches in the football-data api structure"""
+        require_numpy()
+        team_codes = {}
+        team_names = []
+        competition_codes = {}
+        status_codes = dict((status, code) for code, status in enumerate(STATUSES))
+        rows = []
+        for match in matches:
+            codes = []
+            for side in ('homeTeam', 'awayTeam'):
+                team = match[side]
+                if team['id'] not in team_codes:
+                    team_codes[team['id']] = len(team_codes)
+                    team_names.append(team.get('name'))
+                codes.append(team_codes[team['id']])
+            competition = (match.get('competition') or {}).get('id')
+            competition = competition_codes.setdefault(competition, len(competition_codes))
+            score = match['score']['fullTime']
+            rows.append((match['id'], competition, codes[0], codes[1],
+                         NO_SCORE if score['homeTeam'] is None else score['homeTeam'],
+                         NO_SCORE if score['awayTeam'] is None else score['awayTeam'],
+                         match['utcDate'][:19],
+                         status_codes.get(match['status'], len(STATUSES))))
+        columns = dict(zip(
+            ('id', 'competition', 'home', 'away', 'home_goals', 'away_goals', 'date', 'status'),
+            (np.array(column, dtype=dtype) for column, dtype in zip(
+                zip(*rows) if rows else [()] * 8,
+                ('int64', 'int32', 'int32', 'int32', 'int16', 'int16',
+                 'datetime64[s]', 'int8')))))
+        return cls(columns, list(team_codes), team_names, list(competition_codes))
+
+    def team_code(self, team_id):
+        """Returns the frame's code for an api team id, or None"""
+        return self._team_codes.get(team_id)
+
+    def finished(self):
+        return self.status == FINISHED
+
+    def _team_matches(self, team_id, opponent_id=None):
+        """
+        Returns (goals scored, goals conceded, home) arrays for the finished
+        matches of a team, optionally only those against an opponent,
+        ordered by kickoff
+        """
+        team = self.team_code(team_id)
+        at_home = self.home == team
+        away = self.away == team
+        if opponent_id is not None:
+            opponent = self.team_code(opponent_id)
+            at_home &= self.away == opponent
+            away &= self.home == opponent
+        index = np.flatnonzero((at_home | away) & self.finished())
+        index = index[np.argsort(self.date[index], kind='stable')]
+        at_home = at_home[index]
+        scored = np.where(at_home, self.home_goals[index], self.away_goals[index])
+        conceded = np.where(at_home, self.away_goals[index], self.home_goals[index])
+        return scored, conceded, at_home
+
+    def record(self, team_id):
+        """Returns the results record of a team over every finished match"""
+        scored, conceded, _ = self._team_matches(team_id)
+        return record(scored, conceded)
+
+    def splits(self, team_id):
+        """Returns a team's results records at home and away"""
+        scored, conceded, at_home = self._team_matches(team_id)
+        return {'home': record(scored[at_home], conceded[at_home]),
+                'away': record(scored[~at_home], conceded[~at_home])}
+
+    def form(self, team_id, last=5):
+        """Returns the results of a team's last matches, oldest first, eg. 'WWDLW'"""
+        scored, conceded, _ = self._team_matches(team_id)
+        results = np.sign(scored[-last:] - conceded[-last:]) if last else scored[:0]
+        return ''.join('LDW'[result + 1] for result in results.tolist())
+
+    def head_to_head(self, team_id, opponent_id):
+        """Returns the results record of a team against one opponent"""
+        scored, conceded, _ = self._team_matches(team_id, opponent_id)
+        return record(scored, conceded)
+
+    def goals_per_game(self):
+        """
+        Returns (team id, team name, played, scored per game, conceded per
+        game) for every team with a finished match, most goals first
+        """
+        done = self.finished()
+        size = len(self.teams)
+        home, away = self.home[done], self.away[done]
+        home_goals, away_goals = self.home_goals[done], self.away_goals[done]
+        played = (np.bincount(home, minlength=size) +
+                  np.bincount(away, minlength=size))
+        scored = (np.bincount(home, home_goals, minlength=size) +
+                  np.bincount(away, away_goals, minlength=size))
+        conceded = (np.bincount(home, away_goals, minlength=size) +
+                    np.bincount(away, home_goals, minlength=size))
+        teams = np.flatnonzero(played)
+        scored = scored[teams] / played[teams]
+        conceded = conceded[teams] / played[teams]
+        order = np.lexsort((conceded, -scored))
+        return [(self.teams[team], self.team_names[team], int(played[team]),
+                 float(scored[i]), float(conceded[i]))
+                for i, team in ((i, teams[i]) for i in order)]
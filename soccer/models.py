@@ -0,0 +1,129 @@
+"""
+Compact records for the data the writers display.
+
+API responses are parsed into these once, in RequestHandler, so writers
+read plain attributes instead of digging through nested dicts, and
+formatting for display never changes the parsed data.
+"""
+
+
+class Team(object):
+
+    __slots__ = ('id', 'name')
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def from_api(cls, data):
+        return cls(data.get('id'), data['name'])
+
+
+class Match(object):
+
+    __slots__ = ('id', 'utc_date', 'status', 'competition', 'home_team',
+                 'away_team', 'home_goals', 'away_goals', 'time')
+
+    def __init__(self, id, utc_date, status, competition, home_team, away_team,
+                 home_goals, away_goals, time=None):
+        self.id = id
+        self.utc_date = utc_date
+        self.status = status
+        self.competition = competition
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.time = time
+
+    @property
+    def date(self):
+        """The kickoff day, YYYY-MM-DD"""
+        return self.utc_date.split('T')[0]
+
+    @property
+    def finished(self):
+        return self.status == 'FINISHED'
+
+    @classmethod
+    def from_api(cls, data, competition=None):
+        """Parses a match, defaulting to the given competition name"""
+        score = data['score']['fullTime']
+        return cls(data.get('id'), data.get('utcDate'), data.get('status'),
+                   (data.get('competition') or {}).get('name', competition),
+                   Team.from_api(data['homeTeam']), Team.from_api(data['awayTeam']),
+                   score['homeTeam'], score['awayTeam'])
+
+    @classmethod
+    def from_live(cls, game):
+        """Parses a game from the live scores feed"""
+        return cls(None, None, 'IN_PLAY', game['league'],
+                   Team(None, game['homeTeamName']), Team(None, game['awayTeamName']),
+                   game['goalsHomeTeam'], game['goalsAwayTeam'], game['time'])
+
+
+class Player(object):
+
+    __slots__ = ('name', 'position', 'shirt_number', 'nationality',
+                 'date_of_birth', 'role', 'team')
+
+    def __init__(self, name, position, shirt_number, nationality, date_of_birth,
+                 role='PLAYER', team=None):
+        self.name = name
+        self.position = position
+        self.shirt_number = shirt_number
+        self.nationality = nationality
+        self.date_of_birth = date_of_birth
+        self.role = role
+        self.team = team if team is not None else Team(None, None)
+
+    @classmethod
+    def from_api(cls, data, team=None):
+        """Parses a squad member of team, the Team whose squad it is"""
+        return cls(data['name'], data['position'], data['shirtNumber'],
+                   data['nationality'], data['dateOfBirth'], data.get('role', 'PLAYER'),
+                   team)
+
+
+class TableRow(object):
+
+    __slots__ = ('position', 'team', 'played_games', 'won', 'draw', 'lost',
+                 'points', 'goals_for', 'goals_against', 'goal_difference')
+
+    def __init__(self, position, team, played_games, won, draw, lost, points,
+                 goals_for, goals_against, goal_difference):
+        self.position = position
+        self.team = team
+        self.played_games = played_games
+        self.won = won
+        self.draw = draw
+        self.lost = lost
+        self.points = points
+        self.goals_for = goals_for
+        self.goals_against = goals_against
+        self.goal_difference = goal_difference
+
+    @classmethod
+    def from_api(cls, data):
+        return cls(data['position'], Team.from_api(data['team']), data['playedGames'],
+                   data.get('won'), data.get('draw'), data.get('lost'), data['points'],
+                   data['goalsFor'], data['goalsAgainst'], data['goalDifference'])
+
+
+def parse_matches(data):
+    """Parses the matches of a matches response"""
+    competition = (data.get('competition') or {}).get('name')
+    return [Match.from_api(match, competition) for match in data['matches']]
+
+
+def parse_table(data):
+    """Parses the total table of a standings response"""
+    for standing in data.get('standings', ()):
+        if standing.get('type', 'TOTAL') == 'TOTAL':
+            return [TableRow.from_api(row) for row in standing['table']]
+    return []
+
+
+def parse_players(squad, team=None):
+    return [Player.from_api(player, team) for player in squad]
@@ -0,0 +1,75 @@
+import datetime
+import json
+import re
+import time
+
+MATCHES_URL = re.compile(r'^(?:(competitions|teams)/(\d+)/)?matches\?timeFrame=([pn])(\d+)$')
+STANDINGS_URL = re.compile(r'^competitions/(\d+)/standings$')
+
+
+class OfflineResponse(object):
+    """
+    A response rebuilt from local data, like the match store.
+
+    Quacks like the parts of ``requests.Response`` that RequestHandler uses.
+    """
+
+    status_code = 200
+
+    def __init__(self, data, stored):
+        self.data = data
+        self.stored = stored
+        self.headers = {}
+
+    @property
+    def text(self):
+        return json.dumps(self.data)
+
+    def json(self):
+        return self.data
+
+
+def format_age(seconds):
+    """Describes how long ago something happened, eg. '3 hours ago'"""
+    for unit, length in (('day', 86400), ('hour', 3600), ('minute', 60)):
+        if seconds >= length:
+            count = int(seconds // length)
+            return '{0} {1}{2} ago'.format(count, unit, 's' if count > 1 else '')
+    return 'just now'
+
+
+def time_frame_dates(time_frame, days, today=None):
+    """Returns the (first, last) dates of a timeFrame=p{days}/n{days} query"""
+    today = today or datetime.date.today()
+    delta = datetime.timedelta(days=int(days))
+    if time_frame == 'p':
+        return today - delta, today
+    return today, today + delta
+
+
+def matches_from_store(store, url, league_ids, today=None):
+    """
+    Answers a timeFrame matches query from the stored matches, or returns
+    None if url isn't such a query or no stored match falls in the window.
+    """
+    query = MATCHES_URL.match(url)
+    if query is None:
+        return None
+    resource, resource_id, time_frame, days = query.groups()
+    date_from, date_to = time_frame_dates(time_frame, days, today)
+    filters = {'date_from': date_from.isoformat(), 'date_to': date_to.isoformat()}
+    if resource == 'competitions':
+        filters['competition_id'] = int(resource_id)
+    elif resource == 'teams':
+        filters['team_id'] = int(resource_id)
+    matches = store.matches(**filters)
+    if not matches:
+        return None
+    codes = dict((league_id, code) for code, league_id in league_ids.items())
+    for match in matches:
+        competition = match.setdefault('competition', {})
+        competition.setdefault('name', codes.get(competition.get('id'), 'Unknown'))
+    data = {'matches': matches}
+    if resource == 'competitions':
+        data['competition'] = matches[0]['competition']
+    return OfflineResponse(data, store.last_updated(**filters) or time.time())
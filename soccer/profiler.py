@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+# Order of the phases in reports, other spans follow alphabetically.
+PHASES = ['rate_limit_wait', 'http', 'decode', 'transform', 'render']
+
+
+class Profiler(object):
+    """
+    Timing spans and counters for one soccer run.
+
+    Spans add up the time spent in each phase (http, decode, transform,
+    render...), counters the requests made, bytes received and cache hits,
+    and gauges keep the last value seen, like the remaining API quota.
+    Spans running in several threads at once are summed, so a phase can
+    take longer than the whole run.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.spans = {}
+        self.counters = {}
+        self.gauges = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            with self._lock:
+                span = self.spans.setdefault(name, {'count': 0, 'seconds': 0.0, 'max': 0.0})
+                span['count'] += 1
+                span['seconds'] += elapsed
+                span['max'] = max(span['max'], elapsed)
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def response(self, response):
+        """Counts a response from the API: its size and the quota left"""
+        self.count('requests')
+        self.count('bytes_received', len(response.content))
+        remaining = response.headers.get('X-Requests-Available-Minute')
+        if remaining is not None:
+            self.gauge('rate_limit_remaining', int(remaining))
+
+    def span_names(self):
+        return ([name for name in PHASES if name in self.spans] +
+                sorted(name for name in self.spans if name not in PHASES))
+
+    def as_dict(self):
+        with self._lock:
+            return {'timestamp': time.time(),
+                    'seconds': self.clock() - self.started,
+                    'spans': dict((name, dict(span)) for name, span in self.spans.items()),
+                    'counters': dict(self.counters),
+                    'gauges': dict(self.gauges)}
+
+    def summary(self):
+        """Returns the lines of a human readable report"""
+        data = self.as_dict()
+        lines = ['{0:<16}{1:>7}{2:>12}{3:>12}'.format('phase', 'calls', 'total ms', 'max ms')]
+        for name in self.span_names():
+            span = data['spans'][name]
+            lines.append('{0:<16}{1:>7}{2:>12.1f}{3:>12.1f}'.format(
+                name, span['count'], span['seconds'] * 1000, span['max'] * 1000))
+        lines.append('{0:<16}{1:>7}{2:>12.1f}'.format('run', '', data['seconds'] * 1000))
+        hits = data['counters'].get('cache_hits', 0)
+        lookups = hits + data['counters'].get('cache_misses', 0)
+        if lookups:
+            lines.append('cache hit rate: {0:.0%} of {1}'.format(float(hits) / lookups, lookups))
+        for name, value in sorted(data['counters'].items()) + sorted(data['gauges'].items()):
+            lines.append('{0}: {1}'.format(name.replace('_', ' '), value))
+        return lines
+
+    def prometheus(self):
+        """Returns the metrics in the Prometheus text exposition format"""
+        data = self.as_dict()
+        lines = ['# TYPE soccer_run_seconds gauge',
+                 'soccer_run_seconds {0}'.format(data['seconds'])]
+        for metric, key, kind in (('soccer_span_seconds_total', 'seconds', 'counter'),
+                                  ('soccer_span_calls_total', 'count', 'counter'),
+                                  ('soccer_span_max_seconds', 'max', 'gauge')):
+            lines.append('# TYPE {0} {1}'.format(metric, kind))
+            for name in self.span_names():
+                lines.append('{0}{{phase="{1}"}} {2}'.format(metric, name,
+                                                             data['spans'][name][key]))
+        for name, value in sorted(data['counters'].items()):
+            lines.append('# TYPE soccer_{0}_total counter'.format(name))
+            lines.append('soccer_{0}_total {1}'.format(name, value))
+        for name, value in sorted(data['gauges'].items()):
+            lines.append('# TYPE soccer_{0} gauge'.format(name))
+            lines.append('soccer_{0} {1}'.format(name, value))
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path):
+        """
+        Writes the metrics to path, in the Prometheus text format when it
+        ends in .prom (for node_exporter's textfile collector), as json
+        otherwise. The file is replaced atomically.
+        """
+        if path.endswith('.prom'):
+            text = self.prometheus()
+        else:
+            text = json.dumps(self.as_dict(), indent=2, sort_keys=True)
+        tmp = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(tmp, 'w') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+
+class NullProfiler(object):
+    """Stands in for a Profiler when a run isn't being profiled"""
+
+    @contextmanager
+    def span(self, name):
+        yield
+
+    def count(self, name, value=1):
+        pass
+
+    def gauge(self, name, value):
+        pass
+
+    def response(self, response):
+        pass
@@ -0,0 +1,140 @@
+import email.utils
+import json
+import os
+import random
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+DEFAULT_LOCK_FILE = os.path.join(os.path.expanduser("~"), ".cache", "soccer-cli",
+                                 "ratelimit.lock")
+DEFAULT_CAPACITY = 10  # requests per minute on the free plan
+TOO_MANY_REQUESTS = 429
+PERIOD = 60.0
+MAX_BACKOFF = 60.0
+
+
+class RateLimiter(object):
+    """Token bucket limiting the number of API requests per minute.
+
+    The quota is learnt from the X-Requests-Available-Minute and
+    X-RequestCounter-Reset headers returned by football-data.org. A limiter
+    can be shared between threads, and between processes when a
+    ``lock_file`` is given (the bucket state is kept in that file).
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, lock_file=None,
+                 clock=time.time, sleep=time.sleep):
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self.lock_file = lock_file if fcntl is not None else None
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """Tokens added to the bucket per second"""
+        return self.capacity / PERIOD
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _locked(self, update):
+        """Runs update() on the bucket while holding the thread and file locks"""
+        with self._lock:
+            if self.lock_file is None:
+                return update()
+            directory = os.path.dirname(self.lock_file)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+            with open(self.lock_file, 'a+') as lfile:
+                fcntl.flock(lfile, fcntl.LOCK_EX)
+                try:
+                    lfile.seek(0)
+                    try:
+                        state = json.loads(lfile.read())
+                        self.capacity = state['capacity']
+                        self.tokens = state['tokens']
+                        self.updated = state['updated']
+                    except (ValueError, KeyError):
+                        pass
+                    result = update()
+                    lfile.seek(0)
+                    lfile.truncate()
+                    json.dump({'capacity': self.capacity, 'tokens': self.tokens,
+                               'updated': self.updated}, lfile)
+                    return result
+                finally:
+                    fcntl.flock(lfile, fcntl.LOCK_UN)
+
+    def acquire(self):
+        """Blocks until a request may be sent"""
+        def take():
+            self._refill(self.clock())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+        while True:
+            wait = self._locked(take)
+            if not wait:
+                return
+            self.sleep(wait)
+
+    def update(self, headers):
+        """Syncs the bucket with the quota reported in the response headers"""
+        try:
+            available = int(headers['X-Requests-Available-Minute'])
+        except (KeyError, TypeError, ValueError):
+            return
+        try:
+            reset = float(headers['X-RequestCounter-Reset'])
+        except (KeyError, TypeError, ValueError):
+            reset = PERIOD
+
+        def sync():
+            self.capacity = max(self.capacity, available + 1)
+            self.updated = self.clock()
+            if available > 0:
+                self.tokens = float(available)
+            else:
+                # the next token becomes available when the counter resets
+                self.tokens = 1 - reset * self.rate
+
+        self._locked(sync)
+
+
+def retry_delay(response, attempt, base=1.0):
+    """
+    Seconds to wait before retrying a throttled or failed request: the
+    server's Retry-After when given (or, for throttled requests, the
+    counter reset, which every response carries), otherwise exponential
+    backoff with full jitter.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    names = ['Retry-After']
+    if getattr(response, 'status_code', None) == TOO_MANY_REQUESTS:
+        names.append('X-RequestCounter-Reset')
+    for header in names:
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return min(float(value), MAX_BACKOFF)
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            continue
+        return min(max(0.0, retry_at - time.time()), MAX_BACKOFF)
+    return random.uniform(0, min(MAX_BACKOFF, base * 2 ** attempt))
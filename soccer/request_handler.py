@@ -1,6 +1,67 @@
+import time
+
 import requests
 import click
-from soccer.exceptions import APIErrorException
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from soccer.daemon import REASON_HEADER, SECRET_HEADER, STORED_HEADER
+from soccer.decoding import decode
+from soccer.exceptions import APIConnectionException, APIErrorException
+from soccer.models import Match, Team, parse_matches, parse_players, parse_table
+from soccer.offline import STANDINGS_URL, OfflineResponse, format_age, matches_from_store
+from soccer.profiler import NullProfiler
+from soccer.ratelimit import MAX_BACKOFF, retry_delay
+from soccer.standings import standings_from_store
+
+DEFAULT_TIMEOUT = (3.05, 15)  # connect, read (seconds)
+MAX_RETRIES = 3
+# The daemon may back off and retry before it answers, so wait for it longer
+DAEMON_TIMEOUT = (DEFAULT_TIMEOUT[0], (DEFAULT_TIMEOUT[1] + MAX_BACKOFF) * (MAX_RETRIES + 1))
+MAX_WORKERS = 8
+MATCHES_MAX_DAYS = 10  # longest time frame the all-competitions matches query allows
+
+API_ERRORS = {
+    requests.codes.bad: 'Invalid request. Check parameters.',
+    requests.codes.forbidden: 'This resource is restricted',
+    requests.codes.not_found: 'This resource does not exist. Check parameters',
+    requests.codes.too_many_requests: 'You have exceeded your allowed requests per minute/day',
+}
+RETRY_STATUSES = (
+    requests.codes.too_many_requests,
+    requests.codes.internal_server_error,
+    requests.codes.bad_gateway,
+    requests.codes.service_unavailable,
+    requests.codes.gateway_timeout,
+)
+
+
+def live_scores_data(scores):
+    """Converts the live scores feed to the football-data api structure"""
+    scores_data = []
+    for score in scores['games']:
+        d = {}
+        d['homeTeam'] = {'name': score['homeTeamName']}
+        d['awayTeam'] = {'name': score['awayTeamName']}
+        d['score'] = {'fullTime': {'homeTeam': score['goalsHomeTeam'],
+                                   'awayTeam': score['goalsAwayTeam']}}
+        d['league'] = score['league']
+        d['time'] = score['time']
+        scores_data.append(d)
+    return scores_data
+
+
+def make_session(pool_size=10):
+    """Creates a keep-alive session with a pooled adapter.
+
+    A session can be shared by many RequestHandlers (and threads) so they
+    all reuse the same connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+    return session
 
 
 class RequestHandler(object):
@@ -8,48 +69,244 @@ class RequestHandler(object):
     BASE_URL = 'http://api.football-data.org/v2/'
     LIVE_URL = 'http://soccer-cli.appspot.com/'
 
-    def __init__(self, headers, league_ids, team_names, writer):
+    def __init__(self, headers, league_ids, team_names, writer, cache=None,
+                 session=None, timeout=DEFAULT_TIMEOUT, rate_limiter=None,
+                 max_retries=0, store=None, offline=False, local_standings=False,
+                 daemon_url=None, daemon_secret=None, windows=None, profiler=None):
         self.headers = headers
         self.league_ids = league_ids
         self.team_names = team_names
         self.writer = writer
+        self.cache = cache
+        self.session = session if session is not None else make_session()
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.store = store
+        self.offline = offline
+        self.local_standings = local_standings
+        self.daemon_url = daemon_url
+        self.daemon_secret = daemon_secret
+        self.windows = windows
+        self.profiler = profiler if profiler is not None else NullProfiler()
+        self.tables = {}
+
+    def _request(self, url, headers):
+        """
+        Sends a request, pacing it through the rate limiter and retrying
+        throttled or failed responses with backoff
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                with self.profiler.span('rate_limit_wait'):
+                    self.rate_limiter.acquire()
+            try:
+                with self.profiler.span('http'):
+                    req = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.exceptions.RequestException:
+                raise APIConnectionException('Could not connect to the API. '
+                                             'Check your connection.')
+            self.profiler.response(req)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(req.headers)
+            if req.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                return req
+            time.sleep(retry_delay(req, attempt))
+            attempt += 1
 
     def _get(self, url):
-        """Handles api.football-data.org requests"""
-        req = requests.get(RequestHandler.BASE_URL + url, headers=self.headers)
+        """
+        Handles api.football-data.org requests, falling back to the local
+        data when offline or when the API can't be reached
+        """
+        if self.local_standings and STANDINGS_URL.match(url):
+            return self._get_local_standings(url)
+        if self.offline:
+            return self._get_offline(url)
+        try:
+            if self.windows is not None:
+                response = self.windows.get(url, self.headers,
+                                            lambda gap: self._json(self._get_remote(gap)))
+                if response is not None:
+                    return response
+            return self._get_remote(url)
+        except APIConnectionException as e:
+            if self.cache is None and self.store is None:
+                raise
+            return self._get_offline(url, e.args[0])
+
+    def _get_remote(self, url):
+        """Fetches url through the daemon when there is one, else from the API"""
+        if self.daemon_url is not None:
+            try:
+                return self._get_daemon(url)
+            except requests.exceptions.ConnectionError:
+                self.daemon_url = None  # the daemon went away, ask the API directly
+        return self._get_online(url)
+
+    def _get_daemon(self, url):
+        """
+        Sends a request through a running soccer serve daemon. Connection
+        errors are raised as they are, since the request never reached the
+        daemon; once it did, it isn't sent again.
+        """
+        try:
+            with self.profiler.span('http'):
+                req = self.session.get(self.daemon_url + url,
+                                       headers={SECRET_HEADER: self.daemon_secret or ''},
+                                       timeout=DAEMON_TIMEOUT)
+        except requests.exceptions.ConnectionError:
+            raise
+        except requests.exceptions.RequestException:
+            raise APIConnectionException('The soccer daemon did not answer.')
+        self.profiler.response(req)
+        if req.status_code == requests.codes.ok:
+            if STORED_HEADER in req.headers:
+                # the daemon couldn't reach the API either and answered with local data
+                self._local_data_note(req.headers.get(REASON_HEADER, ''),
+                                      float(req.headers[STORED_HEADER]))
+            return req
+        try:
+            message = req.json()['error']
+        except (ValueError, KeyError, TypeError):
+            message = 'Unexpected response from the soccer daemon ({0}).'.format(req.status_code)
+        raise APIErrorException(message)
+
+    def _get_offline(self, url, reason='Offline mode.'):
+        """Serves a request from the response cache, match windows or match store"""
+        response = None
+        if self.cache is not None:
+            response = self.cache.get(url, self.headers)
+        if response is None and self.windows is not None:
+            response = self.windows.get(url, self.headers)
+        if response is None and self.store is not None:
+            response = (matches_from_store(self.store, url, self.league_ids) or
+                        self._standings_from_store(url))
+        if response is None:
+            raise APIErrorException('{0} No local data is available for this '
+                                    'request.'.format(reason))
+        response.offline_reason = reason  # passed on to daemon clients
+        self._local_data_note(reason, response.stored)
+        return response
+
+    def _local_data_note(self, reason, stored):
+        click.secho('{0} Showing local data from {1}.'.format(
+                    reason, format_age(time.time() - stored)),
+                    fg="yellow", err=True)
+
+    def _standings_from_store(self, url):
+        """
+        Computes a standings response from the stored match results, or
+        returns None if url isn't a standings request or nothing is stored.
+        Tables are kept between calls and only fold in newer results.
+        """
+        query = STANDINGS_URL.match(url)
+        if query is None or self.store is None:
+            return None
+        competition_id = int(query.group(1))
+        table = self.tables.get(competition_id)
+        if table is None:
+            codes = dict((league_id, code) for code, league_id in self.league_ids.items())
+            table = standings_from_store(self.store, codes.get(competition_id),
+                                         competition_id)
+            if table is None:
+                return None
+            self.tables[competition_id] = table
+        else:
+            table.refresh(self.store)
+        if not table.records:
+            return None
+        return OfflineResponse(table.as_payload(),
+                               self.store.last_updated(competition_id=competition_id))
+
+    def _get_local_standings(self, url):
+        response = self._standings_from_store(url)
+        if response is None:
+            raise APIErrorException('No finished matches are stored for this '
+                                    'league. Fetch them with soccer backfill.')
+        return response
+
+    def _get_online(self, url):
+        headers = self.headers
+        cached = None
+        if self.cache is not None:
+            cached = self.cache.get(url, self.headers)
+            if cached is not None:
+                if cached.fresh:
+                    self.profiler.count('cache_hits')
+                    return cached
+                headers = dict(self.headers, **cached.validators())
+            self.profiler.count('cache_misses')
+        req = self._request(RequestHandler.BASE_URL + url, headers)
         status_code = req.status_code
+        if status_code == requests.codes.not_modified and cached is not None:
+            self.profiler.count('cache_revalidated')
+            return self.cache.revalidated(cached)
         if status_code == requests.codes.ok:
+            if self.cache is not None:
+                self.cache.set(url, self.headers, req)
             return req
-        elif status_code == requests.codes.bad:
-            raise APIErrorException('Invalid request. Check parameters.')
-        elif status_code == requests.codes.forbidden:
-            raise APIErrorException('This resource is restricted')
-        elif status_code == requests.codes.not_found:
-            raise APIErrorException('This resource does not exist. Check parameters')
-        elif status_code == requests.codes.too_many_requests:
-            raise APIErrorException('You have exceeded your allowed requests per minute/day')
+        elif status_code in API_ERRORS:
+            raise APIErrorException(API_ERRORS[status_code])
+        elif status_code in RETRY_STATUSES:
+            raise APIErrorException('The API is currently unavailable. '
+                                    'Please try again later.')
+        else:
+            raise APIErrorException('Unexpected response from the API '
+                                    '({0}).'.format(status_code))
+
+    def _json(self, response):
+        """Decodes a response's json"""
+        with self.profiler.span('decode'):
+            return decode(response)
+
+    def _matches(self, response):
+        """
+        Decodes a matches response into Match models, keeping only the
+        fields the writers use, so the decoded document can be freed
+        before rendering
+        """
+        data = self._json(response)
+        with self.profiler.span('transform'):
+            return parse_matches(data)
+
+    def _get_many(self, urls):
+        """
+        Fetches several urls concurrently through a bounded worker pool.
+        Returns the decoded json for each url in order, or the
+        APIErrorException raised while fetching it.
+        """
+        def fetch(url):
+            try:
+                return self._json(self._get(url))
+            except APIErrorException as e:
+                return e
+
+        workers = max(1, min(len(urls), MAX_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, urls))
 
     def get_live_scores(self, use_12_hour_format):
         """Gets the live scores"""
-        req = requests.get(RequestHandler.LIVE_URL)
+        if self.offline:
+            click.secho("Live scores are not available offline", fg="red", bold=True)
+            return
+        try:
+            with self.profiler.span('http'):
+                req = self.session.get(RequestHandler.LIVE_URL, timeout=self.timeout)
+        except requests.exceptions.RequestException:
+            click.secho("There was problem getting live scores", fg="red", bold=True)
+            return
         if req.status_code == requests.codes.ok:
-            scores_data = []
-            scores = req.json()
+            scores = self._json(req)
             if len(scores["games"]) == 0:
                 click.secho("No live action currently", fg="red", bold=True)
                 return
-
-            for score in scores['games']:
-                # match football-data api structure
-                d = {}
-                d['homeTeam'] = {'name': score['homeTeamName']}
-                d['awayTeam'] = {'name': score['awayTeamName']}
-                d['score'] = {'fullTime': {'homeTeam': score['goalsHomeTeam'],
-                                           'awayTeam': score['goalsAwayTeam']}}
-                d['league'] = score['league']
-                d['time'] = score['time']
-                scores_data.append(d)
-            self.writer.live_scores(scores_data)
+            with self.profiler.span('transform'):
+                matches = [Match.from_live(game) for game in scores['games']]
+            with self.profiler.span('render'):
+                self.writer.live_scores(matches)
         else:
             click.secho("There was problem getting live scores", fg="red", bold=True)
 
@@ -61,12 +318,14 @@ class RequestHandler(object):
             try:
                 req = self._get('teams/{team_id}/matches?timeFrame={time_frame}{time}'.format(
                             team_id=team_id, time_frame=time_frame, time=time))
-                team_scores = req.json()
-                if len(team_scores["matches"]) == 0:
+                team_scores = self._matches(req)
+                if len(team_scores) == 0:
                     click.secho("No action during past week. Change the time "
                                 "parameter to get more fixtures.", fg="red", bold=True)
                 else:
-                    self.writer.team_scores(team_scores, time, show_upcoming, use_12_hour_format)
+                    with self.profiler.span('render'):
+                        self.writer.team_scores(team_scores, time, show_upcoming,
+                                                use_12_hour_format)
             except APIErrorException as e:
                 click.secho(e.args[0],
                             fg="red", bold=True)
@@ -76,11 +335,17 @@ class RequestHandler(object):
 
     def get_standings(self, league):
         """Queries the API and gets the standings for a particular league"""
+        if isinstance(league, (list, tuple)):
+            return self.get_multi_league_standings(league)
         league_id = self.league_ids[league]
         try:
             req = self._get('competitions/{id}/standings'.format(
                         id=league_id))
-            self.writer.standings(req.json(), league)
+            data = self._json(req)
+            with self.profiler.span('transform'):
+                table = parse_table(data)
+            with self.profiler.span('render'):
+                self.writer.standings([(league, table)], league)
         except APIErrorException:
             # Click handles incorrect League codes so this will only come up
             # if that league does not have standings available. ie. Champions League
@@ -93,21 +358,25 @@ class RequestHandler(object):
         Queries the API and fetches the scores for fixtures
         based upon the league and time parameter
         """
+        if isinstance(league, (list, tuple)):
+            return self.get_multi_league_scores(league, time, show_upcoming,
+                                                use_12_hour_format)
         time_frame = 'n' if show_upcoming else 'p'
         if league:
             try:
                 league_id = self.league_ids[league]
                 req = self._get('competitions/{id}/matches?timeFrame={time_frame}{time}'.format(
                      id=league_id, time_frame=time_frame, time=str(time)))
-                fixtures_results = req.json()
+                fixtures_results = self._matches(req)
                 # no fixtures in the past week. display a help message and return
-                if len(fixtures_results["matches"]) == 0:
+                if len(fixtures_results) == 0:
                     click.secho("No {league} matches in the past week.".format(league=league),
                                 fg="red", bold=True)
                     return
-                self.writer.league_scores(fixtures_results,
-                                          time, show_upcoming,
-                                          use_12_hour_format)
+                with self.profiler.span('render'):
+                    self.writer.league_scores(fixtures_results,
+                                              time, show_upcoming,
+                                              use_12_hour_format)
             except APIErrorException:
                 click.secho("No data for the given league.", fg="red", bold=True)
         else:
@@ -115,11 +384,12 @@ class RequestHandler(object):
             try:
                 req = self._get('matches?timeFrame={time_frame}{time}'.format(
                      time_frame=time_frame, time=str(time)))
-                fixtures_results = req.json()
-                self.writer.league_scores(fixtures_results,
-                                          time,
-                                          show_upcoming,
-                                          use_12_hour_format)
+                fixtures_results = self._matches(req)
+                with self.profiler.span('render'):
+                    self.writer.league_scores(fixtures_results,
+                                              time,
+                                              show_upcoming,
+                                              use_12_hour_format)
             except APIErrorException:
                 click.secho("No data available.", fg="red", bold=True)
 
@@ -131,11 +401,101 @@ class RequestHandler(object):
         team_id = self.team_names.get(team, None)
         try:
             req = self._get('teams/{}/'.format(team_id))
-            team_players = req.json()['squad']
+            data = self._json(req)
+            team_players = data['squad']
             if not team_players:
                 click.secho("No players found for this team", fg="red", bold=True)
             else:
-                self.writer.team_players(team_players)
+                with self.profiler.span('transform'):
+                    players = parse_players(team_players,
+                                            Team(data.get('id'), data.get('name')))
+                with self.profiler.span('render'):
+                    self.writer.team_players(players)
         except APIErrorException:
             click.secho("No data for the team. Please check the team code.",
                         fg="red", bold=True)
+
+    def get_multi_league_standings(self, leagues):
+        """
+        Fetches the standings of several leagues concurrently and passes
+        them to the writer as one table per league
+        """
+        responses = self._get_many(['competitions/{id}/standings'.format(
+            id=self.league_ids[league]) for league in leagues])
+        tables = []
+        for league, response in zip(leagues, responses):
+            if isinstance(response, APIErrorException):
+                click.secho("No standings availble for {league}.".format(league=league),
+                            fg="red", bold=True)
+                continue
+            with self.profiler.span('transform'):
+                tables.append((league, parse_table(response)))
+        if tables:
+            with self.profiler.span('render'):
+                self.writer.standings(tables, None)
+
+    def get_multi_league_scores(self, leagues, time, show_upcoming,
+                                use_12_hour_format):
+        """
+        Fetches the fixtures of several leagues concurrently and passes
+        them to the writer grouped by competition
+        """
+        time_frame = 'n' if show_upcoming else 'p'
+        responses = self._get_many([
+            'competitions/{id}/matches?timeFrame={time_frame}{time}'.format(
+                id=self.league_ids[league], time_frame=time_frame, time=str(time))
+            for league in leagues])
+        matches = []
+        for league, response in zip(leagues, responses):
+            if isinstance(response, APIErrorException):
+                click.secho("No data for {league}.".format(league=league),
+                            fg="red", bold=True)
+                continue
+            with self.profiler.span('transform'):
+                matches.extend(parse_matches(response))
+        if not matches:
+            click.secho("No matches for the given leagues.", fg="red", bold=True)
+            return
+        with self.profiler.span('render'):
+            self.writer.league_scores(matches, time, show_upcoming,
+                                      use_12_hour_format)
+
+    def get_favourite_scores(self, teams, time, show_upcoming, use_12_hour_format):
+        """
+        Fetches the fixtures of several teams and passes them to the writer
+        as one list, oldest first and without duplicates. Short time frames
+        are covered by a single all-competitions matches query, longer ones
+        fetch each team's matches concurrently.
+        """
+        team_ids = set()
+        for team in teams:
+            if team in self.team_names:
+                team_ids.add(int(self.team_names[team]))
+            else:
+                click.secho("Team code {0} is not correct.".format(team), fg="red", bold=True)
+        if not team_ids:
+            return
+        time_frame = 'n' if show_upcoming else 'p'
+        if time <= MATCHES_MAX_DAYS:
+            urls = ['matches?timeFrame={time_frame}{time}'.format(
+                time_frame=time_frame, time=time)]
+        else:
+            urls = ['teams/{team_id}/matches?timeFrame={time_frame}{time}'.format(
+                team_id=team_id, time_frame=time_frame, time=time)
+                for team_id in sorted(team_ids)]
+        matches = {}
+        for response in self._get_many(urls):
+            if isinstance(response, APIErrorException):
+                click.secho(response.args[0], fg="red", bold=True)
+                continue
+            with self.profiler.span('transform'):
+                for match in parse_matches(response):
+                    if match.home_team.id in team_ids or match.away_team.id in team_ids:
+                        matches[match.id] = match
+        if not matches:
+            click.secho("No matches for your teams in this time frame.",
+                        fg="red", bold=True)
+            return
+        with self.profiler.span('render'):
+            self.writer.team_scores(sorted(matches.values(), key=lambda match: match.utc_date),
+                                    time, show_upcoming, use_12_hour_format)
@@ -0,0 +1,186 @@
+import time
+
+from soccer import leagueproperties
+
+LEAGUE_PROPERTIES = leagueproperties.LEAGUE_PROPERTIES
+
+# Criteria used to order teams level on points, unless the league sets its own
+# (any TeamRecord total, or one prefixed with h2h_ to count only the matches
+# between the teams that are level)
+DEFAULT_TIEBREAK = ['goal_difference', 'goals_for']
+
+
+class TeamRecord(object):
+    """Running totals for one team"""
+
+    __slots__ = ('team', 'played', 'won', 'draw', 'lost', 'goals_for',
+                 'goals_against', 'away_goals_for', 'points')
+
+    def __init__(self, team):
+        self.team = team
+        self.played = self.won = self.draw = self.lost = 0
+        self.goals_for = self.goals_against = self.away_goals_for = 0
+        self.points = 0
+
+    @property
+    def goal_difference(self):
+        return self.goals_for - self.goals_against
+
+    def add(self, scored, conceded, away, sign=1):
+        """Adds (or with sign=-1 removes) the result of one match"""
+        self.played += sign
+        self.goals_for += sign * scored
+        self.goals_against += sign * conceded
+        if away:
+            self.away_goals_for += sign * scored
+        if scored > conceded:
+            self.won += sign
+            self.points += sign * 3
+        elif scored == conceded:
+            self.draw += sign
+            self.points += sign
+        else:
+            self.lost += sign
+
+
+class StandingsTable(object):
+    """
+    League table computed from finished match results.
+
+    Results are folded into per-team totals as they arrive, so keeping the
+    table up to date costs time proportional to the new results only. A
+    match added again with a corrected score replaces its earlier result.
+    Teams level on points are ordered by the league's tiebreak criteria
+    (see LEAGUE_PROPERTIES), then by name.
+    """
+
+    def __init__(self, league, competition=None, season=None):
+        self.league = league
+        self.competition = competition or {'name': league}
+        self.season = season or {}
+        self.tiebreak = LEAGUE_PROPERTIES.get(league, {}).get('tiebreak', DEFAULT_TIEBREAK)
+        self.records = {}
+        self.results = {}
+        self.updated = None
+        self._order = None
+
+    def _record(self, team):
+        if team['id'] not in self.records:
+            self.records[team['id']] = TeamRecord({'id': team['id'], 'name': team['name']})
+        return self.records[team['id']]
+
+    def _fold(self, result, sign):
+        home_id, away_id, home_goals, away_goals = result
+        self.records[home_id].add(home_goals, away_goals, False, sign)
+        self.records[away_id].add(away_goals, home_goals, True, sign)
+
+    def add_match(self, match):
+        """Folds in one match, ignoring matches that haven't finished"""
+        if match['status'] != 'FINISHED':
+            return
+        score = match['score']['fullTime']
+        result = (match['homeTeam']['id'], match['awayTeam']['id'],
+                  score['homeTeam'], score['awayTeam'])
+        previous = self.results.get(match['id'])
+        if previous == result:
+            return
+        self._record(match['homeTeam'])
+        self._record(match['awayTeam'])
+        if previous is not None:
+            self._fold(previous, -1)
+        self._fold(result, 1)
+        self.results[match['id']] = result
+        self._order = None
+
+    def add_matches(self, matches):
+        for match in matches:
+            self.add_match(match)
+
+    def refresh(self, store):
+        """
+        Folds in the season's matches stored since the last refresh, so
+        only new or corrected results are read back from the store.
+        """
+        since = self.updated
+        self.updated = time.time()
+        self.add_matches(store.matches(competition_id=self.competition['id'],
+                                       date_from=self.season.get('startDate'),
+                                       date_to=self.season.get('endDate'),
+                                       updated_since=since))
+
+    def _head_to_head(self, team_ids):
+        """Mini league of the matches played between the given teams"""
+        mini = dict((team_id, TeamRecord(None)) for team_id in team_ids)
+        for home_id, away_id, home_goals, away_goals in self.results.values():
+            if home_id in mini and away_id in mini:
+                mini[home_id].add(home_goals, away_goals, False)
+                mini[away_id].add(away_goals, home_goals, True)
+        return mini
+
+    def _sort_key(self, record, mini):
+        key = [-record.points]
+        for criterion in self.tiebreak:
+            if criterion.startswith('h2h_'):
+                key.append(-getattr(mini[record.team['id']], criterion[4:]))
+            else:
+                key.append(-getattr(record, criterion))
+        key.append(record.team['name'])
+        return key
+
+    def order(self):
+        """Returns the team records in table order"""
+        if self._order is None:
+            minis = {}
+            h2h = [criterion.startswith('h2h_') for criterion in self.tiebreak]
+            if any(h2h):
+                # Head to head only counts between teams still level on
+                # points and on every criterion before the first h2h_ one
+                before = self.tiebreak[:h2h.index(True)]
+                level = {}
+                for record in self.records.values():
+                    key = (record.points,) + tuple(getattr(record, criterion)
+                                                   for criterion in before)
+                    level.setdefault(key, []).append(record.team['id'])
+                for team_ids in level.values():
+                    mini = self._head_to_head(team_ids)
+                    for team_id in team_ids:
+                        minis[team_id] = mini
+            self._order = sorted(self.records.values(),
+                                 key=lambda record: self._sort_key(
+                                     record, minis.get(record.team['id'])))
+        return self._order
+
+    def table(self):
+        """Returns the table rows in the football-data api structure"""
+        return [{'position': position,
+                 'team': dict(record.team),
+                 'playedGames': record.played,
+                 'won': record.won,
+                 'draw': record.draw,
+                 'lost': record.lost,
+                 'points': record.points,
+                 'goalsFor': record.goals_for,
+                 'goalsAgainst': record.goals_against,
+                 'goalDifference': record.goal_difference}
+                for position, record in enumerate(self.order(), 1)]
+
+    def as_payload(self):
+        """Returns the table as a competitions/{id}/standings response"""
+        return {'competition': self.competition,
+                'standings': [{'stage': 'REGULAR_SEASON', 'type': 'TOTAL',
+                               'group': None, 'table': self.table()}]}
+
+
+def standings_from_store(store, league, competition_id):
+    """
+    Builds the table of the latest season stored for a competition, or
+    returns None if no match of that competition is stored.
+    """
+    latest = store.latest_match(competition_id)
+    if latest is None:
+        return None
+    competition = dict(latest.get('competition') or {}, id=competition_id)
+    competition.setdefault('name', league)
+    table = StandingsTable(league, competition, latest.get('season'))
+    table.refresh(store)
+    return table
@@ -0,0 +1,149 @@
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from soccer.decoding import loads
+
+DEFAULT_STORE = os.path.join(os.path.expanduser("~"), ".cache", "soccer-cli", "matches.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    competition_id INTEGER,
+    utc_date TEXT,
+    status TEXT,
+    home_team_id INTEGER,
+    away_team_id INTEGER,
+    data TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS matches_competition_date ON matches (competition_id, utc_date);
+CREATE INDEX IF NOT EXISTS matches_home_team ON matches (home_team_id, utc_date);
+CREATE INDEX IF NOT EXISTS matches_away_team ON matches (away_team_id, utc_date);
+CREATE TABLE IF NOT EXISTS windows (
+    competition_id INTEGER,
+    date_from TEXT,
+    date_to TEXT,
+    fetched REAL,
+    PRIMARY KEY (competition_id, date_from, date_to)
+);
+"""
+
+
+class MatchStore(object):
+    """
+    Local SQLite store of matches from the football-data.org API.
+
+    Matches are kept as the JSON the API returned, indexed by competition,
+    teams and kickoff date. The date windows that have been fetched for
+    each competition are recorded too, so interrupted backfills can resume.
+    """
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.conn.close()
+
+    def add_matches(self, matches, competition_id=None):
+        """Inserts or updates matches, returning how many were stored"""
+        now = time.time()
+        rows = []
+        for match in matches:
+            if 'competition' not in match and competition_id is not None:
+                match = dict(match, competition={'id': competition_id})
+            competition = match.get('competition') or {}
+            rows.append((match['id'], competition.get('id', competition_id),
+                         match['utcDate'], match['status'],
+                         match['homeTeam'].get('id'), match['awayTeam'].get('id'),
+                         json.dumps(match), now))
+        with self._lock, self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO matches VALUES '
+                                  '(?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def add_window(self, competition_id, date_from, date_to):
+        """Records that the matches between the two dates have been stored"""
+        with self._lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO windows VALUES (?, ?, ?, ?)',
+                              (competition_id, date_from, date_to, time.time()))
+
+    def has_window(self, competition_id, date_from, date_to):
+        """
+        Whether the matches between the two dates have been stored, by
+        windows that together cover every day of the range
+        """
+        with self._lock:
+            rows = self.conn.execute('SELECT date_from, date_to FROM windows '
+                                     'WHERE competition_id = ? AND date_from <= ? '
+                                     'AND date_to >= ? ORDER BY date_from',
+                                     (competition_id, date_to, date_from)).fetchall()
+        one_day = datetime.timedelta(days=1)
+        day = datetime.datetime.strptime(date_from, '%Y-%m-%d').date()  # first day not covered
+        for start, end in rows:
+            if start > day.isoformat():
+                return False
+            day = max(day, datetime.datetime.strptime(end, '%Y-%m-%d').date() + one_day)
+            if day.isoformat() > date_to:
+                return True
+        return False
+
+    def _where(self, competition_id=None, team_id=None, date_from=None, date_to=None,
+               updated_since=None):
+        clauses = []
+        params = []
+        if competition_id is not None:
+            clauses.append('competition_id = ?')
+            params.append(competition_id)
+        if team_id is not None:
+            clauses.append('(home_team_id = ? OR away_team_id = ?)')
+            params.extend([team_id, team_id])
+        if date_from is not None:
+            clauses.append('utc_date >= ?')
+            params.append(date_from)
+        if date_to is not None:
+            clauses.append('utc_date < ?')
+            params.append(date_to + 'T99')  # include the whole last day
+        if updated_since is not None:
+            clauses.append('updated >= ?')
+            params.append(updated_since)
+        if not clauses:
+            return '', params
+        return ' WHERE ' + ' AND '.join(clauses), params
+
+    def matches(self, **filters):
+        """
+        Returns the stored matches, optionally filtered by competition_id,
+        team_id, kickoff dates (date_from and date_to, YYYY-MM-DD,
+        inclusive) and when they were stored (updated_since), ordered by
+        kickoff.
+        """
+        where, params = self._where(**filters)
+        with self._lock:
+            rows = self.conn.execute('SELECT data FROM matches' + where +
+                                     ' ORDER BY utc_date, id', params).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def latest_match(self, competition_id):
+        """Returns the stored match of a competition that kicks off last"""
+        with self._lock:
+            row = self.conn.execute('SELECT data FROM matches WHERE competition_id = ? '
+                                    'ORDER BY utc_date DESC, id DESC LIMIT 1',
+                                    (competition_id,)).fetchone()
+        return loads(row[0]) if row else None
+
+    def last_updated(self, **filters):
+        """Returns when the most recent of the filtered matches was stored"""
+        where, params = self._where(**filters)
+        with self._lock:
+            return self.conn.execute('SELECT MAX(updated) FROM matches' + where,
+                                     params).fetchone()[0]
@@ -0,0 +1,102 @@
+import json
+import marshal
+import os
+
+from collections.abc import Mapping
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEAMS_FILE = os.path.join(HERE, "teams.json")
+SNAPSHOT_FILE = os.path.join(HERE, "teams.marshal")
+SNAPSHOT_VERSION = 1
+
+
+def build_index(teams):
+    """Precomputes the code, id and league lookups for a list of teams"""
+    by_code = {}
+    by_id = {}
+    by_league = {}
+    for position, team in enumerate(teams):
+        if team["code"] != "null":
+            by_code[team["code"]] = position
+        by_id[str(team["id"])] = position
+        by_league.setdefault(team["league"]["name"], []).append(position)
+    for positions in by_league.values():
+        positions.sort(key=lambda position: teams[position]["code"])
+    return {"version": SNAPSHOT_VERSION, "teams": teams, "by_code": by_code,
+            "by_id": by_id, "by_league": by_league}
+
+
+def build_snapshot(teams_file=TEAMS_FILE, snapshot_file=SNAPSHOT_FILE):
+    """Writes the precompiled index for teams_file (run at install time)"""
+    with open(teams_file) as jfile:
+        teams = json.load(jfile)["teams"]
+    with open(snapshot_file, "wb") as sfile:
+        marshal.dump(build_index(teams), sfile)
+
+
+class TeamIndex(Mapping):
+    """
+    Lazily loaded index of the teams in teams.json.
+
+    As a mapping it maps team codes to team ids. The data is only read
+    the first time it's needed, from the precompiled marshal snapshot when
+    one is up to date, otherwise from the JSON file.
+    """
+
+    def __init__(self, teams_file=TEAMS_FILE, snapshot_file=SNAPSHOT_FILE):
+        self.teams_file = teams_file
+        self.snapshot_file = snapshot_file
+        self._index = None
+
+    def _load_snapshot(self):
+        try:
+            if os.path.getmtime(self.snapshot_file) < os.path.getmtime(self.teams_file):
+                return None
+            with open(self.snapshot_file, "rb") as sfile:
+                index = marshal.load(sfile)
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(index, dict) or index.get("version") != SNAPSHOT_VERSION:
+            return None
+        return index
+
+    @property
+    def index(self):
+        if self._index is None:
+            index = self._load_snapshot()
+            if index is None:
+                with open(self.teams_file) as jfile:
+                    index = build_index(json.load(jfile)["teams"])
+            self._index = index
+        return self._index
+
+    def team(self, code):
+        """Returns the team with the given code, or None"""
+        position = self.index["by_code"].get(code)
+        return None if position is None else self.index["teams"][position]
+
+    def team_by_id(self, team_id):
+        """Returns the team with the given id, or None"""
+        position = self.index["by_id"].get(str(team_id))
+        return None if position is None else self.index["teams"][position]
+
+    def leagues(self):
+        """Returns the league names in alphabetical order"""
+        return sorted(self.index["by_league"])
+
+    def league_teams(self, league):
+        """Returns the teams of a league in alphabetical order of code"""
+        teams = self.index["teams"]
+        return [teams[position] for position in self.index["by_league"].get(league, [])]
+
+    def __getitem__(self, code):
+        team = self.team(code)
+        if team is None:
+            raise KeyError(code)
+        return team["id"]
+
+    def __iter__(self):
+        return iter(self.index["by_code"])
+
+    def __len__(self):
+        return len(self.index["by_code"])
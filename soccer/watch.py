@@ -0,0 +1,95 @@
+import time
+
+import click
+import requests
+
+from soccer.decoding import decode
+from soccer.models import Match
+from soccer.request_handler import RequestHandler
+
+MIN_INTERVAL = 30  # seconds between polls while matches are in play
+MAX_INTERVAL = 300
+
+
+def game_key(game):
+    return (game['league'], game['homeTeamName'], game['awayTeamName'])
+
+
+def scoreline(game):
+    return (game['goalsHomeTeam'], game['goalsAwayTeam'])
+
+
+class LiveWatcher(object):
+    """
+    Polls the live scores feed and renders only the games whose scoreline
+    changed since the previous poll. The feed is fetched with conditional
+    requests, and polled more often while matches are in play.
+    """
+
+    def __init__(self, request_handler, writer, min_interval=MIN_INTERVAL,
+                 max_interval=MAX_INTERVAL, sleep=time.sleep):
+        self.rh = request_handler
+        self.writer = writer
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.sleep = sleep
+        self.validators = {}
+        self.scorelines = None  # nothing polled yet
+
+    def poll(self):
+        """Fetches the live games, or returns None if they haven't changed"""
+        req = self.rh.session.get(RequestHandler.LIVE_URL, headers=self.validators,
+                                  timeout=self.rh.timeout)
+        if req.status_code == requests.codes.not_modified:
+            return None
+        if req.status_code != requests.codes.ok:
+            raise requests.exceptions.HTTPError(req.status_code)
+        self.validators = {}
+        if req.headers.get('ETag'):
+            self.validators['If-None-Match'] = req.headers['ETag']
+        if req.headers.get('Last-Modified'):
+            self.validators['If-Modified-Since'] = req.headers['Last-Modified']
+        return decode(req)['games']
+
+    def changed(self, games):
+        """Returns the games whose scoreline differs from the previous poll"""
+        scorelines = dict((game_key(game), scoreline(game)) for game in games)
+        previous = self.scorelines or {}
+        changed = [game for game in games
+                   if previous.get(game_key(game)) != scoreline(game)]
+        self.scorelines = scorelines
+        return changed
+
+    def next_interval(self, in_play):
+        """Polls quickly while matches are in play, backing off otherwise"""
+        if in_play:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+        return self.interval
+
+    def step(self):
+        """Polls once, renders any changes and returns the seconds to wait"""
+        try:
+            games = self.poll()
+        except requests.exceptions.RequestException:
+            click.secho("There was problem getting live scores", fg="red", bold=True)
+            return self.next_interval(in_play=False)
+        if games is None:
+            return self.next_interval(in_play=bool(self.scorelines))
+        if not games and self.scorelines != {}:
+            click.secho("No live action currently", fg="red", bold=True)
+        changed = self.changed(games)
+        if changed:
+            self.writer.live_scores([Match.from_live(game) for game in changed])
+        return self.next_interval(in_play=bool(games))
+
+    def run(self, polls=None):
+        """Polls until interrupted, or for the given number of polls"""
+        count = 0
+        while polls is None or count < polls:
+            wait = self.step()
+            count += 1
+            if polls is None or count < polls:
+                self.sleep(wait)
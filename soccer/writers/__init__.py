@@ -0,0 +1,84 @@
+"""
+Output writers. Each writer lives in its own module and is only imported
+when it is used, so commands pay only for the writer they need.
+
+Other packages can add writers by declaring an entry point in the
+soccer.writers group, named after the output format and pointing to a
+BaseWriter subclass:
+
+    entry_points={'soccer.writers': ['queue = soccer_queue:QueueWriter']}
+
+Installed plugins are looked up only when a format isn't built in.
+"""
+from importlib import import_module
+
+from soccer.exceptions import IncorrectParametersException
+from soccer.writers.base import BaseWriter, batched  # noqa: F401
+
+ENTRY_POINT_GROUP = 'soccer.writers'
+
+# Built-in output formats: 'module:Class' and the help of their flag.
+WRITERS = {
+    'stdout': ('soccer.writers.stdoutwriter:Stdout', 'Print to stdout.'),
+    'csv': ('soccer.writers.csvwriter:Csv', 'Output in CSV format.'),
+    'json': ('soccer.writers.jsonwriter:Json', 'Output in JSON format.'),
+    'jsonl': ('soccer.writers.jsonwriter:JsonLines',
+              'Output in JSON Lines format, one object per line.'),
+    'parquet': ('soccer.writers.arrowwriter:Parquet',
+                'Save typed tables in Parquet format (needs pyarrow and -o).'),
+    'arrow': ('soccer.writers.arrowwriter:Arrow',
+              'Save typed tables in Arrow IPC format (needs pyarrow and -o).'),
+    'sqlite': ('soccer.writers.sqlitewriter:Sqlite',
+               'Save to a SQLite database (needs -o), updating only changed rows.'),
+}
+
+_plugins = None
+
+
+def plugins():
+    """Returns {output format: entry point} of the writers other packages install"""
+    global _plugins
+    if _plugins is None:
+        from importlib.metadata import entry_points
+        found = entry_points()
+        if hasattr(found, 'select'):
+            found = found.select(group=ENTRY_POINT_GROUP)
+        else:  # Python < 3.10
+            found = found.get(ENTRY_POINT_GROUP, [])
+        _plugins = dict((entry_point.name, entry_point) for entry_point in found
+                        if entry_point.name not in WRITERS)
+    return _plugins
+
+
+def output_formats():
+    """Returns the names of every available output format"""
+    return list(WRITERS) + sorted(plugins())
+
+
+def load_writer(output_format):
+    """Returns the writer class of output_format, importing it on first use"""
+    if output_format in WRITERS:
+        module, name = WRITERS[output_format][0].split(':')
+        writer = getattr(import_module(module), name)
+    elif output_format in plugins():
+        writer = plugins()[output_format].load()
+    else:
+        raise IncorrectParametersException('Unknown output format {0}. Choose one of: '
+                                           '{1}.'.format(output_format,
+                                                         ', '.join(output_formats())))
+    if not (isinstance(writer, type) and issubclass(writer, BaseWriter)):
+        raise TypeError('The {0} writer {1!r} is not a BaseWriter.'.format(
+            output_format, writer))
+    return writer
+
+
+def get_writer(output_format='stdout', output_file=None, tz=None):
+    return load_writer(output_format)(output_file, tz=tz)
+
+
+def __getattr__(name):
+    """Lazily exposes the built-in writer classes, eg. soccer.writers.Stdout"""
+    for output_format, (path, _) in WRITERS.items():
+        if path.endswith(':' + name):
+            return load_writer(output_format)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
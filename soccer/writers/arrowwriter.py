@@ -0,0 +1,150 @@
+import os
+import time
+import uuid
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+from soccer.exceptions import IncorrectParametersException
+from soccer.writers.base import BaseWriter, batched
+
+BATCH_ROWS = 64 * 1024  # rows per record batch (and parquet row group)
+COMPRESSION = 'zstd'
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError('Parquet and Arrow output require pyarrow. '
+                          'Install it with: pip install soccer-cli[arrow]')
+
+
+def match_columns():
+    return [('id', pa.int64(), lambda m: m.id),
+            ('competition', pa.string(), lambda m: m.competition),
+            ('utc_date', pa.timestamp('s', tz='UTC'), lambda m: m.utc_date),
+            ('status', pa.string(), lambda m: m.status),
+            ('home_team_id', pa.int64(), lambda m: m.home_team.id),
+            ('home_team', pa.string(), lambda m: m.home_team.name),
+            ('home_goals', pa.int16(), lambda m: m.home_goals),
+            ('away_goals', pa.int16(), lambda m: m.away_goals),
+            ('away_team_id', pa.int64(), lambda m: m.away_team.id),
+            ('away_team', pa.string(), lambda m: m.away_team.name),
+            ('time', pa.string(), lambda m: m.time)]
+
+
+def standings_columns():
+    return [('league', pa.string(), lambda row: row[0]),
+            ('position', pa.int16(), lambda row: row[1].position),
+            ('team_id', pa.int64(), lambda row: row[1].team.id),
+            ('team', pa.string(), lambda row: row[1].team.name),
+            ('played_games', pa.int16(), lambda row: row[1].played_games),
+            ('won', pa.int16(), lambda row: row[1].won),
+            ('draw', pa.int16(), lambda row: row[1].draw),
+            ('lost', pa.int16(), lambda row: row[1].lost),
+            ('points', pa.int16(), lambda row: row[1].points),
+            ('goals_for', pa.int16(), lambda row: row[1].goals_for),
+            ('goals_against', pa.int16(), lambda row: row[1].goals_against),
+            ('goal_difference', pa.int16(), lambda row: row[1].goal_difference),
+            ('retrieved_at', pa.timestamp('s', tz='UTC'), lambda row: row[2])]
+
+
+def player_columns():
+    return [('team_id', pa.int64(), lambda p: p.team.id),
+            ('team', pa.string(), lambda p: p.team.name),
+            ('name', pa.string(), lambda p: p.name),
+            ('position', pa.string(), lambda p: p.position),
+            ('shirt_number', pa.int16(), lambda p: p.shirt_number),
+            ('nationality', pa.string(), lambda p: p.nationality),
+            ('date_of_birth', pa.date32(), lambda p: p.date_of_birth and p.date_of_birth[:10]),
+            ('role', pa.string(), lambda p: p.role)]
+
+
+def column_array(values, type):
+    """Builds a typed array, parsing the API's date strings in one pass"""
+    if pa.types.is_timestamp(type):
+        parsed = pc.strptime(pa.array(values, pa.string()),
+                             format='%Y-%m-%dT%H:%M:%SZ', unit='s')
+        return parsed.cast(type)
+    if pa.types.is_date(type):
+        parsed = pc.strptime(pa.array(values, pa.string()), format='%Y-%m-%d', unit='s')
+        return parsed.cast(type)
+    return pa.array(values, type)
+
+
+def record_batches(rows, columns):
+    """Yields the rows as record batches of at most BATCH_ROWS rows"""
+    schema = pa.schema([(name, type) for name, type, _ in columns])
+    for chunk in batched(rows, BATCH_ROWS):
+        yield pa.record_batch([column_array([get(row) for row in chunk], type)
+                               for _, type, get in columns], schema=schema)
+
+
+class Parquet(BaseWriter):
+    """
+    Writes typed match, standings and squad tables as compressed Parquet.
+
+    The output file is overwritten. When it is a directory, each run adds
+    a new part file under a folder per table (matches, standings,
+    players), so the directory can be read as one growing dataset, eg.
+    with pyarrow.dataset or pandas.read_parquet.
+    """
+
+    extension = '.parquet'
+
+    def __init__(self, output_file, tz=None):
+        require_pyarrow()
+        if not output_file:
+            raise IncorrectParametersException('{0} output needs an output file '
+                                               '(-o).'.format(type(self).__name__))
+        super(Parquet, self).__init__(output_file, tz)
+
+    def path(self, table):
+        """The file to write table to"""
+        if not os.path.isdir(self.output_filename):
+            return self.output_filename
+        directory = os.path.join(self.output_filename, table)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, 'part-{0}-{1}{2}'.format(
+            time.strftime('%Y%m%dT%H%M%S'), uuid.uuid4().hex[:8], self.extension))
+
+    def open(self, path, schema):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(path, schema, compression=COMPRESSION)
+
+    def write_table(self, table, rows, columns):
+        schema = pa.schema([(name, type) for name, type, _ in columns])
+        with self.open(self.path(table), schema) as writer:
+            for batch in record_batches(rows, columns):
+                writer.write_batch(batch)
+
+    def live_scores(self, live_scores):
+        self.write_table('matches', live_scores, match_columns())
+
+    def team_scores(self, team_scores, time, show_upcoming, use_12_hour_format):
+        self.write_table('matches', team_scores, match_columns())
+
+    def team_players(self, team):
+        self.write_table('players', team, player_columns())
+
+    def standings(self, league_table, league):
+        retrieved = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        self.write_table('standings', ((code, row, retrieved)
+                                       for code, table in league_table for row in table),
+                         standings_columns())
+
+    def league_scores(self, total_data, time, show_upcoming, use_12_hour_format):
+        self.write_table('matches', total_data, match_columns())
+
+
+class Arrow(Parquet):
+    """Writes the same tables as Parquet, as compressed Arrow IPC files"""
+
+    extension = '.arrow'
+
+    def open(self, path, schema):
+        return pa.ipc.new_file(path, schema,
+                               options=pa.ipc.IpcWriteOptions(compression=COMPRESSION))
@@ -0,0 +1,70 @@
+import io
+import sys
+
+from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from itertools import islice
+
+
+def batched(items, size):
+    """Yields lists of up to size items, consuming items only once"""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+class BaseWriter(object, metaclass=ABCMeta):
+    """
+    The interface every writer implements.
+
+    Each method receives the parsed models of one command (see
+    soccer.models). The collections may be generators: writers should go
+    through them once, writing as they go, and sinks that write in bulk
+    can group them with batched(). close() is called once the command is
+    done, for writers that keep a file or connection open.
+    """
+
+    def __init__(self, output_file, tz=None):
+        self.output_filename = output_file
+        self.tz = tz
+
+    @contextmanager
+    def output_stream(self, newline=None):
+        """Yields the text stream to write to: the output file or stdout"""
+        if not self.output_filename:
+            stream = sys.stdout
+            yield stream
+            stream.flush()
+        else:
+            with io.open(self.output_filename, 'w', encoding='utf-8',
+                         newline=newline) as f:
+                yield f
+
+    def close(self):
+        pass
+
+    @abstractmethod
+    def live_scores(self, live_scores):
+        """Writes the games in play, Match models with a time"""
+
+    @abstractmethod
+    def team_scores(self, team_scores, time, show_upcoming, use_12_hour_format):
+        """Writes one team's matches over the last or next time days"""
+
+    @abstractmethod
+    def team_players(self, team):
+        """Writes a squad, as Player models"""
+
+    @abstractmethod
+    def standings(self, league_table, league):
+        """
+        Writes (league code, [TableRow]) tables. league is the code when
+        there is one table, None when there are several.
+        """
+
+    @abstractmethod
+    def league_scores(self, total_data, time, show_upcoming, use_12_hour_format):
+        """Writes the matches of one or more leagues over time days"""
@@ -0,0 +1,81 @@
+import csv
+
+from soccer.writers.base import BaseWriter
+
+
+class Csv(BaseWriter):
+
+    def generate_output(self, headers, rows):
+        """Writes the headers, then each row as it is produced"""
+        with self.output_stream(newline='') as stream:
+            if self.output_filename:
+                writer = csv.writer(stream)
+            else:
+                writer = csv.writer(stream, lineterminator='\n')
+            writer.writerow(headers)
+            for row in rows:
+                writer.writerow(row)
+
+    def live_scores(self, live_scores):
+        """Store output of live scores to a CSV file"""
+        headers = ['League', 'Home Team Name', 'Home Team Goals',
+                   'Away Team Goals', 'Away Team Name']
+        self.generate_output(headers, ([game.competition,
+                                        game.home_team.name,
+                                        game.home_goals,
+                                        game.away_goals,
+                                        game.away_team.name]
+                                       for game in live_scores))
+
+    def team_scores(self, team_scores, time, show_upcoming, use_12_hour_format):
+        """Store output of team scores to a CSV file"""
+        headers = ['Date', 'Home Team Name', 'Home Team Goals',
+                   'Away Team Goals', 'Away Team Name']
+        self.generate_output(headers, ([score.date,
+                                        score.home_team.name,
+                                        score.home_goals,
+                                        score.away_goals,
+                                        score.away_team.name]
+                                       for score in team_scores if score.finished))
+
+    def team_players(self, team):
+        """Store output of team players to a CSV file"""
+        headers = ['Jersey Number', 'Name', 'Position', 'Nationality',
+                   'Date of Birth']
+        self.generate_output(headers, ([player.shirt_number,
+                                        player.name,
+                                        player.position,
+                                        player.nationality,
+                                        player.date_of_birth]
+                                       for player in team))
+
+    def standings(self, league_table, league):
+        """Store output of league standings to a CSV file"""
+        headers = ['Position', 'Team Name', 'Games Played', 'Goal For',
+                   'Goals Against', 'Goal Difference', 'Points']
+        if league is None:
+            headers.insert(0, 'League')
+
+        def rows():
+            for code, table in league_table:
+                prefix = [code] if league is None else []
+                for team in table:
+                    yield prefix + [team.position,
+                                    team.team.name,
+                                    team.played_games,
+                                    team.goals_for,
+                                    team.goals_against,
+                                    team.goal_difference,
+                                    team.points]
+        self.generate_output(headers, rows())
+
+    def league_scores(self, total_data, time, show_upcoming, use_12_hour_format):
+        """Store output of fixtures based on league and time to a CSV file"""
+        headers = ['League', 'Home Team Name', 'Home Team Goals',
+                   'Away Team Goals', 'Away Team Name']
+        self.generate_output(headers, ([score.competition,
+                                        score.home_team.name,
+                                        score.home_goals,
+                                        score.away_goals,
+                                        score.away_team.name]
+                                       for score in total_data))
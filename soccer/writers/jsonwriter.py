@@ -0,0 +1,102 @@
+import json
+
+from soccer.writers.base import BaseWriter
+
+INDENT = ' ' * 4
+
+
+def dumps(obj, depth=0):
+    """Pretty prints obj as it would appear depth levels into a document"""
+    data = json.dumps(obj, indent=4, separators=(',', ': '), ensure_ascii=False)
+    return data.replace('\n', '\n' + INDENT * depth)
+
+
+class Json(BaseWriter):
+
+    def generate_output(self, items, key=None, extra=None):
+        """
+        Streams items as a JSON array, one item at a time. When key is given
+        the array is wrapped in an object, followed by the extra members.
+        """
+        depth = 0 if key is None else 1
+        with self.output_stream() as stream:
+            if key is not None:
+                stream.write(u'{\n' + INDENT + dumps(key) + u': ')
+            stream.write(u'[')
+            empty = True
+            for item in items:
+                stream.write((u'' if empty else u',') + u'\n' +
+                             INDENT * (depth + 1) + dumps(item, depth + 1))
+                empty = False
+            stream.write((u'' if empty else u'\n' + INDENT * depth) + u']')
+            if key is not None:
+                for name, value in (extra or {}).items():
+                    stream.write(u',\n' + INDENT + dumps(name) + u': ' + dumps(value, 1))
+                stream.write(u'\n}')
+            stream.write(u'\n')
+
+    def live_scores(self, live_scores):
+        """Store output of live scores to a JSON file"""
+        self.generate_output({'league': game.competition,
+                              'homeTeamName': game.home_team.name,
+                              'goalsHomeTeam': game.home_goals,
+                              'goalsAwayTeam': game.away_goals,
+                              'awayTeamName': game.away_team.name,
+                              'time': game.time}
+                             for game in live_scores)
+
+    def team_scores(self, team_scores, time, show_upcoming, use_12_hour_format):
+        """Store output of team scores to a JSON file"""
+        self.generate_output(({'date': score.date,
+                               'homeTeamName': score.home_team.name,
+                               'goalsHomeTeam': score.home_goals,
+                               'goalsAwayTeam': score.away_goals,
+                               'awayTeamName': score.away_team.name}
+                              for score in team_scores if score.finished),
+                             'team_scores')
+
+    def standings(self, league_table, league):
+        """Store output of league standings to a JSON file"""
+        def items():
+            for code, table in league_table:
+                for team in table:
+                    item = {'position': team.position,
+                            'teamName': team.team.name,
+                            'playedGames': team.played_games,
+                            'goalsFor': team.goals_for,
+                            'goalsAgainst': team.goals_against,
+                            'goalDifference': team.goal_difference,
+                            'points': team.points}
+                    if league is None:
+                        item['league'] = code
+                    yield item
+        self.generate_output(items(), 'standings')
+
+    def team_players(self, team):
+        """Store output of team players to a JSON file"""
+        self.generate_output(({'shirtNumber': player.shirt_number,
+                               'name': player.name,
+                               'position': player.position,
+                               'nationality': player.nationality,
+                               'dateOfBirth': player.date_of_birth}
+                              for player in team),
+                             'players')
+
+    def league_scores(self, total_data, time, show_upcoming, use_12_hour_format):
+        """Store output of fixtures based on league and time to a JSON file"""
+        self.generate_output(({'league': score.competition,
+                               'homeTeamName': score.home_team.name,
+                               'goalsHomeTeam': score.home_goals,
+                               'goalsAwayTeam': score.away_goals,
+                               'awayTeamName': score.away_team.name}
+                              for score in total_data),
+                             'league_scores', {'time': time})
+
+
+class JsonLines(Json):
+    """Writes one compact JSON object per line (JSON Lines)"""
+
+    def generate_output(self, items, key=None, extra=None):
+        with self.output_stream() as stream:
+            for item in items:
+                stream.write(json.dumps(item, ensure_ascii=False) + u'\n')
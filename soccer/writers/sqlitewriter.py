@@ -0,0 +1,189 @@
+import sqlite3
+import time
+
+from soccer.exceptions import IncorrectParametersException
+from soccer.writers.base import BaseWriter, batched
+
+BATCH_ROWS = 1000  # rows per executemany call
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    competition TEXT,
+    utc_date TEXT,
+    status TEXT,
+    home_team_id INTEGER,
+    home_team TEXT,
+    away_team_id INTEGER,
+    away_team TEXT,
+    home_goals INTEGER,
+    away_goals INTEGER,
+    updated TEXT
+);
+CREATE INDEX IF NOT EXISTS matches_competition_date ON matches (competition, utc_date);
+CREATE INDEX IF NOT EXISTS matches_home_team ON matches (home_team_id, utc_date);
+CREATE INDEX IF NOT EXISTS matches_away_team ON matches (away_team_id, utc_date);
+CREATE INDEX IF NOT EXISTS matches_date ON matches (utc_date);
+CREATE TABLE IF NOT EXISTS live_scores (
+    competition TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    home_goals INTEGER,
+    away_goals INTEGER,
+    time TEXT,
+    updated TEXT,
+    PRIMARY KEY (competition, home_team, away_team)
+);
+CREATE TABLE IF NOT EXISTS standings (
+    league TEXT,
+    retrieved_at TEXT,
+    position INTEGER,
+    team_id INTEGER,
+    team TEXT,
+    played_games INTEGER,
+    won INTEGER,
+    draw INTEGER,
+    lost INTEGER,
+    points INTEGER,
+    goals_for INTEGER,
+    goals_against INTEGER,
+    goal_difference INTEGER,
+    PRIMARY KEY (league, retrieved_at, position)
+);
+CREATE INDEX IF NOT EXISTS standings_team ON standings (team_id, retrieved_at);
+CREATE TABLE IF NOT EXISTS players (
+    team_id INTEGER,
+    team TEXT,
+    name TEXT,
+    date_of_birth TEXT,
+    position TEXT,
+    shirt_number INTEGER,
+    nationality TEXT,
+    role TEXT,
+    updated TEXT,
+    PRIMARY KEY (team_id, name, date_of_birth)
+);
+"""
+
+# Existing rows are only rewritten when one of these columns changed.
+UPSERT_MATCH = """
+INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    competition = excluded.competition, utc_date = excluded.utc_date,
+    status = excluded.status, home_team_id = excluded.home_team_id,
+    home_team = excluded.home_team, away_team_id = excluded.away_team_id,
+    away_team = excluded.away_team, home_goals = excluded.home_goals,
+    away_goals = excluded.away_goals, updated = excluded.updated
+WHERE (matches.competition, matches.utc_date, matches.status, matches.home_team,
+       matches.away_team, matches.home_goals, matches.away_goals)
+   IS NOT (excluded.competition, excluded.utc_date, excluded.status, excluded.home_team,
+           excluded.away_team, excluded.home_goals, excluded.away_goals)
+"""
+
+UPSERT_LIVE_SCORE = """
+INSERT INTO live_scores VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (competition, home_team, away_team) DO UPDATE SET
+    home_goals = excluded.home_goals, away_goals = excluded.away_goals,
+    time = excluded.time, updated = excluded.updated
+WHERE (live_scores.home_goals, live_scores.away_goals, live_scores.time)
+   IS NOT (excluded.home_goals, excluded.away_goals, excluded.time)
+"""
+
+UPSERT_PLAYER = """
+INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (team_id, name, date_of_birth) DO UPDATE SET
+    team = excluded.team, position = excluded.position,
+    shirt_number = excluded.shirt_number, nationality = excluded.nationality,
+    role = excluded.role, updated = excluded.updated
+WHERE (players.team, players.position, players.shirt_number, players.nationality,
+       players.role)
+   IS NOT (excluded.team, excluded.position, excluded.shirt_number, excluded.nationality,
+           excluded.role)
+"""
+
+STANDINGS_COLUMNS = ('position, team_id, team, played_games, won, draw, lost, points, '
+                     'goals_for, goals_against, goal_difference')
+
+
+def utc_now():
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
+class Sqlite(BaseWriter):
+    """
+    Ingests matches, live scores, standings and squads into a SQLite
+    database, in one transaction per command.
+
+    Matches are upserted on their id, and existing rows are only written
+    when something about them changed, so ingesting the same window every
+    few minutes costs little more than the changed rows. Standings are
+    kept as timestamped snapshots, and a new snapshot is only stored when
+    the table differs from the league's latest one.
+    """
+
+    def __init__(self, output_file, tz=None):
+        if not output_file:
+            raise IncorrectParametersException('Sqlite output needs a database file (-o).')
+        super(Sqlite, self).__init__(output_file, tz)
+        self.conn = sqlite3.connect(output_file)
+        self.conn.executescript(SCHEMA)
+        self.changes = 0  # rows inserted or updated
+
+    def close(self):
+        self.conn.close()
+
+    def upsert(self, sql, rows):
+        """Runs sql for each row, in batches, in a single transaction"""
+        before = self.conn.total_changes
+        with self.conn:
+            for batch in batched(rows, BATCH_ROWS):
+                self.conn.executemany(sql, batch)
+        self.changes += self.conn.total_changes - before
+
+    def write_matches(self, matches):
+        now = utc_now()
+        self.upsert(UPSERT_MATCH, ((m.id, m.competition, m.utc_date, m.status,
+                                    m.home_team.id, m.home_team.name,
+                                    m.away_team.id, m.away_team.name,
+                                    m.home_goals, m.away_goals, now)
+                                   for m in matches))
+
+    def live_scores(self, live_scores):
+        now = utc_now()
+        self.upsert(UPSERT_LIVE_SCORE, ((game.competition, game.home_team.name,
+                                         game.away_team.name, game.home_goals,
+                                         game.away_goals, game.time, now)
+                                        for game in live_scores))
+
+    def team_scores(self, team_scores, time, show_upcoming, use_12_hour_format):
+        self.write_matches(team_scores)
+
+    def league_scores(self, total_data, time, show_upcoming, use_12_hour_format):
+        self.write_matches(total_data)
+
+    def team_players(self, team):
+        now = utc_now()
+        self.upsert(UPSERT_PLAYER, ((player.team.id, player.team.name, player.name,
+                                     player.date_of_birth, player.position,
+                                     player.shirt_number, player.nationality,
+                                     player.role, now)
+                                    for player in team))
+
+    def latest_standings(self, league):
+        """Returns the rows of the league's latest snapshot"""
+        return self.conn.execute(
+            'SELECT {0} FROM standings WHERE league = ? AND retrieved_at = '
+            '(SELECT MAX(retrieved_at) FROM standings WHERE league = ?) '
+            'ORDER BY position'.format(STANDINGS_COLUMNS), (league, league)).fetchall()
+
+    def standings(self, league_table, league):
+        now = utc_now()
+        rows = []
+        for code, table in league_table:
+            snapshot = sorted((row.position, row.team.id, row.team.name, row.played_games,
+                               row.won, row.draw, row.lost, row.points, row.goals_for,
+                               row.goals_against, row.goal_difference) for row in table)
+            if snapshot and snapshot != self.latest_standings(code):
+                rows.extend((code, now) + row for row in snapshot)
+        self.upsert('INSERT OR REPLACE INTO standings VALUES '
+                    '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
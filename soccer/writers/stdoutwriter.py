@@ -0,0 +1,181 @@
+import click
+import sys
+
+from itertools import groupby
+
+from soccer import leagueproperties
+from soccer.localtime import LocalTime
+from soccer.writers.base import BaseWriter
+
+LEAGUE_PROPERTIES = leagueproperties.LEAGUE_PROPERTIES
+
+
+class Colors(object):
+    WIN = "red"
+    LOSE = "blue"
+    TIE = "yellow"
+    MISC = "green"
+    TIME = "yellow"
+    CL_POSITION = "green"
+    EL_POSITION = "yellow"
+    RL_POSITION = "red"
+    POSITION = "blue"
+
+
+def valid_score(score):
+    return "" if score is None else score
+
+
+class Stdout(BaseWriter):
+    """
+    Prints to the terminal. Each table is built up as a list of lines and
+    written in one go, and only styled when stdout is a terminal (unless
+    color is forced on or off). Kickoff times are shown in the tz time
+    zone, or the system's.
+    """
+
+    colors = Colors
+
+    def __init__(self, output_file, color=None, tz=None):
+        BaseWriter.__init__(self, output_file, tz)
+        self.color = color
+        self.local_time = LocalTime(tz)
+
+    def use_color(self):
+        if self.color is not None:
+            return self.color
+        isatty = getattr(sys.stdout, 'isatty', None)
+        return bool(isatty and isatty())
+
+    def write(self, lines):
+        """Writes the lines to stdout at once"""
+        if lines:
+            click.echo(u'\n'.join(lines), color=self.use_color())
+
+    def styler(self):
+        """Returns click.style, or a no-op when not writing in color"""
+        if self.use_color():
+            return click.style
+        return lambda text, **styles: text
+
+    def live_scores(self, live_scores):
+        """Prints the live scores in a pretty format"""
+        style = self.styler()
+        lines = []
+        scores = sorted(live_scores, key=lambda x: x.competition)
+        for league, games in groupby(scores, key=lambda x: x.competition):
+            lines.extend(self.league_header(league, style))
+            for game in games:
+                kickoff = self.local_time.format(game.time, use_12_hour_format=False)
+                lines.append(self.scores(game, style) +
+                             style('   %s' % kickoff, fg=self.colors.TIME))
+                lines.append(u'')
+        self.write(lines)
+
+    def team_scores(self, team_scores, time, show_datetime, use_12_hour_format):
+        """Prints the teams scores in a pretty format"""
+        style = self.styler()
+        lines = []
+        for score in team_scores:
+            if score.finished:
+                lines.append(style("%s\t" % score.date, fg=self.colors.TIME) +
+                             self.scores(score, style))
+            elif show_datetime:
+                kickoff = self.local_time.format(score.utc_date, use_12_hour_format,
+                                                 show_datetime)
+                lines.append(self.scores(score, style) +
+                             style('   %s' % kickoff, fg=self.colors.TIME))
+        self.write(lines)
+
+    def team_players(self, team):
+        """Prints the team players in a pretty format"""
+        style = self.styler()
+        lines = [style("%-6s %-25s    %-20s    %-20s    %-15s" %
+                       ("N.",  "NAME", "POSITION", "NATIONALITY", "BIRTHDAY"),
+                       bold=True, fg=self.colors.MISC)]
+        fmt = (u"{0.shirt_number!r:<6} {0.name:<28} {0.position:<23} {0.nationality:<23}"
+               u" {0.date_of_birth:<18}")
+        for player in team:
+            if player.role == "PLAYER":
+                lines.append(style(fmt.format(player), bold=True))
+        self.write(lines)
+
+    def standings(self, league_table, league):
+        """ Prints the league standings in a pretty way """
+        style = self.styler()
+        lines = []
+        for code, table in league_table:
+            if league is None:
+                lines.extend(self.league_header(code, style))
+            lines.extend(self.league_table(table, code, style))
+        self.write(lines)
+
+    def league_table(self, table, league, style):
+        """ Returns the lines of a single league table """
+        lines = ["%-6s  %-30s    %-10s    %-10s    %-10s" %
+                 ("POS", "CLUB", "PLAYED", "GOAL DIFF", "POINTS")]
+        # Define the upper and lower bounds for Champions League,
+        # Europa League and Relegation places.
+        # This is so we can highlight them appropriately.
+        cl_upper, cl_lower = LEAGUE_PROPERTIES[league]['cl']
+        el_upper, el_lower = LEAGUE_PROPERTIES[league]['el']
+        rl_upper, rl_lower = LEAGUE_PROPERTIES[league]['rl']
+        for team in table:
+            goal_difference = str(team.goal_difference)
+            if team.goal_difference >= 0:
+                goal_difference = ' ' + goal_difference
+            team_str = (u"{0.position:<7} {0.team.name:<33} {0.played_games:<12}"
+                        u" {1:<14} {0.points}").format(team, goal_difference)
+            if cl_upper <= team.position <= cl_lower:
+                lines.append(style(team_str, bold=True, fg=self.colors.CL_POSITION))
+            elif el_upper <= team.position <= el_lower:
+                lines.append(style(team_str, fg=self.colors.EL_POSITION))
+            elif rl_upper <= team.position <= rl_lower:
+                lines.append(style(team_str, fg=self.colors.RL_POSITION))
+            else:
+                lines.append(style(team_str, fg=self.colors.POSITION))
+        return lines
+
+    def league_scores(self, total_data, time, show_datetime,
+                      use_12_hour_format):
+        """Prints the data in a pretty format"""
+        style = self.styler()
+        lines = []
+        # Group the matches by league, keeping their order within each one
+        leagues = {}
+        for match in total_data:
+            leagues.setdefault(match.competition, []).append(match)
+        for league, matches in leagues.items():
+            # Only show league headers when the matches span several leagues
+            if len(leagues) > 1:
+                lines.extend(self.league_header(league, style))
+            for match in matches:
+                line = self.scores(match, style)
+                if show_datetime:
+                    kickoff = self.local_time.format(match.utc_date, use_12_hour_format,
+                                                     show_datetime)
+                    line += style('   %s' % kickoff, fg=self.colors.TIME)
+                lines.append(line)
+                lines.append(u'')
+        self.write(lines)
+
+    def league_header(self, league, style=click.style):
+        """Returns the lines of a league header"""
+        league_name = " {0} ".format(league)
+        return [style("{:=^62}".format(league_name), fg=self.colors.MISC), u'']
+
+    def scores(self, result, style=click.style):
+        """Returns the scores of a match in a pretty format"""
+        home_goals, away_goals = result.home_goals, result.away_goals
+        if home_goals is None or away_goals is None or home_goals == away_goals:
+            homeColor = awayColor = self.colors.TIE
+        elif home_goals > away_goals:
+            homeColor, awayColor = (self.colors.WIN, self.colors.LOSE)
+        else:
+            homeColor, awayColor = (self.colors.LOSE, self.colors.WIN)
+
+        return (style('%-26s %2s' % (result.home_team.name, valid_score(home_goals)),
+                      fg=homeColor) +
+                "  vs " +
+                style('%2s %s' % (valid_score(away_goals), result.away_team.name.rjust(26)),
+                      fg=awayColor))
@@ -0,0 +1,18 @@
+KICKOFF = '2018-08-10T19:00:00Z'
+TEAMS = {1: 'Arsenal', 2: 'Chelsea', 3: 'Everton', 4: 'Fulham',
+         57: 'Arsenal FC', 61: 'Chelsea FC'}
+
+
+def match(match_id, utc_date=KICKOFF, home_id=1, away_id=2,
+          home_goals=1, away_goals=0, status='FINISHED', **fields):
+    """
+    A match in the football-data.org api structure. Teams are named after
+    TEAMS, or their id; other fields (eg. competition, season) are added
+    as they are given.
+    """
+    data = {'id': match_id, 'utcDate': utc_date, 'status': status,
+            'homeTeam': {'id': home_id, 'name': TEAMS.get(home_id, str(home_id))},
+            'awayTeam': {'id': away_id, 'name': TEAMS.get(away_id, str(away_id))},
+            'score': {'fullTime': {'homeTeam': home_goals, 'awayTeam': away_goals}}}
+    data.update(fields)
+    return data
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+
+from soccer import leagueids
+from soccer.async_request_handler import AsyncRequestHandler
+from soccer.exceptions import APIErrorException
+
+
+class FakeResponse(object):
+    def __init__(self, json_data, status):
+        self.json_data = json_data
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def json(self, content_type=None):
+        return self.json_data
+
+
+class FakeSession(object):
+    def __init__(self, responses):
+        self.responses = responses
+        self.urls = []
+
+    def get(self, url, headers=None):
+        self.urls.append(url)
+        return self.responses(url)
+
+
+class TestAsyncRequestHandler(unittest.TestCase):
+
+    VALID_LEAGUE_CODE = "BL"
+    VALID_TEAM_CODE = "AFC"
+
+    def handler(self, responses):
+        self.session = FakeSession(responses)
+        return AsyncRequestHandler({'X-Auth-Token': 'token'},
+                                   leagueids.LEAGUE_IDS,
+                                   {TestAsyncRequestHandler.VALID_TEAM_CODE: 57},
+                                   session=self.session)
+
+    def run_async(self, coro):
+        return asyncio.run(coro)
+
+    def test_get_standings(self):
+        rq = self.handler(lambda url: FakeResponse({'standings': []}, 200))
+        data = self.run_async(rq.get_standings(self.VALID_LEAGUE_CODE))
+        self.assertEqual(data, {'standings': []})
+        self.assertTrue(self.session.urls[0].endswith(
+            'competitions/2002/standings'))
+
+    def test_api_error(self):
+        rq = self.handler(lambda url: FakeResponse(None, 404))
+        with self.assertRaises(APIErrorException):
+            self.run_async(rq.get_standings(self.VALID_LEAGUE_CODE))
+
+    def test_connection_error(self):
+        def responses(url):
+            raise asyncio.TimeoutError()
+        rq = self.handler(responses)
+        with self.assertRaises(APIErrorException):
+            self.run_async(rq.get_team_players(self.VALID_TEAM_CODE))
+
+    def test_bad_team_code(self):
+        rq = self.handler(lambda url: FakeResponse({}, 200))
+        with self.assertRaises(APIErrorException):
+            self.run_async(rq.get_team_scores("AdkljdfkljkdlFC", 6, False))
+        self.assertEqual(self.session.urls, [])
+
+    def test_get_multi_league_scores(self):
+        def responses(url):
+            return FakeResponse({'competition': {'name': url.split('/')[-2]},
+                                 'matches': [{'id': url}]}, 200)
+        rq = self.handler(responses)
+        data = self.run_async(rq.get_league_scores(['BL', 'PL'], 6, False))
+        self.assertEqual([m['competition']['name'] for m in data['matches']],
+                         ['2002', '2021'])
+
+    def test_get_live_scores(self):
+        game = {'homeTeamName': 'A', 'awayTeamName': 'B', 'goalsHomeTeam': 1,
+                'goalsAwayTeam': 0, 'league': 'PL', 'time': "70'"}
+        rq = self.handler(lambda url: FakeResponse({'games': [game]}, 200))
+        data = self.run_async(rq.get_live_scores())
+        self.assertEqual(data[0]['homeTeam'], {'name': 'A'})
+        self.assertEqual(data[0]['score']['fullTime'],
+                         {'homeTeam': 1, 'awayTeam': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import datetime
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mock
+
+from api_data import match
+from soccer.cache import MatchWindows, ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+
+    STANDINGS_URL = "competitions/2021/standings"
+    MATCHES_URL = "competitions/2021/matches?timeFrame=p6"
+    SQUAD_URL = "teams/66/"
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.headers = {'X-Auth-Token': 'token'}
+        self.cache = ResponseCache(path=self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def response(self, body='{"key": "value"}', headers=None):
+        return mock.MagicMock(text=body, headers=headers or {})
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.get(self.STANDINGS_URL, self.headers))
+
+    def test_hit(self):
+        self.cache.set(self.STANDINGS_URL, self.headers, self.response())
+        cached = self.cache.get(self.STANDINGS_URL, self.headers)
+        self.assertTrue(cached.fresh)
+        self.assertEqual(cached.json(), {'key': 'value'})
+
+    def test_keyed_on_token(self):
+        self.cache.set(self.STANDINGS_URL, self.headers, self.response())
+        other = {'X-Auth-Token': 'other'}
+        self.assertIsNone(self.cache.get(self.STANDINGS_URL, other))
+
+    def test_endpoint_ttls(self):
+        self.assertEqual(self.cache.ttl_for(self.STANDINGS_URL), 30 * 60)
+        self.assertEqual(self.cache.ttl_for(self.MATCHES_URL), 60)
+        self.assertEqual(self.cache.ttl_for(self.SQUAD_URL), 24 * 60 * 60)
+
+    def test_ttl_override(self):
+        cache = ResponseCache(path=self.path, ttl=0)
+        self.assertEqual(cache.ttl_for(self.SQUAD_URL), 0)
+        cache.set(self.SQUAD_URL, self.headers, self.response())
+        self.assertFalse(cache.get(self.SQUAD_URL, self.headers).fresh)
+
+    def test_validators(self):
+        self.cache.set(self.STANDINGS_URL, self.headers, self.response(
+            headers={'ETag': '"abc"', 'Last-Modified': 'yesterday',
+                     'Content-Type': 'application/json'}))
+        cached = self.cache.get(self.STANDINGS_URL, self.headers)
+        self.assertEqual(cached.validators(),
+                         {'If-None-Match': '"abc"',
+                          'If-Modified-Since': 'yesterday'})
+
+    def test_revalidated(self):
+        cache = ResponseCache(path=self.path, ttl=0)
+        cache.set(self.STANDINGS_URL, self.headers, self.response())
+        cached = cache.get(self.STANDINGS_URL, self.headers)
+        stored = cached.stored
+        time.sleep(0.01)
+        cache.revalidated(cached)
+        self.assertTrue(cached.fresh)
+        self.assertGreater(cache.get(self.STANDINGS_URL, self.headers).stored,
+                           stored)
+
+    def test_lru_eviction(self):
+        body = '"' + 'x' * 1000 + '"'
+        cache = ResponseCache(path=self.path, max_size=2500)
+        cache.set(self.STANDINGS_URL, self.headers, self.response(body))
+        cache.set(self.SQUAD_URL, self.headers, self.response(body))
+        old = time.time() - 100
+        for name in os.listdir(self.path):
+            os.utime(os.path.join(self.path, name), (old, old))
+        cache.get(self.STANDINGS_URL, self.headers)  # now most recently used
+        cache.set(self.MATCHES_URL, self.headers, self.response(body))
+        self.assertIsNotNone(cache.get(self.STANDINGS_URL, self.headers))
+        self.assertIsNone(cache.get(self.SQUAD_URL, self.headers))
+        self.assertIsNotNone(cache.get(self.MATCHES_URL, self.headers))
+
+
+
+class TestMatchWindows(unittest.TestCase):
+
+    TODAY = datetime.date(2018, 8, 20)
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.headers = {'X-Auth-Token': 'token'}
+        self.windows = MatchWindows(ResponseCache(path=self.path))
+        self.fetched = []
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        first, last = int(url[-20:-18]), int(url[-2:])
+        return {'competition': {'id': 2021, 'name': 'Premier League'},
+                'matches': [match(day, '2018-08-{0:02d}T15:00:00Z'.format(day))
+                            for day in range(first, last + 1)]}
+
+    def get(self, url, fetch=True):
+        return self.windows.get(url, self.headers, self.fetch if fetch else None,
+                                today=self.TODAY)
+
+    def test_not_a_time_frame_query(self):
+        self.assertIsNone(self.get('competitions/2021/standings'))
+
+    def test_sub_range_filters_locally(self):
+        self.get('competitions/2021/matches?timeFrame=p6')
+        self.assertEqual(self.fetched, [
+            'competitions/2021/matches?dateFrom=2018-08-14&dateTo=2018-08-20'])
+        data = self.get('competitions/2021/matches?timeFrame=p2').json()
+        self.assertEqual(len(self.fetched), 1)
+        self.assertEqual([m['id'] for m in data['matches']], [18, 19, 20])
+        self.assertEqual(data['competition']['name'], 'Premier League')
+
+    def test_wider_range_fetches_missing_edges(self):
+        self.get('competitions/2021/matches?timeFrame=p2')
+        self.get('competitions/2021/matches?timeFrame=p6')
+        self.assertEqual(self.fetched[1:], [
+            'competitions/2021/matches?dateFrom=2018-08-14&dateTo=2018-08-17'])
+        self.get('matches?timeFrame=n3')
+        self.assertEqual(self.fetched[2:], ['matches?dateFrom=2018-08-20&dateTo=2018-08-23'])
+
+    def test_all_competitions_gaps_are_split(self):
+        data = self.get('matches?timeFrame=p10').json()
+        self.assertEqual(self.fetched, ['matches?dateFrom=2018-08-10&dateTo=2018-08-19',
+                                        'matches?dateFrom=2018-08-20&dateTo=2018-08-20'])
+        self.assertEqual([m['id'] for m in data['matches']], list(range(10, 21)))
+        self.get('competitions/2021/matches?timeFrame=p10')
+        self.assertEqual(self.fetched[2:], [
+            'competitions/2021/matches?dateFrom=2018-08-10&dateTo=2018-08-20'])
+
+    def test_recent_days_expire_sooner(self):
+        self.get('teams/57/matches?timeFrame=p6')
+        self.windows.cache.ttl = 0
+        data = self.get('teams/57/matches?timeFrame=p6').json()
+        self.assertEqual(self.fetched[1:], [
+            'teams/57/matches?dateFrom=2018-08-19&dateTo=2018-08-20'])
+        self.assertEqual([m['id'] for m in data['matches']], list(range(14, 21)))
+
+    def test_stale_ranges_without_fetch(self):
+        self.assertIsNone(self.get('matches?timeFrame=p2', fetch=False))
+        self.get('matches?timeFrame=p2')
+        self.windows.cache.ttl = 0
+        self.assertEqual(len(self.get('matches?timeFrame=p1', fetch=False).json()['matches']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
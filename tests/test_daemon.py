@@ -0,0 +1,140 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import mock
+import requests
+
+from soccer.cache import ResponseCache
+from soccer.daemon import DAEMON_FILE, Daemon, SingleFlight, find_daemon
+from soccer.exceptions import APIConnectionException, APIErrorException
+from soccer.offline import OfflineResponse
+from soccer.request_handler import DAEMON_TIMEOUT, RequestHandler
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_merges_concurrent_calls(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return 'data'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('url', fetch)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ['data'] * 5)
+        # finished calls aren't remembered
+        self.assertEqual(flight.do('url', lambda: 'again'), 'again')
+
+    def test_errors_reach_every_caller(self):
+        def fail():
+            raise APIErrorException('This resource is restricted')
+        self.assertRaises(APIErrorException, SingleFlight().do, 'url', fail)
+
+
+class TestDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.daemon_file = os.path.join(self.path, os.path.basename(DAEMON_FILE))
+        self.rh = mock.MagicMock()
+        self.rh._get.return_value.offline_reason = None
+        self.daemon = Daemon(self.rh, port=0)
+        self.thread = threading.Thread(target=self.daemon.serve, args=(self.daemon_file,))
+        self.thread.start()
+        for _ in range(100):
+            if os.path.exists(self.daemon_file):
+                break
+            time.sleep(0.01)
+
+    def tearDown(self):
+        self.daemon.shutdown()
+        self.thread.join()
+        shutil.rmtree(self.path)
+
+    def client(self):
+        url, secret = find_daemon(self.daemon_file)
+        return RequestHandler({}, {}, {}, None, daemon_url=url, daemon_secret=secret)
+
+    def test_proxies_requests(self):
+        self.rh._get.return_value.text = json.dumps({'standings': []})
+        self.assertEqual(self.client()._get('competitions/2021/standings').json(),
+                         {'standings': []})
+        self.rh._get.assert_called_once_with('competitions/2021/standings')
+
+    def test_local_data_is_labelled(self):
+        self.rh._get.return_value = OfflineResponse({'standings': []}, time.time() - 7200)
+        self.rh._get.return_value.offline_reason = 'Could not connect to the API.'
+        with mock.patch('click.secho') as secho:
+            response = self.client()._get('competitions/2021/standings')
+        self.assertEqual(response.json(), {'standings': []})
+        secho.assert_called_once_with('Could not connect to the API. Showing local data '
+                                      'from 2 hours ago.', fg='yellow', err=True)
+
+    def test_errors(self):
+        self.rh._get.side_effect = APIErrorException('This resource is restricted')
+        with self.assertRaises(APIErrorException) as cm:
+            self.client()._get('teams/1/')
+        self.assertEqual(cm.exception.args[0], 'This resource is restricted')
+
+    def test_advertised_while_running(self):
+        self.assertEqual(find_daemon(self.daemon_file), (self.daemon.url, self.daemon.secret))
+        self.assertEqual(os.stat(self.daemon_file).st_mode & 0o777, 0o600)
+
+    def test_not_evicted_from_the_response_cache(self):
+        cache = ResponseCache(path=self.path, max_size=0)
+        cache.set('teams/1/', {}, mock.MagicMock(text='{}', headers={}))
+        self.assertIsNone(cache.get('teams/1/', {}))
+        self.assertEqual(find_daemon(self.daemon_file), (self.daemon.url, self.daemon.secret))
+
+    def test_refuses_requests_without_the_secret(self):
+        for secret in ('wrong', None):
+            rh = RequestHandler({}, {}, {}, None, daemon_url=self.daemon.url,
+                                daemon_secret=secret)
+            with self.assertRaises(APIErrorException) as cm:
+                rh._get('teams/1/')
+            self.assertEqual(cm.exception.args[0], 'Missing or wrong soccer daemon secret.')
+        self.rh._get.assert_not_called()
+
+
+class TestDaemonFallback(unittest.TestCase):
+
+    def test_falls_back_when_daemon_is_gone(self):
+        rh = RequestHandler({}, {}, {}, None, daemon_url='http://127.0.0.1:1/')
+        with mock.patch.object(rh, '_get_online') as get_online:
+            rh._get('teams/1/')
+        get_online.assert_called_once_with('teams/1/')
+        self.assertIsNone(rh.daemon_url)
+
+    def test_busy_daemon_is_not_bypassed(self):
+        rh = RequestHandler({}, {}, {}, None, daemon_url='http://127.0.0.1:1/')
+        with mock.patch.object(rh.session, 'get',
+                               side_effect=requests.exceptions.ReadTimeout) as get, \
+                mock.patch.object(rh, '_get_online') as get_online:
+            self.assertRaises(APIConnectionException, rh._get, 'teams/1/')
+        self.assertEqual(get.call_args[1]['timeout'], DAEMON_TIMEOUT)
+        get_online.assert_not_called()
+        self.assertEqual(rh.daemon_url, 'http://127.0.0.1:1/')
+
+    def test_no_daemon_file(self):
+        self.assertIsNone(find_daemon(os.path.join(tempfile.gettempdir(), 'missing.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
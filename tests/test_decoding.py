@@ -0,0 +1,28 @@
+import json
+import unittest
+
+import mock
+
+from soccer import decoding
+from soccer.decoding import decode, load_backend
+
+
+class TestDecoding(unittest.TestCase):
+
+    def test_backends(self):
+        self.assertEqual(load_backend('json'), ('json', json.loads))
+        self.assertIn(load_backend()[0], decoding.BACKENDS)
+        self.assertRaises(ValueError, load_backend, 'yaml')
+
+    def test_decodes_raw_bytes(self):
+        response = mock.MagicMock(content=u'{"name": "München"}'.encode('utf-8'))
+        self.assertEqual(decode(response), {'name': u'München'})
+        self.assertFalse(response.json.called)
+
+    def test_other_responses_decode_themselves(self):
+        response = mock.MagicMock(**{'json.return_value': {'matches': []}})
+        self.assertEqual(decode(response), {'matches': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import functools
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+import api_data
+from api_data import KICKOFF
+from soccer.exceptions import APIErrorException
+from soccer.favourites import load_favourites, save_favourites
+from soccer.request_handler import RequestHandler
+
+TEAM_NAMES = {'ARS': '57', 'CHE': '61', 'BAY': '5'}
+
+match = functools.partial(api_data.match, competition={'name': 'Premier League'})
+
+
+class TestFavouritesFile(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.file = os.path.join(self.path, 'favourites')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_missing_file(self):
+        self.assertEqual(load_favourites(self.file), [])
+
+    def test_round_trip(self):
+        save_favourites(['ARS', 'BAY'], self.file)
+        with open(self.file, 'a') as f:
+            f.write('# comment\n\nars\nche\n')
+        self.assertEqual(load_favourites(self.file), ['ARS', 'BAY', 'CHE'])
+
+
+class TestFavouriteScores(unittest.TestCase):
+
+    def setUp(self):
+        self.writer = mock.MagicMock()
+        self.rh = RequestHandler({}, {}, TEAM_NAMES, self.writer,
+                                 session=mock.MagicMock())
+        self.rh._get_many = mock.MagicMock()
+
+    def rendered(self):
+        return [m.id for m in self.writer.team_scores.call_args[0][0]]
+
+    def test_short_time_frame_uses_one_request(self):
+        self.rh._get_many.return_value = [{'matches': [
+            match(2, '2018-08-11T14:00:00Z', 57, 61), match(1, KICKOFF, 5, 4),
+            match(3, KICKOFF, 10, 11)]}]
+        self.rh.get_favourite_scores(['ARS', 'CHE', 'BAY'], 6, False, False)
+        self.assertEqual(self.rh._get_many.call_args[0][0], ['matches?timeFrame=p6'])
+        self.assertEqual(self.rendered(), [1, 2])
+
+    def test_long_time_frame_fans_out_and_removes_duplicates(self):
+        self.rh._get_many.return_value = [
+            {'matches': [match(1, KICKOFF, 57, 61), match(2, '2018-08-01T14:00:00Z', 57, 1)]},
+            {'matches': [match(1, KICKOFF, 57, 61)]},
+            APIErrorException('This resource is restricted')]
+        with mock.patch('click.secho') as mock_click:
+            self.rh.get_favourite_scores(['ARS', 'CHE', 'BAY'], 30, True, False)
+        self.assertEqual(self.rh._get_many.call_args[0][0], [
+            'teams/5/matches?timeFrame=n30', 'teams/57/matches?timeFrame=n30',
+            'teams/61/matches?timeFrame=n30'])
+        self.assertEqual(self.rendered(), [2, 1])
+        mock_click.assert_called_with('This resource is restricted', fg="red", bold=True)
+
+    @mock.patch('click.secho')
+    def test_unknown_team(self, mock_click):
+        self.rh.get_favourite_scores(['XXX'], 6, False, False)
+        mock_click.assert_called_with('Team code XXX is not correct.', fg="red", bold=True)
+        self.assertFalse(self.rh._get_many.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
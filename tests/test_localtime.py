@@ -0,0 +1,39 @@
+import datetime
+import unittest
+
+from soccer.localtime import UTC, LocalTime, get_zone, parse_utc
+
+
+class TestLocalTime(unittest.TestCase):
+
+    def test_parse_utc(self):
+        self.assertEqual(parse_utc('2018-08-10T19:00:00Z'),
+                         datetime.datetime(2018, 8, 10, 19, 0, tzinfo=UTC))
+
+    def test_offset_on_kickoff_date(self):
+        # London is on BST in August and GMT in December
+        local_time = LocalTime(get_zone('Europe/London'))
+        self.assertEqual(local_time.format('2018-08-10T19:00:00Z', False), '20:00')
+        self.assertEqual(local_time.format('2018-12-10T19:00:00Z', False), '19:00')
+        self.assertEqual(local_time.format('2018-12-10T19:00:00Z', True, True),
+                         'Mon 10, 07:00 PM')
+
+    def test_passes_through_other_times(self):
+        self.assertEqual(LocalTime(UTC).format("45'", False), "45'")
+
+    def test_live_feed_time(self):
+        self.assertEqual(LocalTime(get_zone('Asia/Kolkata')).format('07:45 PM UTC', False),
+                         '01:15')
+
+    def test_memoized(self):
+        local_time = LocalTime(UTC)
+        local_time.format('2018-08-10T19:00:00Z', False)
+        local_time.localize = None  # a second conversion would fail
+        self.assertEqual(local_time.format('2018-08-10T19:00:00Z', False), '19:00')
+
+    def test_unknown_zone(self):
+        self.assertRaises(ValueError, get_zone, 'Mars/Olympus_Mons')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+from click.testing import CliRunner
+
+from api_data import KICKOFF, match
+from soccer import main, matchframe
+from soccer.store import MatchStore
+
+
+ARSENAL, CHELSEA = 57, 61
+
+
+class TestMain(unittest.TestCase):
+
+    def invoke(self, args):
+        with mock.patch.object(main, 'get_request_handler') as get_rh:
+            result = CliRunner().invoke(main.main, ['--apikey', 'token'] + args,
+                                        catch_exceptions=False)
+        self.assertEqual(result.exit_code, 0, result.output)
+        return get_rh
+
+    def test_stdout_is_the_default_format(self):
+        for args in (['--league', 'PL'], ['--league', 'PL', '--standings']):
+            writer = self.invoke(args).call_args[0][1]
+            self.assertEqual(type(writer).__name__, 'Stdout')
+
+    def test_format_flags(self):
+        writer = self.invoke(['--league', 'PL', '--json']).call_args[0][1]
+        self.assertEqual(type(writer).__name__, 'Json')
+
+    def test_mine_without_format_flag(self):
+        with mock.patch('soccer.favourites.load_favourites', return_value=['AFC']):
+            get_rh = self.invoke(['mine'])
+        self.assertEqual(type(get_rh.call_args[0][1]).__name__, 'Stdout')
+
+
+@unittest.skipIf(matchframe.np is None, 'numpy is not installed')
+class TestStats(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store_path = os.path.join(self.tmpdir, 'matches.db')
+        store = MatchStore(self.store_path)
+        store.add_matches([match(1, KICKOFF, ARSENAL, CHELSEA, 2, 0, competition={'id': 2021}),
+                           match(2, '2018-08-25T14:00:00Z', CHELSEA, ARSENAL, 3, 1,
+                                 competition={'id': 2021})])
+        store.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_team_stats_use_the_team_ids(self):
+        result = CliRunner().invoke(main.main, ['--apikey', 'token', 'stats', '--team', 'AFC',
+                                                '--against', 'CFC',
+                                                '--store', self.store_path],
+                                    catch_exceptions=False)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('Form (last 5): WL', result.output)
+        self.assertIn('Overall: P 2 W 1 D 0 L 1 GF 3 GA 3', result.output)
+        self.assertIn('Head to head against Chelsea FC: P 2 W 1 D 0 L 1', result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import functools
+import unittest
+
+import mock
+
+import api_data
+from soccer import matchframe
+from soccer.matchframe import MatchFrame
+
+match = functools.partial(api_data.match, competition={'id': 2021})
+
+
+MATCHES = [
+    match(1, '2018-08-10T19:00:00Z', 1, 2, 2, 0),
+    match(2, '2018-08-18T14:00:00Z', 3, 1, 1, 1),
+    match(3, '2018-08-25T14:00:00Z', 2, 1, 3, 1),
+    match(4, '2018-09-01T14:00:00Z', 2, 3, 0, 0),
+    match(5, '2018-09-15T14:00:00Z', 1, 3, None, None, status='SCHEDULED'),
+]
+
+
+@unittest.skipIf(matchframe.np is None, 'numpy is not installed')
+class TestMatchFrame(unittest.TestCase):
+
+    def setUp(self):
+        # out of kickoff order on purpose
+        self.frame = MatchFrame.from_matches(MATCHES[::-1])
+
+    def test_columns(self):
+        self.assertEqual(len(self.frame), 5)
+        self.assertEqual(self.frame.teams, [1, 3, 2])
+        self.assertEqual(self.frame.home_goals.tolist(), [-1, 0, 3, 1, 2])
+        self.assertEqual(int(self.frame.finished().sum()), 4)
+
+    def test_record_and_splits(self):
+        self.assertEqual(self.frame.record(1), {'played': 3, 'won': 1, 'draw': 1, 'lost': 1,
+                                                'goalsFor': 4, 'goalsAgainst': 4})
+        splits = self.frame.splits(1)
+        self.assertEqual(splits['home']['played'], 1)
+        self.assertEqual((splits['away']['draw'], splits['away']['lost']), (1, 1))
+
+    def test_form(self):
+        self.assertEqual(self.frame.form(1), 'WDL')
+        self.assertEqual(self.frame.form(1, 2), 'DL')
+        self.assertEqual(self.frame.form(2, 0), '')
+
+    def test_head_to_head(self):
+        record = self.frame.head_to_head(2, 1)
+        self.assertEqual((record['played'], record['won'], record['lost']), (2, 1, 1))
+        self.assertEqual((record['goalsFor'], record['goalsAgainst']), (3, 3))
+
+    def test_goals_per_game(self):
+        rows = self.frame.goals_per_game()
+        self.assertEqual([row[0] for row in rows], [1, 2, 3])
+        self.assertEqual(rows[0][1:], ('Arsenal', 3, 4 / 3., 4 / 3.))
+
+    def test_empty(self):
+        frame = MatchFrame.from_matches([])
+        self.assertEqual(len(frame), 0)
+        self.assertEqual(frame.goals_per_game(), [])
+
+
+class TestWithoutNumpy(unittest.TestCase):
+
+    def test_import_error(self):
+        with mock.patch.object(matchframe, 'np', None):
+            self.assertRaises(ImportError, MatchFrame.from_matches, MATCHES)
+
+
+if __name__ == '__main__':
+    unittest.main()
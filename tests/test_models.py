@@ -0,0 +1,53 @@
+import unittest
+
+from soccer.models import Match, Team, parse_matches, parse_players, parse_table
+
+
+def match(competition=None):
+    data = {'id': 1, 'utcDate': '2018-08-10T19:00:00Z', 'status': 'SCHEDULED',
+            'homeTeam': {'id': 66, 'name': 'Manchester United FC'},
+            'awayTeam': {'id': 338, 'name': 'Leicester City FC'},
+            'score': {'fullTime': {'homeTeam': None, 'awayTeam': None}}}
+    if competition:
+        data['competition'] = {'id': 2021, 'name': competition}
+    return data
+
+
+def row(position):
+    return {'position': position, 'team': {'id': position, 'name': 'Team %d' % position},
+            'playedGames': 1, 'won': 1, 'draw': 0, 'lost': 0, 'points': 3,
+            'goalsFor': 2, 'goalsAgainst': 0, 'goalDifference': 2}
+
+
+class TestModels(unittest.TestCase):
+
+    def test_parse_matches(self):
+        matches = parse_matches({'competition': {'name': 'Premier League'},
+                                 'matches': [match(), match('Bundesliga')]})
+        self.assertEqual([m.competition for m in matches], ['Premier League', 'Bundesliga'])
+        self.assertEqual(matches[0].home_team.name, 'Manchester United FC')
+        self.assertEqual(matches[0].date, '2018-08-10')
+        self.assertIsNone(matches[0].home_goals)
+        self.assertFalse(matches[0].finished)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(Match.from_api(match()), '__dict__'))
+
+    def test_parse_table_uses_total_table(self):
+        data = {'standings': [{'type': 'HOME', 'table': [row(2)]},
+                              {'type': 'TOTAL', 'table': [row(1), row(2)]}]}
+        table = parse_table(data)
+        self.assertEqual([r.team.name for r in table], ['Team 1', 'Team 2'])
+        self.assertEqual(parse_table({}), [])
+
+    def test_parse_players(self):
+        players = parse_players([{'name': 'David de Gea', 'position': 'Goalkeeper',
+                                  'shirtNumber': 1, 'nationality': 'Spain',
+                                  'dateOfBirth': '1990-11-07', 'role': 'PLAYER'}],
+                                Team(66, 'Manchester United FC'))
+        self.assertEqual((players[0].shirt_number, players[0].role), (1, 'PLAYER'))
+        self.assertEqual(players[0].team.id, 66)
+
+
+if __name__ == '__main__':
+    unittest.main()
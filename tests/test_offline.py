@@ -0,0 +1,100 @@
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from api_data import match
+from soccer.cache import ResponseCache
+from soccer.exceptions import APIConnectionException, APIErrorException
+from soccer.offline import format_age, matches_from_store, time_frame_dates
+from soccer.request_handler import RequestHandler
+from soccer.store import MatchStore
+
+LEAGUE_IDS = {'PL': 2021, 'BL': 2002}
+TODAY = datetime.date(2018, 8, 20)
+
+
+class TestOffline(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = MatchStore(os.path.join(self.path, 'matches.db'))
+        self.store.add_matches([match(1, '2018-08-10T19:00:00Z'),
+                                match(2, '2018-08-18T14:00:00Z', 3, 4),
+                                match(3, '2018-08-22T14:00:00Z', 2, 3)], 2021)
+        self.cache = ResponseCache(path=os.path.join(self.path, 'cache'))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.path)
+
+    def handler(self, **kwargs):
+        return RequestHandler({'X-Auth-Token': 'token'}, LEAGUE_IDS, {}, None,
+                              cache=self.cache, store=self.store,
+                              session=mock.MagicMock(), **kwargs)
+
+    def test_format_age(self):
+        self.assertEqual(format_age(30), 'just now')
+        self.assertEqual(format_age(60), '1 minute ago')
+        self.assertEqual(format_age(3 * 3600 + 5), '3 hours ago')
+
+    def test_time_frame_dates(self):
+        self.assertEqual(time_frame_dates('p', '6', TODAY),
+                         (datetime.date(2018, 8, 14), TODAY))
+        self.assertEqual(time_frame_dates('n', '3', TODAY),
+                         (TODAY, datetime.date(2018, 8, 23)))
+
+    def test_competition_time_frame(self):
+        response = matches_from_store(self.store, 'competitions/2021/matches?timeFrame=p6',
+                                      LEAGUE_IDS, TODAY)
+        data = response.json()
+        self.assertEqual([m['id'] for m in data['matches']], [2])
+        self.assertEqual(data['competition']['name'], 'PL')
+
+    def test_team_time_frame(self):
+        response = matches_from_store(self.store, 'teams/2/matches?timeFrame=n5',
+                                      LEAGUE_IDS, TODAY)
+        self.assertEqual([m['id'] for m in response.json()['matches']], [3])
+
+    def test_unsupported_query(self):
+        self.assertIsNone(matches_from_store(self.store, 'teams/2/', LEAGUE_IDS, TODAY))
+        self.assertIsNone(matches_from_store(
+            self.store, 'competitions/2002/matches?timeFrame=p6', LEAGUE_IDS, TODAY))
+
+    @mock.patch('click.secho')
+    def test_offline_serves_stale_cache_without_network(self, mock_click):
+        self.cache.set('teams/66/', {'X-Auth-Token': 'token'},
+                       mock.MagicMock(text='{"squad": []}', headers={}))
+        rq = self.handler(offline=True)
+        self.assertEqual(rq._get('teams/66/').json(), {'squad': []})
+        self.assertFalse(rq.session.get.called)
+        self.assertIn('Showing local data from just now', mock_click.call_args[0][0])
+
+    @mock.patch('click.secho')
+    def test_offline_without_data(self, mock_click):
+        rq = self.handler(offline=True)
+        with self.assertRaises(APIErrorException):
+            rq._get('teams/57/')
+
+    @mock.patch('click.secho')
+    def test_standings_computed_from_store(self, mock_click):
+        rq = self.handler(offline=True)
+        table = rq._get('competitions/2021/standings').json()['standings'][0]['table']
+        self.assertEqual([row['points'] for row in table], [3, 3, 3, 0])
+
+    @mock.patch('click.secho')
+    def test_falls_back_when_connection_fails(self, mock_click):
+        rq = self.handler()
+        self.cache.set('competitions/2021/standings', {'X-Auth-Token': 'token'},
+                       mock.MagicMock(text='{"standings": []}', headers={}))
+        with mock.patch.object(rq, '_get_online',
+                               side_effect=APIConnectionException('Could not connect.')):
+            self.assertEqual(rq._get('competitions/2021/standings').json(),
+                             {'standings': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from soccer.cache import ResponseCache
+from soccer.profiler import Profiler
+from soccer.request_handler import RequestHandler
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.profiler = Profiler(clock=self.clock)
+
+    def test_spans(self):
+        for seconds in (0.5, 1.5):
+            with self.profiler.span('http'):
+                self.clock.now += seconds
+        self.assertEqual(self.profiler.spans['http'], {'count': 2, 'seconds': 2.0, 'max': 1.5})
+
+    def test_response(self):
+        response = mock.MagicMock(content=b'x' * 10,
+                                  headers={'X-Requests-Available-Minute': '7'})
+        self.profiler.response(response)
+        self.profiler.response(response)
+        self.assertEqual(self.profiler.counters, {'requests': 2, 'bytes_received': 20})
+        self.assertEqual(self.profiler.gauges, {'rate_limit_remaining': 7})
+
+    def test_summary(self):
+        with self.profiler.span('render'):
+            self.clock.now += 0.25
+        with self.profiler.span('http'):
+            self.clock.now += 0.5
+        self.profiler.count('cache_hits', 3)
+        self.profiler.count('cache_misses')
+        lines = self.profiler.summary()
+        self.assertEqual([line.split()[0] for line in lines[1:4]], ['http', 'render', 'run'])
+        self.assertIn('cache hit rate: 75% of 4', lines)
+
+    def test_export(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        with self.profiler.span('decode'):
+            self.clock.now += 2
+        self.profiler.count('requests')
+
+        self.profiler.export(os.path.join(path, 'metrics.prom'))
+        with open(os.path.join(path, 'metrics.prom')) as f:
+            text = f.read()
+        self.assertIn('soccer_span_seconds_total{phase="decode"} 2.0\n', text)
+        self.assertIn('# TYPE soccer_requests_total counter\nsoccer_requests_total 1\n', text)
+
+        self.profiler.export(os.path.join(path, 'metrics.json'))
+        with open(os.path.join(path, 'metrics.json')) as f:
+            data = json.load(f)
+        self.assertEqual(data['spans']['decode']['seconds'], 2)
+        self.assertEqual(data['counters'], {'requests': 1})
+
+
+class TestRequestHandlerProfiling(unittest.TestCase):
+
+    def test_cache_hits_and_misses(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        profiler = Profiler()
+        session = mock.MagicMock()
+        session.get.return_value = mock.MagicMock(status_code=200, text='{}', content=b'{}',
+                                                  headers={})
+        rh = RequestHandler({}, {}, {}, None, cache=ResponseCache(path=path),
+                            session=session, profiler=profiler)
+        rh._get('teams/57/')
+        rh._get('teams/57/')
+        self.assertEqual(profiler.counters,
+                         {'cache_misses': 1, 'cache_hits': 1, 'requests': 1, 'bytes_received': 2})
+        self.assertEqual(profiler.spans['http']['count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
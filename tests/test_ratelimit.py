@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from soccer.ratelimit import RateLimiter, retry_delay
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def limiter(self, **kwargs):
+        return RateLimiter(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_burst_then_spaced(self):
+        limiter = self.limiter(capacity=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        limiter.acquire()
+        self.assertAlmostEqual(sum(self.clock.sleeps), 30.0)
+
+    def test_learns_quota_from_headers(self):
+        limiter = self.limiter(capacity=10)
+        limiter.update({'X-Requests-Available-Minute': '29',
+                        'X-RequestCounter-Reset': '60'})
+        self.assertEqual(limiter.capacity, 30)
+        self.assertEqual(limiter.tokens, 29)
+
+    def test_exhausted_quota_waits_for_reset(self):
+        limiter = self.limiter(capacity=10)
+        limiter.update({'X-Requests-Available-Minute': '0',
+                        'X-RequestCounter-Reset': '42'})
+        limiter.acquire()
+        self.assertAlmostEqual(sum(self.clock.sleeps), 42.0)
+
+    def test_ignores_missing_headers(self):
+        limiter = self.limiter(capacity=10)
+        limiter.update({})
+        self.assertEqual(limiter.tokens, 10)
+
+    def test_shared_lock_file(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        lock_file = os.path.join(path, 'ratelimit.lock')
+        first = self.limiter(capacity=1, lock_file=lock_file)
+        second = self.limiter(capacity=1, lock_file=lock_file)
+        first.acquire()
+        second.acquire()
+        self.assertAlmostEqual(sum(self.clock.sleeps), 60.0)
+
+
+class TestRetryDelay(unittest.TestCase):
+
+    def test_retry_after_seconds(self):
+        response = mock.MagicMock(headers={'Retry-After': '7'})
+        self.assertEqual(retry_delay(response, 0), 7)
+
+    def test_counter_reset(self):
+        response = mock.MagicMock(status_code=429, headers={'X-RequestCounter-Reset': '12'})
+        self.assertEqual(retry_delay(response, 3), 12)
+
+    def test_server_errors_back_off(self):
+        # the counter reset is sent with every response, not only throttled ones
+        response = mock.MagicMock(status_code=503, headers={'X-RequestCounter-Reset': '47'})
+        for attempt in range(4):
+            self.assertTrue(0 <= retry_delay(response, attempt) <= 2 ** attempt)
+
+    def test_jittered_backoff(self):
+        response = mock.MagicMock(headers={})
+        for attempt in range(4):
+            self.assertTrue(0 <= retry_delay(response, attempt) <= 2 ** attempt)
+
+
+if __name__ == '__main__':
+    unittest.main()
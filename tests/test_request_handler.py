@@ -42,7 +42,7 @@ class TestRequestHandler(unittest.TestCase):
     def tearDown(self):
         pass
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_ok_code(self, mock_call):
         mock_call.return_value = mock.MagicMock(
                 status_code=requests.codes.ok,
@@ -52,7 +52,7 @@ class TestRequestHandler(unittest.TestCase):
         except APIErrorException:
             self.fail("Threw exception erroneously")
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_bad_code(self, mock_call):
         mock_call.return_value = mock.MagicMock(
                 status_code=requests.codes.bad,
@@ -62,7 +62,7 @@ class TestRequestHandler(unittest.TestCase):
         self.assertTrue("Invalid request. "
                         "Check parameters." in context.exception)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_forbidden_code(self, mock_call):
         mock_call.return_value = mock.MagicMock(
                 status_code=requests.codes.forbidden,
@@ -71,7 +71,7 @@ class TestRequestHandler(unittest.TestCase):
             self.rq._get(self.dummy_url)
         self.assertTrue('This resource is restricted' in context.exception)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_not_found_code(self, mock_call):
         mock_call.return_value = mock.MagicMock(
                 status_code=requests.codes.not_found,
@@ -81,7 +81,7 @@ class TestRequestHandler(unittest.TestCase):
         self.assertTrue("This resource does not exist. "
                         "Check parameters" in context.exception)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_too_many_requests_code(self, mock_call):
         mock_call.return_value = mock.MagicMock(
                 status_code=requests.codes.too_many_requests,
@@ -91,8 +91,72 @@ class TestRequestHandler(unittest.TestCase):
         self.assertTrue("You have exceeded your allowed "
                         "requests per minute/day" in context.exception)
 
+    def test_injected_session(self):
+        session = mock.MagicMock()
+        session.get.return_value = mock.MagicMock(status_code=requests.codes.ok)
+        rq = RequestHandler({}, {}, {}, get_writer(), session=session,
+                            timeout=(1, 2))
+        rq._get(self.dummy_url)
+        session.get.assert_called_once_with(
+            RequestHandler.BASE_URL + self.dummy_url, headers={},
+            timeout=(1, 2))
+
+    @mock.patch('requests.Session.get')
+    def test_connection_error(self, mock_call):
+        mock_call.side_effect = requests.exceptions.ConnectTimeout()
+        with self.assertRaises(APIErrorException):
+            self.rq._get(self.dummy_url)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_retries_throttled_request(self, mock_call, mock_sleep):
+        throttled = mock.MagicMock(status_code=requests.codes.too_many_requests,
+                                   headers={'Retry-After': '2'})
+        ok = mock.MagicMock(status_code=requests.codes.ok, headers={})
+        mock_call.side_effect = [throttled, ok]
+        self.rq.max_retries = 3
+        self.assertIs(self.rq._get(self.dummy_url), ok)
+        mock_sleep.assert_called_once_with(2)
+
+    @mock.patch('time.sleep')
+    @mock.patch('requests.Session.get')
+    def test_gives_up_after_max_retries(self, mock_call, mock_sleep):
+        mock_call.return_value = mock.MagicMock(
+                status_code=requests.codes.service_unavailable, headers={})
+        self.rq.max_retries = 2
+        with self.assertRaises(APIErrorException):
+            self.rq._get(self.dummy_url)
+        self.assertEqual(mock_call.call_count, 3)
+
+    @mock.patch('requests.Session.get')
+    def test_unexpected_code(self, mock_call):
+        mock_call.return_value = mock.MagicMock(status_code=418)
+        with self.assertRaises(APIErrorException):
+            self.rq._get(self.dummy_url)
+
+    @mock.patch('requests.Session.get')
+    def test_fresh_cache_skips_request(self, mock_call):
+        cached = mock.MagicMock(fresh=True)
+        self.rq.cache = mock.MagicMock()
+        self.rq.cache.get.return_value = cached
+        self.assertIs(self.rq._get(self.dummy_url), cached)
+        self.assertFalse(mock_call.called)
+
+    @mock.patch('requests.Session.get')
+    def test_not_modified_revalidates_cache(self, mock_call):
+        mock_call.return_value = mock.MagicMock(
+                status_code=requests.codes.not_modified)
+        cached = mock.MagicMock(fresh=False)
+        cached.validators.return_value = {'If-None-Match': '"abc"'}
+        self.rq.cache = mock.MagicMock()
+        self.rq.cache.get.return_value = cached
+        self.rq._get(self.dummy_url)
+        self.assertEqual(mock_call.call_args[1]['headers']['If-None-Match'],
+                         '"abc"')
+        self.rq.cache.revalidated.assert_called_once_with(cached)
+
     @mock.patch('soccer.writers.Stdout.live_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_live_scores_ok(self, mock_request_call, mock_writer):
         mock_request_call.side_effect = \
             [mocked_requests_get({'games': [1, 2]}, 200)]
@@ -102,7 +166,7 @@ class TestRequestHandler(unittest.TestCase):
 
     @mock.patch('click.secho')
     @mock.patch('soccer.writers.Stdout.live_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_live_scores_0_games(self,
                                      mock_request_call, mock_writer,
                                      mock_click):
@@ -116,7 +180,7 @@ class TestRequestHandler(unittest.TestCase):
 
     @mock.patch('click.secho')
     @mock.patch('soccer.writers.Stdout.live_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_live_scores_error(self,
         mock_request_call, mock_writer, mock_click):
         mock_request_call.side_effect = \
@@ -128,7 +192,7 @@ class TestRequestHandler(unittest.TestCase):
         mock_writer.assert_called_once()
 
     @mock.patch('soccer.writers.Stdout.team_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_team_scores_ok(self,
                                 mock_request_call, mock_writer):
         mock_request_call.side_effect = \
@@ -140,7 +204,7 @@ class TestRequestHandler(unittest.TestCase):
 
     @mock.patch('click.secho')
     @mock.patch('soccer.writers.Stdout.team_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_team_scores_0_fixtures(self,
                                         mock_request_call,
                                         mock_writer, mock_click):
@@ -157,7 +221,7 @@ class TestRequestHandler(unittest.TestCase):
 
     @mock.patch('click.secho')
     @mock.patch('soccer.writers.Stdout.team_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_team_scores_bad_id(self,
         mock_request_call, mock_writer, mock_click):
         mock_request_call.side_effect = \
@@ -169,7 +233,7 @@ class TestRequestHandler(unittest.TestCase):
         mock_writer.assert_called_once()
 
     @mock.patch('click.secho')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_standings_error(self,
         mock_request_call, mock_click):
         mock_request_call.side_effect = \
@@ -181,7 +245,7 @@ class TestRequestHandler(unittest.TestCase):
                     fg="red", bold=True)
 
     @mock.patch('soccer.writers.Stdout.standings')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_standings_ok(self,
                                     mock_request_call,
                                     mock_writer):
@@ -192,7 +256,7 @@ class TestRequestHandler(unittest.TestCase):
         mock_writer.assert_called_once()
 
     @mock.patch('click.secho')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_league_scores_error(self,
                                     mock_request_call,
                                     mock_click):
@@ -204,7 +268,7 @@ class TestRequestHandler(unittest.TestCase):
                 "for the given league.", fg="red", bold=True)
 
     @mock.patch('click.secho')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_league_scores_no_fixtures(self,
                                     mock_request_call,
                                     mock_click):
@@ -218,7 +282,7 @@ class TestRequestHandler(unittest.TestCase):
                 fg="red", bold=True)
 
     @mock.patch('soccer.writers.Stdout.league_scores')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_league_scores_multiple_fixtures(self,
                                     mock_request_call,
                                     mock_writer):
@@ -230,7 +294,7 @@ class TestRequestHandler(unittest.TestCase):
         mock_writer.assert_called_once()
 
     @mock.patch('click.secho')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_team_players_error(self,
                                     mock_request_call,
                                     mock_click):
@@ -240,7 +304,7 @@ class TestRequestHandler(unittest.TestCase):
                 "Please check the team code.", bold=True, fg="red")
 
     @mock.patch('click.secho')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_team_players_no_players(self,
                                     mock_request_call,
                                     mock_click):
@@ -251,7 +315,7 @@ class TestRequestHandler(unittest.TestCase):
                 "for this team", fg="red", bold=True)
 
     @mock.patch('soccer.writers.Stdout.team_players')
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_get_team_players_no_players(self,
                                     mock_request_call,
                                     mock_writer):
@@ -261,5 +325,39 @@ class TestRequestHandler(unittest.TestCase):
         self.rq.get_team_players(TestRequestHandler.VALID_TEAM_CODE)
         mock_writer.assert_called_once()
 
+    @mock.patch('soccer.writers.Stdout.league_scores')
+    @mock.patch('requests.Session.get')
+    def test_get_multi_league_scores(self, mock_request_call, mock_writer):
+        def fake_get(url, **kwargs):
+            competition = {'name': url.split('/')[-2]}
+            return mock.MagicMock(status_code=requests.codes.ok, **{
+                'json.return_value': {'competition': competition, 'matches': [
+                    {'id': url, 'homeTeam': {'name': 'Home'}, 'awayTeam': {'name': 'Away'},
+                     'score': {'fullTime': {'homeTeam': 1, 'awayTeam': 0}}}]}})
+        mock_request_call.side_effect = fake_get
+        self.rq.get_league_scores(['BL', 'PL'], 6, False, False)
+        matches = mock_writer.call_args[0][0]
+        self.assertEqual([m.competition for m in matches],
+                         [str(leagueids.LEAGUE_IDS['BL']),
+                          str(leagueids.LEAGUE_IDS['PL'])])
+
+    @mock.patch('click.secho')
+    @mock.patch('soccer.writers.Stdout.standings')
+    @mock.patch('requests.Session.get')
+    def test_get_multi_league_standings_partial_error(self, mock_request_call,
+                                                      mock_writer, mock_click):
+        ok = mock.MagicMock(status_code=requests.codes.ok, **{
+            'json.return_value': {'competition': {'name': 'Bundesliga'},
+                                  'standings': [{'table': []}]}})
+        not_found = mock.MagicMock(status_code=requests.codes.not_found)
+        mock_request_call.side_effect = lambda url, **kwargs: (
+            ok if str(leagueids.LEAGUE_IDS['BL']) in url else not_found)
+        self.rq.get_standings(['BL', 'PL'])
+        mock_click.assert_called_with("No standings availble for PL.",
+                                      fg="red", bold=True)
+        tables = mock_writer.call_args[0][0]
+        self.assertEqual(tables, [('BL', [])])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,121 @@
+import functools
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+import api_data
+from api_data import KICKOFF
+from soccer.exceptions import APIErrorException
+from soccer.request_handler import RequestHandler
+from soccer.standings import StandingsTable, standings_from_store
+from soccer.store import MatchStore
+
+LEAGUE_IDS = {'PL': 2021, 'SA': 2019}
+SEASON = {'id': 151, 'startDate': '2018-08-10', 'endDate': '2019-05-12'}
+
+match = functools.partial(api_data.match, season=SEASON)
+
+
+class TestStandingsTable(unittest.TestCase):
+
+    def test_totals(self):
+        table = StandingsTable('PL')
+        table.add_matches([match(1, KICKOFF, 1, 2, 2, 0), match(2, KICKOFF, 3, 1, 1, 1),
+                           match(3, KICKOFF, 2, 3, 0, 0, status='SCHEDULED')])
+        rows = table.table()
+        self.assertEqual([row['team']['name'] for row in rows],
+                         ['Arsenal', 'Everton', 'Chelsea'])
+        arsenal = rows[0]
+        self.assertEqual((arsenal['playedGames'], arsenal['won'], arsenal['draw'],
+                          arsenal['lost'], arsenal['points'], arsenal['goalsFor'],
+                          arsenal['goalsAgainst'], arsenal['goalDifference']),
+                         (2, 1, 1, 0, 4, 3, 1, 2))
+        self.assertEqual([row['position'] for row in rows], [1, 2, 3])
+
+    def test_corrected_result_replaces_previous(self):
+        table = StandingsTable('PL')
+        table.add_match(match(1, KICKOFF, 1, 2, 2, 0))
+        table.add_match(match(1, KICKOFF, 1, 2, 0, 1))
+        rows = dict((row['team']['id'], row) for row in table.table())
+        self.assertEqual((rows[1]['playedGames'], rows[1]['points']), (1, 0))
+        self.assertEqual((rows[2]['won'], rows[2]['points']), (1, 3))
+
+    def test_goal_difference_tiebreak(self):
+        table = StandingsTable('PL')
+        table.add_matches([match(1, KICKOFF, 1, 3, 1, 0), match(2, KICKOFF, 2, 4, 3, 0),
+                           match(3, KICKOFF, 3, 2, 1, 0), match(4, KICKOFF, 4, 1, 1, 0)])
+        self.assertEqual([row['team']['id'] for row in table.table()][:2], [2, 1])
+
+    def test_head_to_head_tiebreak(self):
+        # Arsenal and Chelsea are level on points, Chelsea has the better
+        # goal difference but lost the match between them
+        table = StandingsTable('SA')
+        table.add_matches([match(1, KICKOFF, 1, 2, 1, 0), match(2, KICKOFF, 2, 3, 5, 0),
+                           match(3, KICKOFF, 4, 1, 1, 0), match(4, KICKOFF, 4, 2, 1, 0)])
+        self.assertEqual([row['team']['id'] for row in table.table()][:3], [4, 1, 2])
+
+    def test_head_to_head_after_goal_difference(self):
+        # Arsenal, Chelsea and Everton are level on points, Arsenal has the
+        # better goal difference and Everton won the match against Chelsea,
+        # the only other team level with it on goals
+        table = StandingsTable('BL')
+        table.add_matches([match(1, KICKOFF, 3, 2, 1, 0), match(2, KICKOFF, 2, 1, 1, 0),
+                           match(3, KICKOFF, 1, 3, 1, 0), match(4, KICKOFF, 1, 4, 3, 0),
+                           match(5, KICKOFF, 2, 4, 1, 0), match(6, KICKOFF, 3, 4, 1, 0)])
+        self.assertEqual([row['team']['id'] for row in table.table()], [1, 3, 2, 4])
+
+    def test_payload_is_fresh(self):
+        table = StandingsTable('PL')
+        table.add_match(match(1, KICKOFF, 1, 2, 2, 0))
+        table.as_payload()['standings'][0]['table'][0]['goalDifference'] = '+2'
+        self.assertEqual(table.table()[0]['goalDifference'], 2)
+
+
+class TestLocalStandings(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = MatchStore(os.path.join(self.path, 'matches.db'))
+        self.store.add_matches([match(1, KICKOFF, 1, 2, 2, 0),
+                                match(2, '2018-08-11T14:00:00Z', 3, 4, 1, 1),
+                                # last season's match isn't counted
+                                dict(match(3, '2018-05-13T14:00:00Z', 4, 1, 5, 0),
+                                     season={'id': 23})], 2021)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.path)
+
+    def test_standings_from_store(self):
+        table = standings_from_store(self.store, 'PL', 2021)
+        self.assertEqual(table.competition, {'id': 2021, 'name': 'PL'})
+        self.assertEqual(len(table.results), 2)
+        self.assertIsNone(standings_from_store(self.store, 'SA', 2019))
+
+    def test_refresh_reads_new_results_only(self):
+        table = standings_from_store(self.store, 'PL', 2021)
+        self.store.add_matches([match(4, '2018-08-18T14:00:00Z', 2, 3, 0, 3)], 2021)
+        with mock.patch.object(self.store, 'matches', wraps=self.store.matches) as matches:
+            table.refresh(self.store)
+        self.assertIsNotNone(matches.call_args[1]['updated_since'])
+        self.assertEqual(len(table.results), 3)
+        self.assertEqual(table.table()[0]['team']['name'], 'Everton')
+
+    def test_request_handler_local_standings(self):
+        writer = mock.MagicMock()
+        session = mock.MagicMock()
+        rh = RequestHandler({'X-Auth-Token': 'token'}, LEAGUE_IDS, {}, writer,
+                            session=session, store=self.store, local_standings=True)
+        rh.get_standings('PL')
+        self.assertFalse(session.get.called)
+        tables, league = writer.standings.call_args[0]
+        self.assertEqual(league, 'PL')
+        self.assertEqual(tables[0][1][0].team.name, 'Arsenal')
+        self.assertRaises(APIErrorException, rh._get, 'competitions/2019/standings')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(code):
+    """Runs code in a fresh interpreter, returning the modules it imported"""
+    code += '\nimport sys; sys.stderr.write(" ".join(sys.modules))'
+    env = dict(os.environ, SOCCER_CLI_API_TOKEN='0' * 32, PYTHONPATH=ROOT)
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          universal_newlines=True)
+    return set(proc.stderr.split())
+
+
+def cli_modules(argv):
+    """Returns the modules imported by running the CLI with argv"""
+    return imported_modules('import sys; sys.argv = {0!r}\n'
+                            'from soccer.main import main\n'
+                            'try:\n'
+                            '    main()\n'
+                            'except SystemExit:\n'
+                            '    pass'.format(['soccer'] + argv))
+
+
+class TestStartup(unittest.TestCase):
+
+    NETWORK_MODULES = ['requests', 'soccer.request_handler', 'soccer.cache',
+                       'soccer.ratelimit']
+
+    def test_list_imports_no_network_modules(self):
+        modules = cli_modules(['--list'])
+        self.assertIn('soccer.main', modules)
+        for module in self.NETWORK_MODULES + ['soccer.writers.stdoutwriter']:
+            self.assertNotIn(module, modules)
+
+    def test_lookup_imports_no_network_modules(self):
+        modules = cli_modules(['--team', 'MUFC', '--lookup'])
+        for module in self.NETWORK_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_get_writer_imports_only_chosen_writer(self):
+        modules = imported_modules('from soccer.writers import get_writer\n'
+                                   'get_writer("stdout")')
+        self.assertIn('soccer.writers.stdoutwriter', modules)
+        self.assertNotIn('csv', modules)
+        self.assertNotIn('soccer.writers.csvwriter', modules)
+        self.assertNotIn('soccer.writers.jsonwriter', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import datetime
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mock
+
+from api_data import match
+from soccer.backfill import backfill, date_windows
+from soccer.exceptions import APIErrorException
+from soccer.request_handler import MAX_WORKERS
+from soccer.store import MatchStore
+
+
+class TestMatchStore(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = MatchStore(os.path.join(self.path, 'matches.db'))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.path)
+
+    def test_add_and_filter(self):
+        self.store.add_matches([match(1, '2018-08-10T19:00:00Z'),
+                                match(2, '2018-08-11T14:00:00Z', 3, 4),
+                                match(3, '2018-08-20T14:00:00Z', 2, 3)], 2021)
+        self.assertEqual(len(self.store.matches(competition_id=2021)), 3)
+        self.assertEqual([m['id'] for m in self.store.matches(team_id=2)], [1, 3])
+        self.assertEqual([m['id'] for m in self.store.matches(
+            date_from='2018-08-11', date_to='2018-08-11')], [2])
+
+    def test_upsert(self):
+        self.store.add_matches([match(1, '2018-08-10T19:00:00Z', status='SCHEDULED')], 2021)
+        self.store.add_matches([match(1, '2018-08-10T19:00:00Z')], 2021)
+        matches = self.store.matches()
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]['status'], 'FINISHED')
+
+    def test_windows(self):
+        self.assertFalse(self.store.has_window(2021, '2018-08-01', '2018-08-10'))
+        self.store.add_window(2021, '2018-08-01', '2018-08-10')
+        self.assertTrue(self.store.has_window(2021, '2018-08-01', '2018-08-10'))
+
+    def test_windows_cover_other_ranges(self):
+        self.store.add_window(2021, '2018-08-01', '2018-08-10')
+        self.store.add_window(2021, '2018-08-05', '2018-08-14')
+        self.store.add_window(2021, '2018-08-15', '2018-08-20')
+        self.assertTrue(self.store.has_window(2021, '2018-08-01', '2018-08-20'))
+        self.assertTrue(self.store.has_window(2021, '2018-08-03', '2018-08-07'))
+        self.assertTrue(self.store.has_window(2021, '2018-08-20', '2018-08-20'))
+        self.assertFalse(self.store.has_window(2021, '2018-07-31', '2018-08-05'))
+        self.assertFalse(self.store.has_window(2021, '2018-08-18', '2018-08-21'))
+        self.assertFalse(self.store.has_window(2022, '2018-08-03', '2018-08-07'))
+
+        self.store.add_window(2021, '2018-08-22', '2018-08-25')
+        self.assertFalse(self.store.has_window(2021, '2018-08-15', '2018-08-25'))
+
+
+class TestBackfill(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = MatchStore(os.path.join(self.path, 'matches.db'))
+        self.rh = mock.MagicMock(league_ids={'PL': 2021})
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.path)
+
+    def test_date_windows(self):
+        windows = list(date_windows(datetime.date(2018, 8, 1),
+                                    datetime.date(2018, 8, 25), 10))
+        self.assertEqual(windows, [
+            (datetime.date(2018, 8, 1), datetime.date(2018, 8, 10)),
+            (datetime.date(2018, 8, 11), datetime.date(2018, 8, 20)),
+            (datetime.date(2018, 8, 21), datetime.date(2018, 8, 25))])
+
+    def run_backfill(self, today=datetime.date(2019, 1, 1)):
+        return backfill(self.rh, self.store, 'PL', datetime.date(2018, 8, 1),
+                        datetime.date(2018, 8, 25), 10, today=today)
+
+    def test_resumes_and_skips_stored_windows(self):
+        def get(url):
+            if 'dateFrom=2018-08-11' in url:
+                raise APIErrorException('You have exceeded your allowed requests')
+            return mock.MagicMock(**{'json.return_value': {'matches': [
+                match(int(url[-2:]), '2018-08-01T14:00:00Z')]}})
+        self.rh._get.side_effect = get
+        fetched, stored, failed = self.run_backfill()
+        self.assertEqual((fetched, stored, len(failed)), (2, 2, 1))
+
+        self.rh._get.reset_mock()
+        self.rh._get.side_effect = None
+        self.rh._get.return_value.json.return_value = {'matches': []}
+        fetched, stored, failed = self.run_backfill()
+        self.assertEqual(fetched, 1)
+        self.assertIn('dateFrom=2018-08-11', self.rh._get.call_args[0][0])
+
+    def test_skips_ranges_stored_with_other_windows(self):
+        self.rh._get.return_value.json.return_value = {'matches': []}
+        backfill(self.rh, self.store, 'PL', datetime.date(2018, 8, 1),
+                 datetime.date(2018, 8, 25), 5, today=datetime.date(2019, 1, 1))
+        self.assertEqual(self.run_backfill()[0], 0)
+
+    def test_interrupt_stops_fetching(self):
+        def get(url):
+            if self.rh._get.call_count > 1:
+                time.sleep(0.2)
+            return mock.MagicMock(**{'json.return_value': {'matches': []}})
+
+        def progress(window, count):
+            raise KeyboardInterrupt
+        self.rh._get.side_effect = get
+        with self.assertRaises(KeyboardInterrupt):
+            backfill(self.rh, self.store, 'PL', datetime.date(2018, 8, 1),
+                     datetime.date(2018, 9, 30), 1, today=datetime.date(2019, 1, 1),
+                     progress=progress)
+        # only the windows already being fetched were finished
+        self.assertLessEqual(self.rh._get.call_count, MAX_WORKERS + 1)
+
+    def test_refetches_windows_not_over(self):
+        self.rh._get.return_value.json.return_value = {'matches': []}
+        self.run_backfill(today=datetime.date(2018, 8, 15))
+        self.assertEqual(self.run_backfill(today=datetime.date(2018, 8, 15))[0], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from soccer.teamindex import TeamIndex, build_snapshot
+
+TEAMS = {"teams": [
+    {"id": "66", "league": {"id": 398, "name": "Premier League"},
+     "code": "MUFC", "name": "Manchester United FC"},
+    {"id": "57", "league": {"id": 398, "name": "Premier League"},
+     "code": "AFC", "name": "Arsenal FC"},
+    {"id": "5", "league": {"id": 394, "name": "Bundesliga"},
+     "code": "BAY", "name": "FC Bayern München"},
+    {"id": "99", "league": {"id": 394, "name": "Bundesliga"},
+     "code": "null", "name": "No code"},
+]}
+
+
+class TestTeamIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.teams_file = os.path.join(self.path, "teams.json")
+        self.snapshot_file = os.path.join(self.path, "teams.marshal")
+        with open(self.teams_file, "w") as jfile:
+            json.dump(TEAMS, jfile)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def index(self):
+        return TeamIndex(self.teams_file, self.snapshot_file)
+
+    def test_lazy(self):
+        index = self.index()
+        self.assertIsNone(index._index)
+        index.get("AFC")
+        self.assertIsNotNone(index._index)
+
+    def test_lookups(self):
+        index = self.index()
+        self.assertEqual(index["MUFC"], "66")
+        self.assertEqual(index.get("XXX"), None)
+        self.assertNotIn("null", index)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.team_by_id(5)["code"], "BAY")
+        self.assertEqual(index.leagues(), ["Bundesliga", "Premier League"])
+        self.assertEqual([team["code"] for team in index.league_teams("Premier League")],
+                         ["AFC", "MUFC"])
+
+    def test_snapshot(self):
+        build_snapshot(self.teams_file, self.snapshot_file)
+        index = self.index()
+        self.assertIsNotNone(index._load_snapshot())
+        self.assertEqual(index.team("BAY")["name"], u"FC Bayern München")
+
+    def test_stale_snapshot_ignored(self):
+        build_snapshot(self.teams_file, self.snapshot_file)
+        stale = os.path.getmtime(self.teams_file) - 10
+        os.utime(self.snapshot_file, (stale, stale))
+        self.assertIsNone(self.index()._load_snapshot())
+        self.assertEqual(self.index()["AFC"], "57")
+
+    def test_corrupt_snapshot_ignored(self):
+        with open(self.snapshot_file, "wb") as sfile:
+            sfile.write(b"not marshal")
+        self.assertEqual(self.index()["AFC"], "57")
+
+
+if __name__ == '__main__':
+    unittest.main()
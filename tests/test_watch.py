@@ -0,0 +1,71 @@
+import unittest
+
+import mock
+import requests
+
+from soccer.watch import LiveWatcher
+
+
+def game(home, away, goals_home, goals_away):
+    return {'homeTeamName': home, 'awayTeamName': away,
+            'goalsHomeTeam': goals_home, 'goalsAwayTeam': goals_away,
+            'league': 'Premier League', 'time': "10'"}
+
+
+def response(games=None, status_code=200, headers=None):
+    return mock.MagicMock(status_code=status_code, headers=headers or {},
+                          **{'json.return_value': {'games': games}})
+
+
+class TestLiveWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.rh = mock.MagicMock()
+        self.writer = mock.MagicMock()
+        self.watcher = LiveWatcher(self.rh, self.writer, min_interval=30,
+                                   max_interval=300, sleep=mock.Mock())
+
+    def rendered(self):
+        games = self.writer.live_scores.call_args[0][0]
+        return [g.home_team.name for g in games]
+
+    def test_renders_only_changed_scorelines(self):
+        self.rh.session.get.side_effect = [
+            response([game('A', 'B', 0, 0), game('C', 'D', 0, 0)]),
+            response([game('A', 'B', 1, 0), game('C', 'D', 0, 0)]),
+        ]
+        self.watcher.step()
+        self.assertEqual(self.rendered(), ['A', 'C'])
+        self.watcher.step()
+        self.assertEqual(self.rendered(), ['A'])
+
+    def test_conditional_requests(self):
+        self.rh.session.get.side_effect = [
+            response([game('A', 'B', 0, 0)], headers={'ETag': '"v1"'}),
+            response(status_code=requests.codes.not_modified),
+        ]
+        self.watcher.step()
+        self.watcher.step()
+        headers = self.rh.session.get.call_args[1]['headers']
+        self.assertEqual(headers, {'If-None-Match': '"v1"'})
+        self.assertEqual(self.writer.live_scores.call_count, 1)
+
+    @mock.patch('click.secho')
+    def test_adaptive_interval(self, mock_click):
+        self.rh.session.get.side_effect = [
+            response([]), response([]), response([game('A', 'B', 0, 0)]),
+        ]
+        self.assertEqual(self.watcher.step(), 60)
+        self.assertEqual(self.watcher.step(), 120)
+        self.assertEqual(self.watcher.step(), 30)
+
+    @mock.patch('click.secho')
+    def test_connection_error(self, mock_click):
+        self.rh.session.get.side_effect = requests.exceptions.ConnectionError()
+        self.watcher.run(polls=2)
+        self.assertEqual(self.watcher.sleep.call_count, 1)
+        self.assertFalse(self.writer.live_scores.called)
+
+
+if __name__ == '__main__':
+    unittest.main()
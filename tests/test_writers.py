@@ -0,0 +1,372 @@
+import csv
+import io
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import mock
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from soccer.exceptions import IncorrectParametersException
+from soccer import writers
+from soccer.models import Match, Player, Team, TableRow
+from soccer.writers import BaseWriter, batched, get_writer
+
+
+def match(home, away, goals_home, goals_away, status='FINISHED'):
+    return Match.from_api({'homeTeam': {'name': home}, 'awayTeam': {'name': away},
+                           'score': {'fullTime': {'homeTeam': goals_home,
+                                                  'awayTeam': goals_away}},
+                           'utcDate': '2018-08-10T19:00:00Z', 'status': status},
+                          'Premier League')
+
+
+LEAGUE_SCORES = [match(u'Manchester United FC', u'Leicester City FC', 2, 1),
+                 match(u'AFC Bournemouth', u'Cardiff City FC', 2, 0)]
+
+
+class TestStreamingWriters(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.output_file = os.path.join(self.path, 'output')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def output(self):
+        with io.open(self.output_file, encoding='utf-8') as f:
+            return f.read()
+
+    def test_json_matches_pretty_printed_document(self):
+        writer = get_writer('json', self.output_file)
+        writer.league_scores(LEAGUE_SCORES, 6, False, False)
+        expected = {'league_scores': [
+            {'league': 'Premier League', 'homeTeamName': u'Manchester United FC',
+             'goalsHomeTeam': 2, 'goalsAwayTeam': 1, 'awayTeamName': u'Leicester City FC'},
+            {'league': 'Premier League', 'homeTeamName': u'AFC Bournemouth',
+             'goalsHomeTeam': 2, 'goalsAwayTeam': 0, 'awayTeamName': u'Cardiff City FC'}],
+            'time': 6}
+        self.assertEqual(self.output(),
+                         json.dumps(expected, indent=4, separators=(',', ': '),
+                                    ensure_ascii=False) + '\n')
+
+    def test_json_empty(self):
+        writer = get_writer('json', self.output_file)
+        writer.team_players([])
+        self.assertEqual(json.loads(self.output()), {'players': []})
+
+    def test_json_consumes_generators(self):
+        writer = get_writer('json', self.output_file)
+        matches = (match('A', 'B', i, 0) for i in range(1000))
+        writer.team_scores(matches, 6, False, False)
+        self.assertEqual(len(json.loads(self.output())['team_scores']), 1000)
+
+    def test_json_lines(self):
+        writer = get_writer('jsonl', self.output_file)
+        writer.league_scores(LEAGUE_SCORES, 6, False, False)
+        lines = self.output().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])['homeTeamName'], 'AFC Bournemouth')
+
+    def test_csv(self):
+        writer = get_writer('csv', self.output_file)
+        data = LEAGUE_SCORES + [match(u'Málaga CF', u'Sevilla FC', 0, 0, 'SCHEDULED')]
+        writer.team_scores(data, 6, False, False)
+        with io.open(self.output_file, encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0][0], 'Date')
+        self.assertEqual(rows[1], ['2018-08-10', 'Manchester United FC', '2',
+                                   '1', 'Leicester City FC'])
+        self.assertEqual(len(rows), 3)
+
+    def test_csv_stdout(self):
+        stdout = io.StringIO()
+        with mock.patch('sys.stdout', stdout):
+            get_writer('csv').league_scores(LEAGUE_SCORES, 6, False, False)
+        self.assertEqual(stdout.getvalue().splitlines()[1],
+                         'Premier League,Manchester United FC,2,1,Leicester City FC')
+
+
+class ListWriter(BaseWriter):
+    """A plugin writer keeping what it is given"""
+
+    def live_scores(self, live_scores):
+        self.written = list(live_scores)
+
+    team_scores = team_players = standings = league_scores = live_scores
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        entry_point = mock.MagicMock()
+        entry_point.name = 'list'
+        entry_point.load.return_value = ListWriter
+        patcher = mock.patch.object(writers, '_plugins', {'list': entry_point})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.entry_point = entry_point
+
+    def test_plugins_are_loaded_when_used(self):
+        self.assertIn('list', writers.output_formats())
+        self.assertFalse(self.entry_point.load.called)
+        writer = get_writer('list', 'output')
+        self.assertIsInstance(writer, ListWriter)
+        self.assertEqual(writer.output_filename, 'output')
+
+    def test_unknown_format(self):
+        self.assertRaises(IncorrectParametersException, get_writer, 'xml')
+
+    def test_writers_must_implement_the_interface(self):
+        self.entry_point.load.return_value = dict
+        self.assertRaises(TypeError, get_writer, 'list')
+
+        class Partial(BaseWriter):
+            def live_scores(self, live_scores):
+                pass
+        self.entry_point.load.return_value = Partial
+        self.assertRaises(TypeError, get_writer, 'list')
+
+    def test_batched(self):
+        self.assertEqual(list(batched(iter(range(5)), 2)), [[0, 1], [2, 3], [4]])
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class TestArrowWriters(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.output_file = os.path.join(self.path, 'output')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_parquet_matches_are_typed(self):
+        import pyarrow.parquet as pq
+        data = LEAGUE_SCORES + [match(u'Málaga CF', u'Sevilla FC', None, None, 'SCHEDULED')]
+        get_writer('parquet', self.output_file).team_scores(data, 6, False, False)
+        table = pq.read_table(self.output_file)
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.schema.field('utc_date').type.tz, 'UTC')
+        self.assertEqual(table.column('home_goals').to_pylist(), [2, 2, None])
+        self.assertEqual(table.column('home_team').to_pylist()[2], u'Málaga CF')
+
+    def test_arrow_standings_and_players(self):
+        import pyarrow.ipc
+        rows = [TableRow(1, Team(57, 'Arsenal FC'), 2, 2, 0, 0, 6, 5, 1, 4)]
+        get_writer('arrow', self.output_file).standings([('PL', rows), ('BL', rows)], None)
+        table = pyarrow.ipc.open_file(self.output_file).read_all()
+        self.assertEqual(table.column('league').to_pylist(), ['PL', 'BL'])
+        self.assertEqual(table.column('points').to_pylist(), [6, 6])
+
+        players = [Player('Petr Cech', 'Goalkeeper', 1, 'Czech Republic',
+                          '1982-05-20T00:00:00Z', team=Team(57, 'Arsenal FC'))]
+        get_writer('arrow', self.output_file).team_players(players)
+        table = pyarrow.ipc.open_file(self.output_file).read_all()
+        self.assertEqual(str(table.column('date_of_birth')[0]), '1982-05-20')
+        self.assertEqual(table.column('team_id').to_pylist(), [57])
+        self.assertEqual(table.schema.field('team_id').type, pyarrow.int64())
+
+    def test_directory_is_appended_to(self):
+        import pyarrow.dataset
+        for _ in range(2):
+            get_writer('parquet', self.path).league_scores(LEAGUE_SCORES, 6, False, False)
+        dataset = pyarrow.dataset.dataset(os.path.join(self.path, 'matches'))
+        self.assertEqual(dataset.count_rows(), 4)
+
+    def test_needs_output_file(self):
+        self.assertRaises(IncorrectParametersException, get_writer, 'parquet')
+
+
+class TestSqlite(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.database = os.path.join(self.path, 'soccer.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def write(self, method, *args):
+        writer = get_writer('sqlite', self.database)
+        try:
+            getattr(writer, method)(*args)
+        finally:
+            writer.close()
+        return writer.changes
+
+    def query(self, sql):
+        conn = sqlite3.connect(self.database)
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def matches(self, home_goals):
+        matches = [match('A', 'B', home_goals, 0), match('C', 'D', 1, 1)]
+        for i, m in enumerate(matches):
+            m.id = i + 1
+        return matches
+
+    def test_only_changed_matches_are_written(self):
+        self.assertEqual(self.write('league_scores', self.matches(0), 6, False, False), 2)
+        self.assertEqual(self.write('league_scores', self.matches(0), 6, False, False), 0)
+        self.assertEqual(self.write('team_scores', self.matches(3), 6, False, False), 1)
+        self.assertEqual(self.query('SELECT id, home_goals FROM matches ORDER BY id'),
+                         [(1, 3), (2, 1)])
+
+    def test_standings_snapshots(self):
+        rows = [TableRow(1, Team(57, 'Arsenal FC'), 2, 2, 0, 0, 6, 5, 1, 4)]
+        self.assertEqual(self.write('standings', [('PL', rows)], 'PL'), 1)
+        self.assertEqual(self.write('standings', [('PL', rows)], 'PL'), 0)
+        rows[0].points = 7
+        with mock.patch('soccer.writers.sqlitewriter.utc_now',
+                        return_value='2099-01-01T00:00:00Z'):
+            self.assertEqual(self.write('standings', [('PL', rows)], 'PL'), 1)
+        self.assertEqual(self.query('SELECT points FROM standings ORDER BY retrieved_at'),
+                         [(6,), (7,)])
+
+    def test_indexes(self):
+        self.write('team_players', [Player('Petr Cech', 'Goalkeeper', 1, 'Czech Republic',
+                                           '1982-05-20')])
+        indexes = [row[0] for row in self.query("SELECT name FROM sqlite_master "
+                                                "WHERE type = 'index' AND sql IS NOT NULL")]
+        self.assertIn('matches_competition_date', indexes)
+        self.assertIn('matches_date', indexes)
+        self.assertEqual(self.query('SELECT name FROM players'), [('Petr Cech',)])
+
+    def test_squads_are_kept_per_team(self):
+        def squad(team, *names):
+            return [Player(name, 'Midfielder', 8, 'England', '1990-01-01', team=team)
+                    for name in names]
+        arsenal, chelsea = Team(57, 'Arsenal FC'), Team(61, 'Chelsea FC')
+        self.write('team_players', squad(arsenal, 'Jack Wilshere', 'Aaron Ramsey'))
+        self.write('team_players', squad(chelsea, 'Jack Wilshere'))
+        self.assertEqual(self.query('SELECT team_id, team, name FROM players '
+                                    'ORDER BY team_id, name'),
+                         [(57, 'Arsenal FC', 'Aaron Ramsey'),
+                          (57, 'Arsenal FC', 'Jack Wilshere'),
+                          (61, 'Chelsea FC', 'Jack Wilshere')])
+        self.assertEqual(self.write('team_players', squad(chelsea, 'Jack Wilshere')), 0)
+
+    def test_needs_output_file(self):
+        self.assertRaises(IncorrectParametersException, get_writer, 'sqlite')
+
+
+class TestGenerators(unittest.TestCase):
+    """Every built-in writer takes generators as well as lists"""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        live = match(u'Arsenal FC', u'Chelsea FC', 1, 0, status='IN_PLAY')
+        live.time = "45'"
+        row = TableRow(1, Team(57, 'Arsenal FC'), 2, 2, 0, 0, 6, 5, 1, 4)
+        player = Player('Petr Cech', 'Goalkeeper', 1, 'Czech Republic',
+                        '1982-05-20T00:00:00Z', 'PLAYER')
+        self.calls = [('live_scores', [live]),
+                      ('team_scores', LEAGUE_SCORES, 6, False, False),
+                      ('team_players', [player]),
+                      ('standings', [('PL', [row])], 'PL'),
+                      ('league_scores', LEAGUE_SCORES, 6, False, False)]
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def write(self, output_format, method, items, *args):
+        """Writes items with a new writer, returning what it wrote"""
+        output_file = None
+        if output_format != 'stdout':
+            output_file = os.path.join(self.path, '{0}-{1}'.format(output_format, method))
+            if os.path.exists(output_file):
+                os.remove(output_file)
+        stdout = io.StringIO()
+        writer = get_writer(output_format, output_file)
+        try:
+            with mock.patch('sys.stdout', stdout):
+                getattr(writer, method)(items, *args)
+        finally:
+            writer.close()
+        if output_format == 'sqlite':
+            return writer.changes
+        if output_format in ('parquet', 'arrow'):
+            import pyarrow.ipc
+            import pyarrow.parquet
+            if output_format == 'parquet':
+                return pyarrow.parquet.read_table(output_file).num_rows
+            return pyarrow.ipc.open_file(output_file).read_all().num_rows
+        if output_file:
+            with io.open(output_file, encoding='utf-8') as f:
+                return f.read()
+        return stdout.getvalue()
+
+    def test_generators_write_like_lists(self):
+        for output_format in writers.WRITERS:
+            if output_format in ('parquet', 'arrow') and pyarrow is None:
+                continue
+            for method, items, *args in self.calls:
+                expected = self.write(output_format, method, items, *args)
+                self.assertTrue(expected, (output_format, method))
+                self.assertEqual(self.write(output_format, method, iter(items), *args),
+                                 expected, (output_format, method))
+
+
+class TestStdout(unittest.TestCase):
+
+    def render(self, method, *args, **kwargs):
+        stdout = io.StringIO()
+        with mock.patch('sys.stdout', stdout):
+            getattr(get_writer('stdout'), method)(*args, **kwargs)
+        return stdout.getvalue()
+
+    def test_standings_leave_rows_unchanged(self):
+        row = TableRow(1, Team(57, 'Arsenal FC'), 2, 2, 0, 0, 6, 5, 1, 4)
+        output = self.render('standings', [('PL', [row])], 'PL')
+        self.assertEqual(row.goal_difference, 4)
+        self.assertIn('Arsenal FC', output)
+        self.assertIn(' 4', output)
+
+    def test_no_color_when_not_a_terminal(self):
+        output = self.render('league_scores', LEAGUE_SCORES, 6, False, False)
+        self.assertNotIn('\x1b[', output)
+        self.assertEqual(output.splitlines()[0],
+                         'Manchester United FC        2  vs  1          Leicester City FC')
+        self.assertEqual(len(output.splitlines()), 4)
+
+    def test_writes_once(self):
+        stdout = mock.MagicMock()
+        stdout.isatty.return_value = True
+        with mock.patch('sys.stdout', stdout), mock.patch('click.echo') as echo:
+            get_writer('stdout').league_scores(LEAGUE_SCORES, 6, False, False)
+        self.assertEqual(echo.call_count, 1)
+        self.assertIn('\x1b[', echo.call_args[0][0])
+
+    def test_league_scores_are_grouped_by_league(self):
+        bundesliga = Match.from_api({'homeTeam': {'name': u'FC Bayern München'},
+                                     'awayTeam': {'name': u'Hertha BSC'},
+                                     'score': {'fullTime': {'homeTeam': 3,
+                                                            'awayTeam': 1}},
+                                     'utcDate': '2018-08-10T19:30:00Z',
+                                     'status': 'FINISHED'}, 'Bundesliga')
+        # sorted by kickoff, the leagues alternate
+        output = self.render('league_scores', [LEAGUE_SCORES[0], bundesliga,
+                                               LEAGUE_SCORES[1]], 6, False, False)
+        headers = [line for line in output.splitlines() if line.startswith('=')]
+        self.assertEqual(len(headers), 2)
+        self.assertIn(' Premier League ', headers[0])
+        self.assertIn(' Bundesliga ', headers[1])
+        lines = output.splitlines()
+        self.assertTrue(lines.index(headers[0]) < lines.index(
+            'AFC Bournemouth             2  vs  0            Cardiff City FC') <
+            lines.index(headers[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()